@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_telemetry(tmp_path, monkeypatch):
+    """Keep API call telemetry out of the real home directory."""
+    monkeypatch.setattr("vibe_dojo.telemetry.TELEMETRY_PATH", tmp_path / "telemetry.jsonl")
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_cache(tmp_path, monkeypatch):
+    """Keep fetched pages out of the real home directory."""
+    monkeypatch.setattr("vibe_dojo.http_cache.HTTP_CACHE_DIR", tmp_path / "http_cache")
@@ -0,0 +1,85 @@
+"""Test the per-day activity index, streaks and heatmap."""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from vibe_dojo.activity import ActivityIndex
+from vibe_dojo.cli import app
+from vibe_dojo.trainer import count_today_logs, get_streak, mark_drill
+from vibe_dojo.writer import create_drill_note
+
+TODAY = date(2026, 3, 10)
+
+
+def write_logs(vault, days):
+    logs = vault / "02_Practice_Logs"
+    logs.mkdir(parents=True, exist_ok=True)
+    for i, day in enumerate(days):
+        (logs / f"{day.isoformat()}__drill-{i}.md").write_text("---\nresult: passed\n---\n")
+
+
+def test_streaks_and_counts():
+    """Current streak allows today to be pending; longest tracks the best run."""
+    index = ActivityIndex(None)
+    for offset in [12, 11, 10, 9, 3, 1, 1]:
+        index.add(TODAY - timedelta(days=offset))
+
+    assert index.streak(TODAY) == 1
+    assert index.count(TODAY - timedelta(days=1)) == 2
+    assert index.longest == 4
+
+    index.add(TODAY)
+    index.add(TODAY - timedelta(days=2))
+    assert index.streak(TODAY) == 4
+    assert index.streak(TODAY + timedelta(days=2)) == 0
+    # Filling the gap joins the two runs
+    for offset in [4, 5, 6, 7, 8]:
+        index.add(TODAY - timedelta(days=offset))
+    assert index.longest == 13
+    assert index.days(TODAY, 3) == [1, 2, 1]
+
+
+def test_rebuild_from_log_filenames(tmp_path):
+    today = date.today()
+    write_logs(tmp_path, [today, today, today - timedelta(days=1), today - timedelta(days=5)])
+
+    assert get_streak(tmp_path) == 2
+    assert count_today_logs(tmp_path) == 2
+    assert ActivityIndex.load(tmp_path).longest == 2
+
+
+def test_marks_update_index_without_rescanning(tmp_path):
+    drills = [create_drill_note(tmp_path, title=f"Drill {i}") for i in range(3)]
+    mark_drill(tmp_path, drills[0], "passed", rating=4)
+
+    with patch.object(ActivityIndex, "rebuild", autospec=True) as rebuild:
+        for drill in drills[1:]:
+            mark_drill(tmp_path, drill, "failed", rating=2)
+        assert count_today_logs(tmp_path) == 3
+        assert get_streak(tmp_path) == 1
+        rebuild.assert_not_called()
+
+    # Logs removed behind our back are noticed
+    next((tmp_path / "02_Practice_Logs").glob("*.md")).unlink()
+    assert count_today_logs(tmp_path) == 2
+
+
+def test_heatmap_command(tmp_path):
+    today = date.today()
+    write_logs(tmp_path, [today, today - timedelta(days=1), today - timedelta(days=40)])
+
+    result = CliRunner().invoke(app, ["heatmap", "--vault", str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert "3 drills on 3 days" in result.output
+    assert "Streak: 2 days" in result.output
+    assert "Longest: 2 days" in result.output
+
+
+def test_heatmap_rejects_zero_weeks(tmp_path):
+    result = CliRunner().invoke(app, ["heatmap", "--vault", str(tmp_path), "--weeks", "0"])
+
+    assert result.exit_code == 2
+    assert not isinstance(result.exception, ValueError)
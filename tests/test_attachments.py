@@ -0,0 +1,60 @@
+"""Tests for the content-addressed attachment store."""
+
+from vibe_dojo.attachments import migrate_attachments, read_attachment, store_attachment
+from vibe_dojo.distiller import load_source_content
+from vibe_dojo.ingestor import write_source_note
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    first = store_attachment(tmp_path, "same transcript")
+    second = store_attachment(tmp_path, "same transcript")
+
+    assert first == second
+    assert len(list(first.parent.iterdir())) == 1
+
+
+def test_gzip_roundtrip(tmp_path):
+    content = "[00:01] hello\n" * 500
+    path = store_attachment(tmp_path, content, "gzip")
+
+    assert path.name.endswith(".txt.gz")
+    assert path.stat().st_size < len(content)
+    assert read_attachment(tmp_path, path.relative_to(tmp_path).as_posix()) == content
+
+
+def test_load_source_content_reads_compressed_attachment(tmp_path):
+    (tmp_path / "config.yaml").write_text("attachments:\n  compression: gzip\n", encoding="utf-8")
+    note = write_source_note(tmp_path, "full transcript text", "manual", "manual", title="Talk")
+    source_id = note.read_text(encoding="utf-8").split("id: ", 1)[1].split("\n", 1)[0]
+
+    content, metadata = load_source_content(tmp_path, source_id)
+
+    assert metadata["transcript_path"].endswith(".txt.gz")
+    assert content == "full transcript text"
+
+
+def test_migrate_legacy_attachments(tmp_path):
+    """Old ULID-named attachments move into the store and notes are rewritten."""
+    attachments = tmp_path / "00_Inbox" / "_attachments"
+    attachments.mkdir(parents=True)
+    legacy = (("01AAA", "transcript A"), ("01BBB", "transcript A"), ("01CCC", "transcript C"))
+    for name, body in legacy:
+        (attachments / f"{name}.txt").write_text(body, encoding="utf-8")
+        (tmp_path / "00_Inbox" / f"SOURCE__{name}.md").write_text(
+            f"---\nid: {name}\ntranscript_path: 00_Inbox/_attachments/{name}.txt\n---\n\n"
+            f"*Full content in: `00_Inbox/_attachments/{name}.txt`*\n",
+            encoding="utf-8",
+        )
+
+    stats = migrate_attachments(tmp_path, "gzip")
+
+    assert stats["migrated"] == 3
+    assert stats["removed"] == 3
+    assert len(list(attachments.iterdir())) == 2
+    note = (tmp_path / "00_Inbox" / "SOURCE__01BBB.md").read_text(encoding="utf-8")
+    assert "01BBB.txt" not in note
+    content, _ = load_source_content(tmp_path, "01BBB")
+    assert content == "transcript A"
+
+    # Running again is a no-op
+    assert migrate_attachments(tmp_path, "gzip")["migrated"] == 0
@@ -0,0 +1,146 @@
+"""Test packing old practice logs into monthly files."""
+
+import shutil
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from vibe_dojo.activity import ActivityIndex
+from vibe_dojo.cli import app
+from vibe_dojo.rollups import update_practice_rollup
+from vibe_dojo.topic_counters import TopicCounters
+from vibe_dojo.trainer import (
+    compact_practice_logs,
+    create_practice_log,
+    get_streak,
+    get_topics_stats,
+    iter_practice_logs,
+    mark_drill,
+    render_dashboard,
+)
+from vibe_dojo.writer import create_drill_note
+
+
+def backdate(log_file, day):
+    """Rename a freshly written log as if it had been practiced on ``day``."""
+    target = log_file.with_name(f"{day.isoformat()}{log_file.name[10:]}")
+    log_file.rename(target)
+    return target
+
+
+def make_history(vault):
+    """Logs spread over today and three earlier months."""
+    today = date.today()
+    a = create_drill_note(vault, title="Async Basics", topics=["Python"])
+    b = create_drill_note(vault, title="Docker Layers", topics=["Docker"])
+    for i, days_ago in enumerate([200, 199, 120, 100]):
+        drill = a if i % 2 else b
+        result = "passed" if i % 2 else "failed"
+        log = create_practice_log(vault, drill, result, notes=f"note {i}", rating=i + 1)
+        backdate(log, today - timedelta(days=days_ago))
+    mark_drill(vault, a, "passed", "Fresh one", rating=5)
+
+
+def snapshot(vault):
+    counters = TopicCounters(vault)
+    counters.rebuild()
+    activity = ActivityIndex(vault)
+    activity.rebuild()
+    return list(iter_practice_logs(vault)), counters.stats(), activity.counts
+
+
+def test_compact_keeps_logs_and_stats(tmp_path):
+    make_history(tmp_path)
+    logs_path = tmp_path / "02_Practice_Logs"
+    before = snapshot(tmp_path)
+    rollup = update_practice_rollup(tmp_path)
+
+    result = compact_practice_logs(tmp_path, older_than_days=30)
+
+    assert result["logs"] == 4
+    names = sorted(p.name for p in logs_path.glob("*.md"))
+    assert len(names) == 1 + result["months"]
+    assert sum(name.endswith("__practice-logs.md") for name in names) == result["months"]
+    assert snapshot(tmp_path) == before
+    assert before[0][0]["notes"] == "note 0"
+
+    packed = next(logs_path.glob("*__practice-logs.md")).read_text(encoding="utf-8")
+    assert "[[DRILL__" in packed
+
+    # Rollups, counters and the activity index carry over without a rebuild
+    with patch("vibe_dojo.trainer.read_practice_log") as read, \
+            patch.object(TopicCounters, "rebuild") as counters_rebuild, \
+            patch.object(ActivityIndex, "rebuild") as activity_rebuild:
+        assert update_practice_rollup(tmp_path) == rollup
+        get_topics_stats(tmp_path)
+        get_streak(tmp_path)
+        read.assert_not_called()
+        counters_rebuild.assert_not_called()
+        activity_rebuild.assert_not_called()
+
+
+def test_compact_merges_into_existing_month(tmp_path):
+    """A second run appends to the month's packed file instead of replacing it."""
+    make_history(tmp_path)
+    compact_practice_logs(tmp_path, older_than_days=150)
+    compact_practice_logs(tmp_path, older_than_days=30)
+    compact_practice_logs(tmp_path, older_than_days=30)
+
+    logs = list(iter_practice_logs(tmp_path))
+    assert len(logs) == 5
+    assert [log["rating"] for log in logs] == [1, 2, 3, 4, 5]
+
+
+def test_merging_matches_single_run(tmp_path):
+    """Packing a month in two steps gives a byte-identical file to packing it at once."""
+    today = date.today()
+    month_start = (today - timedelta(days=200)).replace(day=1)
+    drill = create_drill_note(tmp_path / "once", title="Async Basics", topics=["Python"])
+    for i, day in enumerate([month_start, month_start + timedelta(days=20)]):
+        log = create_practice_log(tmp_path / "once", drill, "passed", notes=f"note {i}", rating=3)
+        backdate(log, day)
+    shutil.copytree(tmp_path / "once", tmp_path / "twice")
+
+    compact_practice_logs(tmp_path / "once", older_than_days=30)
+    # First only the early log, then the later one is merged into the same month
+    compact_practice_logs(tmp_path / "twice", older_than_days=(today - month_start).days - 10)
+    compact_practice_logs(tmp_path / "twice", older_than_days=30)
+
+    name = f"{month_start.strftime('%Y-%m')}__practice-logs.md"
+    once = (tmp_path / "once" / "02_Practice_Logs" / name).read_bytes()
+    assert (tmp_path / "twice" / "02_Practice_Logs" / name).read_bytes() == once
+    assert once.decode("utf-8").count("\n## 20") == 2
+
+
+def test_new_logs_in_packed_month_reach_rollup(tmp_path):
+    """Logs packed before the rollup first saw them are read from the packed file."""
+    make_history(tmp_path)
+    compact_practice_logs(tmp_path, older_than_days=30)
+
+    rollup = update_practice_rollup(tmp_path)
+    assert rollup["totals"]["logs"] == 5
+    assert rollup["topics"]["Docker"]["failed"] == 2
+
+
+def test_compact_logs_command(tmp_path):
+    make_history(tmp_path)
+
+    args = ["compact-logs", "--vault", str(tmp_path), "--older-than", "30"]
+    result = CliRunner().invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert "Packed 4 logs" in result.output
+
+    result = CliRunner().invoke(app, args)
+    assert "No practice logs older than 30 days" in result.output
+
+
+def test_dashboard_activity_skips_packed_files(tmp_path):
+    """The Recent Activity query lists sessions, not monthly pack files."""
+    make_history(tmp_path)
+    compact_practice_logs(tmp_path, older_than_days=30)
+
+    query = 'WHERE !endswith(file.name, "__practice-logs")'
+    assert query in render_dashboard(tmp_path)
+    packed = list((tmp_path / "02_Practice_Logs").glob("*__practice-logs.md"))
+    assert packed and all(p.stem.endswith("__practice-logs") for p in packed)
@@ -0,0 +1,105 @@
+"""Test distillation helpers that don't require the Gemini API."""
+
+from unittest.mock import patch
+
+from vibe_dojo.distiller import (
+    distill_source,
+    estimate_tokens,
+    merge_drills,
+    split_transcript,
+)
+
+
+def make_transcript(minutes: int, step: int = 10) -> str:
+    """Build a fake `[MM:SS] text` transcript."""
+    lines = []
+    for second in range(0, minutes * 60, step):
+        lines.append(f"[{second // 60:02d}:{second % 60:02d}] caption text at {second}")
+    return "\n".join(lines)
+
+
+def test_split_transcript_by_chapters():
+    """Chunks follow chapter boundaries when they don't fit together."""
+    content = make_transcript(30)
+    chapters = [
+        {"timestamp": "00:00", "title": "Intro"},
+        {"timestamp": "10:00", "title": "Setup"},
+        {"timestamp": "20:00", "title": "Deploy"},
+    ]
+    # Budget big enough for one chapter but not two
+    chapter_tokens = estimate_tokens(make_transcript(10))
+    chunks = split_transcript(content, chapters, token_budget=int(chapter_tokens * 1.5))
+
+    assert [c["title"] for c in chunks] == ["Intro", "Setup", "Deploy"]
+    assert chunks[1]["start"] == "10:00"
+    assert "\n".join(c["text"] for c in chunks) == content
+
+
+def test_split_transcript_windows_and_budget():
+    """Without chapters, windows are packed and every chunk respects the budget."""
+    content = make_transcript(60)
+    chunks = split_transcript(content, token_budget=2000, window_minutes=5)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(c["text"]) <= 2000 for c in chunks)
+    assert "\n".join(c["text"] for c in chunks) == content
+
+
+def test_merge_drills_dedups_titles():
+    """Near-identical titles collapse to the most confident drill."""
+    merged = merge_drills([
+        [{"title": "Implement OAuth Flow", "confidence_score": 3}],
+        [
+            {"title": "Implement the OAuth Flow", "confidence_score": 5},
+            {"title": "Write Unit Tests", "confidence_score": 4},
+        ],
+    ])
+
+    assert [d["title"] for d in merged] == ["Implement the OAuth Flow", "Write Unit Tests"]
+
+
+def test_distill_source_switches_to_map_reduce():
+    """Short sources use one call, long sources are chunked."""
+    with patch("vibe_dojo.distiller.distill_drills") as mock_distill:
+        mock_distill.return_value = [{"title": "Some Drill", "confidence_score": 4}]
+
+        distill_source("short text", {}, token_budget=1000)
+        assert mock_distill.call_count == 1
+
+        mock_distill.reset_mock()
+        drills = distill_source(make_transcript(60), {}, token_budget=2000)
+        assert mock_distill.call_count > 1
+        # Identical drills from every chunk are reduced to one
+        assert len(drills) == 1
+
+
+def test_stream_parser_emits_objects_as_they_close():
+    """Objects are emitted per fragment, even across split strings and fences."""
+    from vibe_dojo.distiller import DrillStreamParser
+
+    parser = DrillStreamParser()
+    assert parser.feed('```json\n[{"title": "A {tricky} \\"one\\"", "steps": ["x"') == []
+    assert parser.feed(']}, {"title": "B"}') == [
+        {"title": 'A {tricky} "one"', "steps": ["x"]},
+        {"title": "B"},
+    ]
+    assert parser.feed(', {"title": "C", "topics": ["a", "b"]}]\n```') == [
+        {"title": "C", "topics": ["a", "b"]}
+    ]
+    assert parser.finished and not parser.truncated
+
+
+def test_stream_drills_keeps_complete_drills_when_truncated():
+    """A cut-off stream yields every drill completed before the cut."""
+    from unittest.mock import MagicMock
+
+    from vibe_dojo.distiller import stream_drills
+
+    chunks = ['[{"title": "First"},', ' {"title": "Sec', 'ond"}, {"title": "Thi']
+    client = MagicMock()
+    client.models.generate_content_stream.return_value = [MagicMock(text=c) for c in chunks]
+
+    with patch("vibe_dojo.distiller.get_client", return_value=client):
+        drills = list(stream_drills("content", {}))
+
+    assert [d["title"] for d in drills] == ["First", "Second"]
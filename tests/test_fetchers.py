@@ -0,0 +1,69 @@
+"""Tests for the source fetcher registry."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from vibe_dojo.fetchers import FETCHERS, Fetcher, get_fetcher, is_url, register_fetcher
+from vibe_dojo.ingestor import create_source_note, source_kind_for
+
+
+def test_dispatch_by_domain_and_scheme(tmp_path):
+    assert get_fetcher("https://youtu.be/dQw4w9WgXcQ").name == "youtube"
+    assert get_fetcher("https://old.reddit.com/r/python/comments/1/x").name == "reddit"
+    assert get_fetcher("https://example.com/post").name == "article"
+    # "notyoutube.com" must not be taken for YouTube
+    assert get_fetcher("https://notyoutube.com/watch?v=x").name == "article"
+    assert get_fetcher((tmp_path / "doc.pdf").as_uri()).name == "pdf"
+    assert get_fetcher(tmp_path.as_uri()).name == "pdf"
+    assert get_fetcher((tmp_path / "note.md").as_uri()).name == "local"
+    assert source_kind_for("https://www.youtube.com/watch?v=dQw4w9WgXcQ") == "youtube"
+
+
+def test_is_url():
+    assert is_url("https://example.com")
+    assert is_url("file:///tmp/x.md")
+    assert not is_url("just some text")
+
+
+def test_backend_is_loaded_lazily():
+    """Selecting a fetcher imports its module; the registry itself doesn't."""
+    fetcher = Fetcher("lazy", "test", "vibe_dojo_lazy_backend:fetch")
+    assert "vibe_dojo_lazy_backend" not in sys.modules
+
+    module = type(sys)("vibe_dojo_lazy_backend")
+    module.fetch = lambda url: ("text", "lazy", {})
+    with patch.dict(sys.modules, {"vibe_dojo_lazy_backend": module}):
+        assert fetcher.fetch("https://x.test/") == ("text", "lazy", {})
+
+
+def test_register_fetcher_goes_before_catch_all():
+    custom = Fetcher(
+        "example", "example", "vibe_dojo.ingestor:fetch_article", domains=("example.org",)
+    )
+    original = list(FETCHERS)
+    try:
+        register_fetcher(custom)
+        assert FETCHERS[-1].name == "article"
+        assert get_fetcher("https://docs.example.org/page") is custom
+    finally:
+        FETCHERS[:] = original
+
+
+def test_ingest_local_markdown_file(tmp_path):
+    note_file = tmp_path / "ideas.md"
+    note_file.write_text("# Caching Patterns\n\nUse ETags.", encoding="utf-8")
+    vault = tmp_path / "vault"
+
+    note_path = create_source_note(vault, url=note_file.as_uri())
+
+    content = note_path.read_text(encoding="utf-8")
+    assert note_path.name == "SOURCE__caching-patterns.md"
+    assert "source_kind: local" in content
+    assert "fetch_method: local-file" in content
+
+
+def test_missing_local_file_fails(tmp_path):
+    with pytest.raises(ValueError, match="File not found"):
+        create_source_note(tmp_path, url=(tmp_path / "missing.md").as_uri())
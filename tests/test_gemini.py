@@ -0,0 +1,162 @@
+"""Test the shared Gemini call layer."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.genai import errors
+
+from vibe_dojo import gemini
+from vibe_dojo.gemini import (
+    CircuitBreaker,
+    CircuitOpenError,
+    TokenBucket,
+    call_with_retry,
+    stream_with_retry,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_layer(monkeypatch):
+    """Isolate limiter/breaker state and skip real sleeps."""
+    monkeypatch.setattr(gemini, "_limiter", gemini.RateLimiter(rpm=6000, tpm=10**9))
+    monkeypatch.setattr(gemini, "_breaker", CircuitBreaker(threshold=3, cooldown=30))
+    with patch("vibe_dojo.gemini.time.sleep") as sleep:
+        yield sleep
+
+
+def api_error(code: int) -> errors.APIError:
+    return errors.APIError(code, {"error": {"message": "x", "status": "x"}})
+
+
+def test_token_bucket_reports_wait():
+    """Overdrawing the bucket returns the time needed to refill."""
+    bucket = TokenBucket(rate_per_min=60)  # one token per second
+    assert bucket.reserve(60) == 0.0
+    wait = bucket.reserve(2)
+    assert 1.9 <= wait <= 2.1
+
+
+def test_retries_rate_limits_then_succeeds(fresh_layer):
+    """429s are retried with backoff and counted on the telemetry record."""
+    fn = MagicMock(side_effect=[api_error(429), api_error(503), "ok"])
+    call = {"retries": 0}
+
+    assert call_with_retry(fn, call=call) == "ok"
+    assert fn.call_count == 3
+    assert call["retries"] == 2
+    assert fresh_layer.call_count >= 2
+
+
+def test_client_errors_are_not_retried():
+    """A 400 is raised immediately and doesn't trip the breaker."""
+    fn = MagicMock(side_effect=api_error(400))
+    with pytest.raises(errors.APIError):
+        call_with_retry(fn)
+    assert fn.call_count == 1
+    assert gemini.get_breaker().failures == 0
+
+
+def test_breaker_opens_after_consecutive_failures(monkeypatch):
+    """Once open, calls fail fast without touching the API."""
+    monkeypatch.setattr(gemini, "BREAKER_MAX_WAIT_S", 0)
+    fn = MagicMock(side_effect=api_error(500))
+    with pytest.raises(errors.APIError):
+        call_with_retry(fn, max_retries=2)
+    assert gemini.get_breaker().state == "open"
+
+    fn.reset_mock()
+    with pytest.raises(CircuitOpenError):
+        call_with_retry(fn)
+    fn.assert_not_called()
+
+
+def test_open_breaker_fails_fast_with_defaults(fresh_layer):
+    """With the default settings a freshly opened breaker isn't slept through."""
+    assert gemini.BREAKER_MAX_WAIT_S < gemini.BREAKER_COOLDOWN_S
+    breaker = gemini.get_breaker()
+    for _ in range(breaker.threshold):
+        breaker.record_failure()
+
+    fn = MagicMock()
+    with pytest.raises(CircuitOpenError, match="retry in"):
+        call_with_retry(fn)
+    fn.assert_not_called()
+    fresh_layer.assert_not_called()
+
+
+def test_half_open_admits_one_trial_call():
+    """After the cooldown one caller probes; the rest are rejected until it reports back."""
+    breaker = CircuitBreaker(threshold=1, cooldown=30)
+    breaker.record_failure()
+    breaker.opened_at -= 31
+    assert breaker.state == "half-open"
+
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError, match="trial call"):
+        breaker.before_call()
+
+    # A failed trial re-opens the breaker for another cooldown
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    breaker.opened_at -= 31
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+    breaker.before_call()
+
+
+def test_stream_retries_only_before_first_chunk():
+    """A stream that fails before output is retried; later failures propagate."""
+    def failing_stream():
+        raise api_error(429)
+        yield  # pragma: no cover
+
+    streams = iter([failing_stream(), iter(["a", "b"])])
+    assert list(stream_with_retry(lambda: next(streams))) == ["a", "b"]
+
+    def broken_midway():
+        yield "a"
+        raise api_error(503)
+
+    with pytest.raises(errors.APIError):
+        list(stream_with_retry(broken_midway))
+
+
+def test_client_is_shared_per_process(monkeypatch):
+    """All callers get the same pooled client until it is reset."""
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    gemini.reset_client()
+    try:
+        client = gemini.get_client()
+        assert gemini.get_client() is client
+        assert gemini.get_async_client() is client.aio
+    finally:
+        gemini.reset_client()
+
+
+def test_client_requires_api_key(monkeypatch):
+    """A missing key is reported instead of creating a client."""
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    gemini.reset_client()
+    with pytest.raises(ValueError):
+        gemini.get_client()
+
+
+def test_async_retry_shares_policy():
+    """The async helper retries 429s like the sync one."""
+    import asyncio
+
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise api_error(429)
+        return "ok"
+
+    with patch("vibe_dojo.gemini.backoff_delay", return_value=0):
+        result = asyncio.run(gemini.acall_with_retry(flaky, max_retries=2))
+    assert result == "ok"
+    assert len(attempts) == 2
@@ -0,0 +1,79 @@
+"""Tests for the ingestor HTTP cache."""
+
+from unittest.mock import MagicMock, patch
+
+from vibe_dojo import http_cache
+from vibe_dojo.http_cache import cached_get
+
+
+def make_response(status=200, content=b"<html>hi</html>", headers=None):
+    response = MagicMock()
+    response.status_code = status
+    response.content = content
+    response.headers = headers or {}
+    response.raise_for_status.return_value = None
+    return response
+
+
+def test_fresh_cache_skips_network():
+    """A recent cached response is served without a request."""
+    session = MagicMock()
+    session.get.return_value = make_response(headers={"ETag": '"v1"'})
+
+    with patch("vibe_dojo.http_cache.get_session", return_value=session):
+        first = cached_get("https://example.com/a")
+        second = cached_get("https://example.com/a")
+
+    assert session.get.call_count == 1
+    assert not first["from_cache"]
+    assert second["from_cache"]
+    assert second["content"] == b"<html>hi</html>"
+
+
+def test_stale_cache_revalidates_with_etag():
+    """A stale entry sends If-None-Match and reuses the body on 304."""
+    session = MagicMock()
+    session.get.side_effect = [
+        make_response(headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        make_response(status=304, content=b""),
+    ]
+
+    with patch("vibe_dojo.http_cache.get_session", return_value=session):
+        cached_get("https://example.com/b")
+        result = cached_get("https://example.com/b", max_age=0)
+
+    sent_headers = session.get.call_args_list[1].kwargs["headers"]
+    assert sent_headers["If-None-Match"] == '"v1"'
+    assert sent_headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert result["revalidated"]
+    assert result["content"] == b"<html>hi</html>"
+
+
+def test_no_store_is_not_cached():
+    session = MagicMock()
+    session.get.return_value = make_response(headers={"Cache-Control": "no-store"})
+
+    with patch("vibe_dojo.http_cache.get_session", return_value=session):
+        cached_get("https://example.com/c")
+        cached_get("https://example.com/c")
+
+    assert session.get.call_count == 2
+    assert not list(http_cache.HTTP_CACHE_DIR.glob("*.json"))
+
+
+def test_fetch_reddit_content_uses_cache():
+    from vibe_dojo.ingestor import fetch_reddit_content
+
+    post = b'{"title": "T", "selftext": "Body", "author": "a", "subreddit": "s"}'
+    payload = b'[{"data": {"children": [{"data": ' + post + b'}]}}]'
+    session = MagicMock()
+    session.get.return_value = make_response(content=payload)
+
+    with patch("vibe_dojo.http_cache.get_session", return_value=session):
+        text, method, metadata = fetch_reddit_content("https://www.reddit.com/r/s/comments/1/t/")
+        fetch_reddit_content("https://www.reddit.com/r/s/comments/1/t/")
+
+    assert session.get.call_count == 1
+    assert session.get.call_args.args[0] == "https://www.reddit.com/r/s/comments/1/t.json"
+    assert text == "# T\n\nBody"
+    assert metadata["subreddit"] == "s"
@@ -0,0 +1,53 @@
+"""Tests for bulk folder import."""
+
+from vibe_dojo.importer import import_folder, iter_import_files
+
+
+def make_folder(root):
+    (root / ".obsidian").mkdir(parents=True)
+    (root / ".obsidian" / "workspace.md").write_text("internal", encoding="utf-8")
+    (root / "sub").mkdir()
+    (root / "a.md").write_text("---\ntags: [python]\n---\n# Alpha\n\nFirst note.", encoding="utf-8")
+    (root / "sub" / "b.md").write_text("Second note.", encoding="utf-8")
+    (root / "sub" / "copy.md").write_text("Second note.", encoding="utf-8")
+    (root / "empty.md").write_text("   ", encoding="utf-8")
+    (root / "image.png").write_bytes(b"\x89PNG")
+
+
+def test_iter_import_files_skips_hidden_and_other_types(tmp_path):
+    make_folder(tmp_path)
+    names = [p.relative_to(tmp_path).as_posix() for p in iter_import_files(tmp_path)]
+    assert names == ["a.md", "empty.md", "sub/b.md", "sub/copy.md"]
+
+
+def test_import_folder(tmp_path):
+    folder = tmp_path / "notes"
+    vault = tmp_path / "vault"
+    make_folder(folder)
+    progress = []
+
+    stats = import_folder(vault, folder, workers=2, batch_size=1, on_progress=progress.append)
+
+    assert stats["files"] == 4
+    assert stats["imported"] == 2
+    assert stats["duplicates"] == 1
+    assert stats["skipped"] == 1
+    assert len(progress) == 2
+
+    alpha = (vault / "00_Inbox" / "SOURCE__alpha.md").read_text(encoding="utf-8")
+    assert "source_kind: local" in alpha
+    assert "- python" in alpha
+    assert len(list((vault / "00_Inbox" / "_attachments").iterdir())) == 2
+
+
+def test_reimport_is_deduplicated(tmp_path):
+    folder = tmp_path / "notes"
+    vault = tmp_path / "vault"
+    make_folder(folder)
+
+    import_folder(vault, folder)
+    stats = import_folder(vault, folder)
+
+    assert stats["imported"] == 0
+    assert stats["duplicates"] == 3
+    assert len(list((vault / "00_Inbox").glob("SOURCE__*.md"))) == 2
@@ -2,7 +2,7 @@
 
 
 from vibe_dojo.ingestor import create_source_note, slugify
-from vibe_dojo.writer import create_drill_note
+from vibe_dojo.writer import create_drill_note, create_drill_notes
 
 
 def test_slugify():
@@ -76,3 +76,287 @@ def test_create_drill_with_defaults(tmp_path):
     content = drill_path.read_text(encoding="utf-8")
     assert "status: untried" in content
     assert "Pattern to be filled in" in content
+
+
+def test_create_drill_note_does_not_overwrite(tmp_path):
+    """A second drill with the same title gets its own file."""
+    first = create_drill_note(tmp_path, title="Same Title", drill_goal="First")
+    second = create_drill_note(tmp_path, title="Same Title", drill_goal="Second")
+
+    assert first.name == "DRILL__same-title.md"
+    assert second.name == "DRILL__same-title-2.md"
+    assert "First" in first.read_text(encoding="utf-8")
+
+
+def test_create_drill_notes_resolves_collisions_in_order(tmp_path):
+    """Batch writes reserve slugs against the vault, the archive and each other."""
+    create_drill_note(tmp_path, title="Async Basics")
+    (tmp_path / "90_Archive").mkdir()
+    (tmp_path / "90_Archive" / "DRILL__docker-layers.md").write_text("---\n---\n", encoding="utf-8")
+
+    paths = create_drill_notes(
+        tmp_path,
+        [
+            {"title": "Async Basics", "topics": ["Python"], "confidence_score": 5},
+            {"title": "Docker Layers"},
+            {"title": ""},
+            {"title": "Async Basics", "timebox_min": 20},
+        ],
+        source_id="SRC1",
+    )
+
+    assert [p.name for p in paths] == [
+        "DRILL__async-basics-2.md",
+        "DRILL__docker-layers-2.md",
+        "DRILL__async-basics-3.md",
+    ]
+    content = paths[2].read_text(encoding="utf-8")
+    assert "source_id: SRC1" in content
+    assert "timebox_min: 20" in content
+
+
+def test_create_drill_notes_reports_written_drills(tmp_path):
+    """on_drill only sees notes that are already on disk, while the stream is still running."""
+    seen = []
+
+    def on_drill(path):
+        assert path.read_text(encoding="utf-8").startswith("---")
+        seen.append(path)
+
+    def stream():
+        yield {"title": "First"}
+        assert len(seen) == 1
+        yield {"title": "Second"}
+
+    create_drill_notes(tmp_path, stream(), on_drill=on_drill)
+
+    assert [p.name for p in seen] == ["DRILL__first.md", "DRILL__second.md"]
+
+
+def test_canonicalize_url():
+    """Tracking params, www, fragments and YouTube variants collapse."""
+    from vibe_dojo.ingestor import canonicalize_url
+
+    assert canonicalize_url("https://www.Example.com/post/?utm_source=x&id=3#top") == "https://example.com/post?id=3"
+    assert canonicalize_url("https://youtu.be/dQw4w9WgXcQ?si=abc") == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    assert (
+        canonicalize_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ&feature=share")
+        == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    )
+
+
+def test_create_source_note_rejects_duplicate_url(tmp_path):
+    """A re-ingested URL is rejected even if written differently."""
+    import pytest
+
+    from vibe_dojo.ingestor import write_source_note
+
+    write_source_note(
+        tmp_path, "body", "trafilatura", "blog", url="https://example.com/a", title="A"
+    )
+
+    with pytest.raises(ValueError, match="already ingested"):
+        create_source_note(tmp_path, url="https://www.example.com/a/?utm_medium=rss")
+
+
+def test_write_source_note_keeps_same_title(tmp_path):
+    """Two sources with the same title don't overwrite each other."""
+    from vibe_dojo.ingestor import write_source_note
+
+    first = write_source_note(tmp_path, "one", "manual", "manual", title="Same")
+    second = write_source_note(tmp_path, "two", "manual", "manual", title="Same")
+
+    assert first != second
+    assert first.exists() and second.exists()
+
+
+def test_ingest_batch(tmp_path):
+    """Batch dedups up front, writes successes and reports failures."""
+    from unittest.mock import patch
+
+    from vibe_dojo.ingestor import ingest_batch, write_source_note
+
+    write_source_note(
+        tmp_path, "old", "trafilatura", "blog", url="https://example.com/old", title="Old"
+    )
+
+    def fake_fetch(url, **kwargs):
+        if "broken" in url:
+            raise ValueError("Failed to download URL")
+        return f"content of {url}", "trafilatura", {"title": url.rsplit("/", 1)[-1]}
+
+    entries = [
+        "https://example.com/one",
+        "https://www.example.com/one/",
+        "https://example.com/old?utm_source=feed",
+        "https://example.com/broken",
+        "Some manual note",
+    ]
+    seen = []
+    with patch("vibe_dojo.fetchers.Fetcher.load", return_value=fake_fetch):
+        results = ingest_batch(tmp_path, entries, max_workers=3, on_result=seen.append)
+
+    assert seen == results
+    by_status = {}
+    for r in results:
+        by_status.setdefault(r["status"], []).append(r)
+    assert len(by_status["created"]) == 2
+    assert len(by_status["skipped"]) == 2
+    assert len(by_status["failed"]) == 1
+    assert "Failed to download" in by_status["failed"][0]["reason"]
+    created = {r["path"].name for r in by_status["created"]}
+    assert "SOURCE__one.md" in created
+
+
+def test_ingest_batch_timeout(tmp_path):
+    """A stuck fetch is abandoned after the timeout."""
+    import time
+    from unittest.mock import patch
+
+    from vibe_dojo.ingestor import ingest_batch
+
+    def stuck_fetch(url, **kwargs):
+        time.sleep(2)
+
+    with patch("vibe_dojo.fetchers.Fetcher.load", return_value=stuck_fetch):
+        results = ingest_batch(tmp_path, ["https://slow.example.com/x"], timeout=0.1)
+
+    assert results[0]["status"] == "failed"
+    assert "Timed out" in results[0]["reason"]
+
+
+def test_ingest_batch_timeout_keeps_host_slot(tmp_path):
+    """An abandoned fetch still holds its per-host slot until it really finishes."""
+    import threading
+    import time
+    from unittest.mock import patch
+
+    from vibe_dojo.ingestor import ingest_batch
+
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow_fetch(url, **kwargs):
+        with lock:
+            running.append(url)
+            peak.append(len(running))
+        time.sleep(0.3)
+        with lock:
+            running.remove(url)
+        return "content", "trafilatura", {"title": url}
+
+    urls = [f"https://slow.example.com/{i}" for i in range(3)]
+    with patch("vibe_dojo.fetchers.Fetcher.load", return_value=slow_fetch):
+        ingest_batch(tmp_path, urls, max_workers=3, per_domain=1, timeout=0.1)
+        time.sleep(0.4)
+
+    assert max(peak) == 1
+
+
+def test_fetch_youtube_metadata_batch_groups_ids(monkeypatch):
+    """Metadata for many videos is fetched 50 ids per videos.list call."""
+    from unittest.mock import MagicMock, patch
+
+    from vibe_dojo import ingestor
+
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    ids = [f"vid{i:08d}" for i in range(120)]
+
+    def list_call(part, id):
+        request = MagicMock()
+        request.execute.return_value = {"items": [
+            {
+                "id": vid,
+                "snippet": {
+                    "title": vid,
+                    "description": "00:00 Intro",
+                    "publishedAt": "2024",
+                    "channelTitle": "c",
+                },
+                "contentDetails": {"duration": "PT1H5M"},
+            }
+            for vid in id.split(",")
+        ]}
+        return request
+
+    youtube = MagicMock()
+    youtube.videos.return_value.list.side_effect = list_call
+
+    with patch("vibe_dojo.ingestor.get_youtube_client", return_value=youtube), \
+         patch("vibe_dojo.ingestor._youtube_http"):
+        metadata = ingestor.fetch_youtube_metadata_batch(ids)
+
+    assert youtube.videos.return_value.list.call_count == 3
+    assert len(metadata) == 120
+    assert metadata["vid00000007"]["duration_minutes"] == 65
+    assert metadata["vid00000007"]["chapters"] == [{"timestamp": "00:00", "title": "Intro"}]
+
+
+def test_fetch_youtube_transcript_runs_requests_concurrently():
+    """Metadata and transcript overlap instead of running back to back."""
+    import time
+    from unittest.mock import patch
+
+    from vibe_dojo import ingestor
+
+    def slow_metadata(video_id):
+        time.sleep(0.3)
+        return {"title": "Video"}
+
+    def slow_transcript(video_id):
+        time.sleep(0.3)
+        return [{"start": 0, "text": "hello"}]
+
+    with patch("vibe_dojo.ingestor.fetch_youtube_metadata_official", side_effect=slow_metadata), \
+         patch("vibe_dojo.ingestor.fetch_youtube_transcript_entries", side_effect=slow_transcript):
+        started = time.monotonic()
+        lines, _, metadata = ingestor.fetch_youtube_transcript("https://youtu.be/dQw4w9WgXcQ")
+        elapsed = time.monotonic() - started
+
+    assert "".join(lines) == "[00:00] hello"
+    assert metadata == {"title": "Video", "video_id": "dQw4w9WgXcQ"}
+    assert elapsed < 0.55
+
+
+def test_fetch_youtube_transcript_tolerates_slow_metadata():
+    """Metadata that misses the deadline is dropped, the transcript kept."""
+    import time
+    from unittest.mock import patch
+
+    from vibe_dojo import ingestor
+
+    def stuck_metadata(video_id):
+        time.sleep(1)
+        return {}
+
+    entries = [{"start": 0, "text": "hi"}]
+    with patch("vibe_dojo.ingestor.fetch_youtube_metadata_official", side_effect=stuck_metadata), \
+         patch("vibe_dojo.ingestor.fetch_youtube_transcript_entries", return_value=entries):
+        lines, _, metadata = ingestor.fetch_youtube_transcript(
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ", deadline=0.2
+        )
+
+    assert "".join(lines) == "[00:00] hi"
+    assert metadata == {"video_id": "dQw4w9WgXcQ"}
+
+
+def test_write_source_note_streams_transcript(tmp_path):
+    """Transcript lines are streamed to the attachment with a preview and counts."""
+    from vibe_dojo.ingestor import iter_transcript_lines, write_source_note
+
+    entries = [{"start": i * 5, "text": f"line {i}"} for i in range(200)]
+    expected = "\n".join(f"[{i * 5 // 60:02d}:{i * 5 % 60:02d}] line {i}" for i in range(200))
+
+    note = write_source_note(
+        tmp_path, iter_transcript_lines(entries), "youtube-transcript-api", "youtube",
+        url="https://www.youtube.com/watch?v=dQw4w9WgXcQ", title="Talk",
+    )
+
+    text = note.read_text(encoding="utf-8")
+    attachments = list((tmp_path / "00_Inbox" / "_attachments").glob("*.txt"))
+    assert len(attachments) == 1
+    assert attachments[0].read_text(encoding="utf-8") == expected
+    assert f"content_chars: {len(expected)}" in text
+    assert f"content_tokens: {len(expected) // 4}" in text
+    assert expected[:300] + "..." in text
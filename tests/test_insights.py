@@ -0,0 +1,90 @@
+"""Test practice rollups and the cached insights briefing."""
+
+from unittest.mock import MagicMock, patch
+
+from vibe_dojo.distiller import analyze_insights
+from vibe_dojo.rollups import format_rollup, update_practice_rollup
+from vibe_dojo.trainer import mark_drill
+from vibe_dojo.writer import create_drill_note
+
+
+def setup_vault(tmp_path):
+    (tmp_path / "01_Drills").mkdir()
+    (tmp_path / "02_Practice_Logs").mkdir()
+    (tmp_path / "10_Mastery").mkdir()
+    return tmp_path
+
+
+def test_rollup_counts_and_streaks(tmp_path):
+    """Per-topic counts, failure streaks and reflections are rolled up."""
+    vault = setup_vault(tmp_path)
+    a = create_drill_note(vault, title="Async Basics", topics=["Python"])
+    b = create_drill_note(vault, title="Docker Layers", topics=["Docker"])
+
+    mark_drill(vault, a, "passed", "Finally clicked")
+    mark_drill(vault, b, "failed")
+
+    rollup = update_practice_rollup(vault)
+    assert rollup["totals"] == {"logs": 2, "passed": 1, "failed": 1}
+    assert rollup["topics"]["Python"]["passed"] == 1
+    assert rollup["topics"]["Docker"]["fail_streak"] == 1
+    assert rollup["reflections"][0]["notes"] == "Finally clicked"
+
+    text = format_rollup(rollup, ["async-basics"])
+    assert "Python: 1 passed / 0 failed" in text
+    assert "Finally clicked" in text
+
+
+def test_rollup_only_reads_new_logs(tmp_path):
+    """A second run reads nothing unless new logs appeared."""
+    vault = setup_vault(tmp_path)
+    drill = create_drill_note(vault, title="Async Basics", topics=["Python"])
+    mark_drill(vault, drill, "failed")
+    update_practice_rollup(vault)
+
+    with patch("vibe_dojo.trainer.read_practice_log") as mock_read:
+        rollup = update_practice_rollup(vault)
+        mock_read.assert_not_called()
+    assert rollup["totals"]["logs"] == 1
+
+
+def test_insights_cached_until_vault_changes(tmp_path):
+    """Repeated runs reuse the briefing; new practice invalidates it."""
+    vault = setup_vault(tmp_path)
+    drill = create_drill_note(vault, title="Async Basics", topics=["Python"])
+    mark_drill(vault, drill, "passed")
+
+    client = MagicMock()
+    client.models.generate_content.return_value = MagicMock(text="Great work!")
+    with patch("vibe_dojo.distiller.get_client", return_value=client):
+        assert analyze_insights(vault) == "Great work!"
+        assert analyze_insights(vault) == "Great work!"
+        assert client.models.generate_content.call_count == 1
+
+        (vault / "02_Practice_Logs" / "2020-01-01__old.md").write_text(
+            "---\ndrill_id: x\ndrill_title: old\nresult: failed\n---\n", encoding="utf-8"
+        )
+        analyze_insights(vault)
+        assert client.models.generate_content.call_count == 2
+
+
+def test_rewritten_log_is_reprocessed(tmp_path):
+    """Practising a drill twice in a day rewrites its log; rollup and briefing follow."""
+    vault = setup_vault(tmp_path)
+    drill = create_drill_note(vault, title="Async Basics", topics=["Python"])
+    mark_drill(vault, drill, "failed")
+
+    client = MagicMock()
+    client.models.generate_content.return_value = MagicMock(text="Keep going!")
+    with patch("vibe_dojo.distiller.get_client", return_value=client):
+        analyze_insights(vault)
+        assert update_practice_rollup(vault)["totals"] == {"logs": 1, "passed": 0, "failed": 1}
+
+        mark_drill(vault, drill, "passed", "Second try worked")
+        assert len(list((vault / "02_Practice_Logs").glob("*.md"))) == 1
+
+        rollup = update_practice_rollup(vault)
+        assert rollup["totals"] == {"logs": 1, "passed": 1, "failed": 0}
+        assert rollup["topics"]["Python"]["fail_streak"] == 0
+        analyze_insights(vault)
+        assert client.models.generate_content.call_count == 2
@@ -0,0 +1,77 @@
+"""Tests for near-duplicate source detection."""
+
+import random
+
+import pytest
+
+from vibe_dojo.ingestor import DuplicateSourceError, write_source_note
+from vibe_dojo.neardup import INDEX_FILE_NAME, NearDuplicateIndex, SimHasher, hamming, simhash
+
+
+def make_text(seed, words=600):
+    rng = random.Random(seed)
+    vocab = [f"w{''.join(rng.choice('abcdefgh') for _ in range(5))}" for _ in range(400)]
+    return " ".join(rng.choice(vocab) for _ in range(words))
+
+
+def set_policy(vault, policy):
+    (vault / "config.yaml").write_text(f"ingest:\n  near_duplicate: {policy}\n", encoding="utf-8")
+
+
+def test_simhash_distances():
+    text = make_text(1)
+    edited = "A short intro was added. " + text.replace(text[:80], "", 1)
+    assert hamming(simhash(text), simhash(edited)) <= 3
+    assert hamming(simhash(text), simhash(make_text(2))) > 10
+    # Too short to trust
+    assert simhash("just a few words") is None
+
+
+def test_streamed_chunks_match_whole_text():
+    text = make_text(3)
+    hasher = SimHasher()
+    # Split mid-word on purpose
+    for i in range(0, len(text), 37):
+        hasher.update(text[i:i + 37])
+    assert hasher.digest() == simhash(text)
+
+
+def test_timestamps_are_ignored():
+    lines = make_text(4).split()
+    a = "\n".join(f"[00:{i % 60:02d}] {w}" for i, w in enumerate(lines))
+    b = "\n".join(f"[01:{(i + 7) % 60:02d}] {w}" for i, w in enumerate(lines))
+    assert simhash(a) == simhash(b)
+
+
+def test_warn_policy_marks_note(tmp_path):
+    text = make_text(5)
+    first = write_source_note(tmp_path, text, "manual", "manual", title="Original")
+    second = write_source_note(tmp_path, "Reposted: " + text, "manual", "manual", title="Mirror")
+
+    assert f"near_duplicate_of: {first.name}" in second.read_text(encoding="utf-8")
+    assert (tmp_path / ".dojo_cache" / INDEX_FILE_NAME).exists()
+
+
+def test_skip_policy_rejects_before_note_is_written(tmp_path):
+    set_policy(tmp_path, "skip")
+    text = make_text(6)
+    write_source_note(tmp_path, text, "manual", "manual", title="Original")
+
+    with pytest.raises(DuplicateSourceError):
+        write_source_note(tmp_path, text + " extra", "manual", "manual", title="Mirror")
+
+    assert not (tmp_path / "00_Inbox" / "SOURCE__mirror.md").exists()
+    assert len(list((tmp_path / "00_Inbox" / "_attachments").iterdir())) == 1
+
+
+def test_index_backfills_existing_sources(tmp_path):
+    set_policy(tmp_path, "off")
+    note = write_source_note(tmp_path, make_text(7), "manual", "manual", title="Old")
+    assert not (tmp_path / ".dojo_cache" / INDEX_FILE_NAME).exists()
+
+    index = NearDuplicateIndex.load(tmp_path)
+
+    match = index.find(simhash(make_text(7)))
+    assert match["note"] == note.name
+    assert match["distance"] == 0
+    assert index.find(simhash(make_text(8))) is None
@@ -0,0 +1,84 @@
+"""Test the in-memory practice session engine."""
+
+from unittest.mock import patch
+
+from rich.console import Console
+
+from vibe_dojo.practice import PracticeSession
+from vibe_dojo.trainer import get_upcoming_drills, mark_drill, parse_frontmatter
+from vibe_dojo.writer import create_drill_note
+
+
+def make_session(vault):
+    return PracticeSession(vault, Console(width=80, record=True))
+
+
+def test_upcoming_matches_trainer(tmp_path):
+    """The in-memory queue orders drills like get_upcoming_drills."""
+    for title in ["Beta", "Alpha", "Gamma"]:
+        create_drill_note(tmp_path, title=title, topics=["Python"])
+
+    with make_session(tmp_path) as session:
+        assert [d["path"] for d in session.upcoming(15)] == [
+            d["path"] for d in get_upcoming_drills(tmp_path, count=15)
+        ]
+
+
+def test_prepared_drill_is_rendered_in_background(tmp_path):
+    """Prefetched drills come back parsed and rendered with topic progress."""
+    drill = create_drill_note(tmp_path, title="Async Basics", topics=["Python"])
+    create_drill_note(tmp_path, title="Await Basics", topics=["Python"])
+
+    with make_session(tmp_path) as session:
+        session.prefetch(drill)
+        prepared = session.prepared(drill)
+
+        console = Console(width=80, record=True)
+        console.print(prepared.context)
+        console.print(prepared.body)
+        text = console.export_text()
+        assert "Python: 0/2 mastered" in text
+        assert "Async Basics" in text
+        assert prepared.frontmatter["status"] == "untried"
+
+
+def test_record_updates_queue_and_counters_incrementally(tmp_path):
+    """After a mark only that drill is re-read and the next one is prefetched."""
+    first = create_drill_note(tmp_path, title="A Drill", topics=["Python"])
+    second = create_drill_note(tmp_path, title="B Drill", topics=["Python"])
+
+    with make_session(tmp_path) as session:
+        mark_drill(tmp_path, first, "passed")
+        with patch("vibe_dojo.practice.parse_frontmatter", wraps=parse_frontmatter) as parse:
+            session.record(first, refresh_dashboard=False)
+            session.prepared(second)
+
+        assert session.topic_progress({"topics": ["Python"]}) == (1, 2)
+        assert session.upcoming(1)[0]["path"] == second
+        # One re-read for the marked drill, one for rendering the next
+        assert parse.call_count == 2
+
+
+def test_record_drops_archived_drills(tmp_path):
+    drill = create_drill_note(tmp_path, title="Stale Drill", topics=["Python"])
+
+    with make_session(tmp_path) as session:
+        mark_drill(tmp_path, drill, "outdated")
+        session.record(drill)
+
+        assert session.upcoming() == []
+        assert session.topic_progress({"topics": ["Python"]}) is None
+    assert (tmp_path / "_Dashboard.md").exists()
+
+
+def test_session_refreshes_dashboard_once(tmp_path):
+    """Marks in a session are coalesced into one dashboard update on close."""
+    drills = [create_drill_note(tmp_path, title=f"Drill {i}") for i in range(3)]
+
+    with patch("vibe_dojo.trainer.update_obsidian_dashboard") as update:
+        with make_session(tmp_path) as session:
+            for drill in drills:
+                mark_drill(tmp_path, drill, "passed", rating=4)
+                session.record(drill)
+            update.assert_not_called()
+    update.assert_called_once_with(tmp_path)
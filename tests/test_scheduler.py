@@ -0,0 +1,160 @@
+"""Test SRS schedulers and the review-load forecast."""
+
+from datetime import date, timedelta
+
+import numpy as np
+from typer.testing import CliRunner
+
+from vibe_dojo.cli import app
+from vibe_dojo.scheduler import (
+    AGAIN,
+    GOOD,
+    FSRSScheduler,
+    LadderScheduler,
+    SM2Scheduler,
+    compute_review_update,
+    forecast_load,
+    get_scheduler,
+    load_review_states,
+)
+from vibe_dojo.trainer import mark_drill, parse_frontmatter, update_frontmatter
+from vibe_dojo.writer import create_drill_note
+
+TODAY = date(2026, 3, 1)
+
+
+def test_ladder_matches_original_intervals():
+    """The ladder scheduler keeps the old 7/21/60/90 day steps."""
+    scheduler = LadderScheduler()
+    intervals = []
+    frontmatter = {}
+    for _ in range(5):
+        frontmatter.update(compute_review_update(scheduler, frontmatter, "passed", today=TODAY))
+        intervals.append((date.fromisoformat(frontmatter["next_review"]) - TODAY).days)
+
+    assert intervals == [7, 21, 60, 90, 90]
+    assert frontmatter["review_count"] == 5
+
+
+def test_sm2_grows_intervals_and_resets_on_failure():
+    """SM-2 goes 1, 6, then multiplies by ease; a failure drops back to 1 day."""
+    scheduler = SM2Scheduler()
+    frontmatter = {}
+    intervals = []
+    for result in ["passed", "passed", "passed", "failed", "passed"]:
+        update = compute_review_update(scheduler, frontmatter, result, effort=3, today=TODAY)
+        frontmatter.update(update)
+        intervals.append(frontmatter["stability"])
+
+    assert intervals == [1.0, 6.0, 15.0, 1.0, 6.0]
+    assert frontmatter["ease"] < 2.5
+
+
+def test_fsrs_effort_and_failure():
+    """Easier grades schedule further out; a failure comes back tomorrow for a new drill."""
+    scheduler = FSRSScheduler()
+    hard = compute_review_update(scheduler, {}, "passed", effort=1, today=TODAY)
+    easy = compute_review_update(scheduler, {}, "passed", effort=5, today=TODAY)
+    failed = compute_review_update(scheduler, {}, "failed", today=TODAY)
+
+    assert hard["next_review"] < easy["next_review"]
+    assert failed["next_review"] == (TODAY + timedelta(days=1)).isoformat()
+    assert failed["review_count"] == 0
+    assert 1 <= easy["difficulty"] < hard["difficulty"] <= 10
+
+    # A successful review on time grows stability
+    later = TODAY + timedelta(days=int(easy["stability"]))
+    again = compute_review_update(scheduler, easy, "passed", effort=3, today=later)
+    assert again["stability"] > easy["stability"]
+
+
+def test_review_is_vectorized():
+    """One call schedules many drills, matching the one-at-a-time result."""
+    scheduler = FSRSScheduler()
+    state = {"stability": np.array([0.0, 3.0, 40.0]), "difficulty": np.array([0.0, 5.0, 7.0])}
+    grades = np.array([GOOD, AGAIN, GOOD])
+    _, intervals = scheduler.review(state, grades, np.array([0, 3, 40]))
+
+    for i in range(3):
+        single = {key: value[i] for key, value in state.items()}
+        _, interval = scheduler.review(single, grades[i], [0, 3, 40][i])
+        assert interval == intervals[i]
+
+
+def test_mark_drill_stores_scheduler_state(tmp_path):
+    """Marking a drill writes stability/difficulty into its frontmatter."""
+    (tmp_path / "config.yaml").write_text("scheduler:\n  algorithm: fsrs\n")
+    drill = create_drill_note(tmp_path, title="Scheduled Drill")
+
+    mark_drill(tmp_path, drill, "passed", rating=4, effort=5)
+
+    frontmatter, _ = parse_frontmatter(drill.read_text(encoding="utf-8"))
+    assert frontmatter["stability"] > 0
+    assert frontmatter["difficulty"] > 0
+    assert str(frontmatter["last_review"]) == date.today().isoformat()
+
+
+def test_ladder_is_the_default(tmp_path):
+    """Existing vaults keep the fixed ladder unless they opt into sm2/fsrs."""
+    assert isinstance(get_scheduler(tmp_path), LadderScheduler)
+
+
+def test_effort_is_logged_apart_from_rating(tmp_path):
+    """The quality rating and the effort grade go into separate log fields."""
+    (tmp_path / "config.yaml").write_text("scheduler:\n  algorithm: fsrs\n")
+    hard = create_drill_note(tmp_path, title="Hard One")
+    easy = create_drill_note(tmp_path, title="Easy One")
+
+    mark_drill(tmp_path, hard, "passed", rating=5, effort=1)
+    mark_drill(tmp_path, easy, "passed", rating=5, effort=5)
+
+    log = next((tmp_path / "02_Practice_Logs").glob("*hard-one.md"))
+    log_fm, _ = parse_frontmatter(log.read_text(encoding="utf-8"))
+    assert (log_fm["rating"], log_fm["effort"]) == (5, 1)
+    hard_fm, _ = parse_frontmatter(hard.read_text(encoding="utf-8"))
+    easy_fm, _ = parse_frontmatter(easy.read_text(encoding="utf-8"))
+    assert hard_fm["next_review"] < easy_fm["next_review"]
+
+
+def test_get_scheduler_reads_config(tmp_path):
+    (tmp_path / "config.yaml").write_text("scheduler:\n  algorithm: sm2\n  retention: 0.85\n")
+
+    scheduler = get_scheduler(tmp_path)
+    assert isinstance(scheduler, SM2Scheduler)
+    assert scheduler.retention == 0.85
+
+
+def test_forecast_counts_every_review(tmp_path):
+    """Overdue drills land on day 0 and each drill recurs along its ladder."""
+    for title in ["A", "B"]:
+        drill = create_drill_note(tmp_path, title=title)
+    update_frontmatter(drill, {"next_review": (date.today() - timedelta(days=3)).isoformat()})
+
+    scheduler = LadderScheduler(retention=1.0)
+    states = load_review_states(tmp_path, scheduler)
+    load = forecast_load(states, scheduler, days=100)
+
+    assert list(states["due"]) == [0, -3]
+    assert load[0] == 2
+    assert load[7] == 2 and load[28] == 2 and load[88] == 2
+    assert load.sum() == 8
+
+
+def test_forecast_command(tmp_path):
+    for i in range(3):
+        create_drill_note(tmp_path, title=f"Drill {i}")
+
+    result = CliRunner().invoke(app, ["forecast", "--vault", str(tmp_path), "--days", "60"])
+
+    assert result.exit_code == 0, result.output
+    assert "Expected reviews per day" in result.output
+    assert "95th percentile" in result.output
+
+
+def test_forecast_rejects_zero_days(tmp_path):
+    create_drill_note(tmp_path, title="Drill")
+
+    result = CliRunner().invoke(app, ["forecast", "--vault", str(tmp_path), "--days", "0"])
+
+    assert result.exit_code == 2
+    assert not isinstance(result.exception, ValueError)
@@ -0,0 +1,48 @@
+"""Test the in-memory scheduler simulation."""
+
+from datetime import date
+
+from vibe_dojo.scheduler import FSRSScheduler, LadderScheduler
+from vibe_dojo.simulate import simulate
+from vibe_dojo.trainer import select_next
+
+
+def test_select_next_priority_and_due():
+    """Untried beats failed beats passed; drills not yet due are ignored."""
+    today = date(2026, 3, 1)
+    drills = {
+        "b": {"status": "passed", "next_review": "2026-02-01"},
+        "a": {"status": "failed", "next_review": "2026-03-01"},
+        "c": {"status": "untried", "next_review": "2026-03-05"},
+        "d": {"status": "untried"},
+    }
+
+    assert select_next(drills.items(), today) == "d"
+    del drills["d"]
+    assert select_next(drills.items(), today) == "a"
+    assert select_next([], today) is None
+
+
+def test_simulate_is_repeatable(tmp_path, monkeypatch):
+    """Same seed, same outcome, and nothing is written to disk."""
+    monkeypatch.chdir(tmp_path)
+    first = simulate(FSRSScheduler(), drills=40, days=120, per_day=4, seed=7)
+    second = simulate(FSRSScheduler(), drills=40, days=120, per_day=4, seed=7)
+
+    assert first["passed"] == second["passed"]
+    assert first["queue"] == second["queue"]
+    assert first["decisions"] == sum(first["practiced"]) == first["passed"] + first["failed"]
+    assert max(first["practiced"]) <= 4
+    assert len(first["retention"]) == 120
+    assert all(0 <= r <= 1 for r in first["retention"] if r is not None)
+    assert first["decisions_per_sec"] > 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_simulate_compares_schedulers():
+    """With a loose daily cap every scheduler clears its queue, at its own review cost."""
+    ladder = simulate(LadderScheduler(), drills=20, days=400, per_day=20, seed=1)
+    fsrs = simulate(FSRSScheduler(), drills=20, days=400, per_day=20, seed=1)
+
+    assert ladder["queue"][-1] == 0 and fsrs["queue"][-1] == 0
+    assert ladder["decisions"] != fsrs["decisions"]
@@ -0,0 +1,75 @@
+"""Test the API call telemetry ledger."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from vibe_dojo import telemetry
+from vibe_dojo.telemetry import load_records, paused, percentile, summarize, tag, track_call
+
+
+def test_track_call_records_usage_and_tags():
+    """Calls are appended with token counts, latency and context tags."""
+    response = MagicMock()
+    response.usage_metadata.prompt_token_count = 1200
+    response.usage_metadata.candidates_token_count = 300
+
+    with tag(source="SRC1"):
+        with track_call("distill", "gemini-2.5-flash", input_chars=4800) as call:
+            telemetry.record_usage(call, response)
+
+    records = load_records()
+    assert len(records) == 1
+    record = records[0]
+    assert record["op"] == "distill"
+    assert record["source"] == "SRC1"
+    assert record["prompt_tokens"] == 1200
+    assert record["output_tokens"] == 300
+    assert record["outcome"] == "ok"
+    assert record["latency_ms"] >= 0
+
+
+def test_streaming_latency_excludes_consumer_time():
+    """Time the consumer spends between streamed items isn't counted."""
+    def stream():
+        with track_call("distill", "gemini-2.5-flash") as call:
+            for item in range(3):
+                with paused(call):
+                    yield item
+
+    for _ in stream():
+        time.sleep(0.05)
+
+    assert load_records()[0]["latency_ms"] < 50
+
+
+def test_track_call_records_errors():
+    """Failed calls are recorded and the exception propagates."""
+    with pytest.raises(RuntimeError):
+        with track_call("embed", "models/text-embedding-004"):
+            raise RuntimeError("boom")
+
+    record = load_records()[0]
+    assert record["outcome"] == "error"
+    assert record["error"] == "RuntimeError"
+
+
+def test_summarize_percentiles_and_days():
+    """Summaries group by model, day and source."""
+    records = [
+        {"ts": "2026-01-01T10:00:00", "op": "distill", "model": "gemini-2.5-flash",
+         "latency_ms": ms, "prompt_tokens": 1000, "output_tokens": 100, "source": "A"}
+        for ms in (100, 200, 300, 400)
+    ] + [{"ts": "2026-01-02T10:00:00", "op": "embed", "model": "x", "latency_ms": 50,
+          "outcome": "error"}]
+
+    summary = summarize(records)
+    distill = summary["by_model"][("distill", "gemini-2.5-flash")]
+    assert distill["calls"] == 4
+    assert distill["p50_ms"] == 200
+    assert distill["p95_ms"] == 400
+    assert distill["cost"] > 0
+    assert summary["by_day"]["2026-01-02"]["errors"] == 1
+    assert summary["by_source"]["A"]["prompt_tokens"] == 4000
+    assert percentile([], 50) == 0.0
@@ -0,0 +1,76 @@
+"""Test the incremental per-topic counters."""
+
+from unittest.mock import patch
+
+from vibe_dojo import vault_io
+from vibe_dojo.topic_counters import TopicCounters
+from vibe_dojo.trainer import get_topics_stats, mark_drill, promote_to_mastery
+from vibe_dojo.writer import create_drill_note, create_drill_notes
+
+
+def rebuilt(vault):
+    counters = TopicCounters(vault)
+    counters.rebuild()
+    return counters.stats()
+
+
+def test_counters_follow_writes_without_rescanning(tmp_path):
+    """Creating, marking, promoting and archiving keep the counters exact."""
+    get_topics_stats(tmp_path)  # initial (empty) build
+
+    rebuild_patch = patch.object(
+        TopicCounters, "rebuild", wraps=TopicCounters.rebuild, autospec=True
+    )
+    with rebuild_patch as rebuild:
+        a = create_drill_note(tmp_path, title="Async", topics=["Python"])
+        b = create_drill_note(tmp_path, title="Layers", topics=["Docker", "Python"])
+        create_drill_notes(tmp_path, [{"title": "Compose", "topics": ["Docker"]}])
+
+        mark_drill(tmp_path, a, "passed", rating=4)
+        promote_to_mastery(tmp_path, a)
+        mark_drill(tmp_path, b, "failed", rating=2)
+        mark_drill(tmp_path, b, "outdated")
+
+        stats = get_topics_stats(tmp_path)
+        assert rebuild.call_count == 0
+
+    python = next(t for t in stats if t["name"] == "Python")
+    summary = (python["total"], python["passed"], python["mastery"], python["avg_rating"])
+    assert summary == (1, 1, 1, 4.0)
+    assert python["last_practiced"] is not None
+    docker = next(t for t in stats if t["name"] == "Docker")
+    assert (docker["total"], docker["passed"], docker["avg_rating"]) == (1, 0, 0)
+    assert stats == rebuilt(tmp_path)
+
+
+def test_outside_edit_triggers_rebuild(tmp_path):
+    """A note added behind the counters' back is picked up on the next load."""
+    create_drill_note(tmp_path, title="Async", topics=["Python"])
+    (tmp_path / "01_Drills" / "DRILL__manual.md").write_text(
+        "---\nid: manual\nstatus: passed\ntopics: [Python]\n---\n# Manual\n", encoding="utf-8"
+    )
+
+    assert TopicCounters.load(tmp_path).progress("Python") == (1, 2)
+
+
+def test_in_place_edit_triggers_rebuild(tmp_path):
+    """A status changed inside an existing note (as Obsidian saves) is picked up."""
+    drill = create_drill_note(tmp_path, title="Async", topics=["Python"])
+    assert TopicCounters.load(tmp_path).progress("Python") == (0, 1)
+
+    content = drill.read_text(encoding="utf-8")
+    drill.write_text(content.replace("status: untried", "status: passed"), encoding="utf-8")
+
+    assert TopicCounters.load(tmp_path).progress("Python") == (1, 1)
+
+
+def test_batched_writes_save_after_commit(tmp_path):
+    """Inside a write-behind block the counters are shared and saved once the notes land."""
+    with vault_io.write_behind():
+        drill = create_drill_note(tmp_path, title="Queued", topics=["Rust"])
+        mark_drill(tmp_path, drill, "passed", rating=5)
+        assert TopicCounters.load(tmp_path).progress("Rust") == (1, 1)
+
+    with patch.object(TopicCounters, "rebuild") as rebuild:
+        assert TopicCounters.load(tmp_path).progress("Rust") == (1, 1)
+        rebuild.assert_not_called()
@@ -1,14 +1,17 @@
 """Test trainer loop functionality."""
 
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from vibe_dojo.trainer import (
     create_practice_log,
     get_next_drill,
     mark_drill,
     parse_frontmatter,
+    patch_frontmatter,
     promote_to_mastery,
     update_frontmatter,
+    update_obsidian_dashboard,
 )
 from vibe_dojo.writer import create_drill_note
 
@@ -118,7 +121,7 @@ def test_mark_drill_failed(tmp_path):
 
     assert frontmatter["status"] == "failed"
     # Should be due tomorrow
-    next_review = datetime.fromisoformat(frontmatter["next_review"]).date()
+    next_review = datetime.fromisoformat(str(frontmatter["next_review"])).date()
     expected = (datetime.now() + timedelta(days=1)).date()
     assert next_review == expected
 
@@ -163,3 +166,87 @@ def test_promote_to_mastery(tmp_path):
     assert "type: mastery" in content
     assert "Pattern 1" in content
     assert "testing" in content
+
+
+def test_patch_frontmatter_only_touches_changed_lines():
+    """Patching keeps key order, list formatting and the body untouched."""
+    content = """---
+id: d1
+status: untried
+topics:
+  - python
+  - testing
+review_count: 0
+---
+
+# Title
+
+Body text.
+"""
+    updates = {"status": "passed", "topics": ["python"], "next_review": "2026-01-01"}
+    patched = patch_frontmatter(content, updates)
+
+    assert patched.splitlines()[1:3] == ["id: d1", "status: passed"]
+    assert "topics: [python]\nreview_count: 0\n" in patched
+    assert patched.endswith("next_review: 2026-01-01\n---\n\n# Title\n\nBody text.\n")
+    frontmatter, body = parse_frontmatter(patched)
+    assert frontmatter["topics"] == ["python"]
+    assert body == parse_frontmatter(content)[1]
+
+
+def test_patched_dates_match_template(tmp_path):
+    """Re-writing a drill's own dates leaves the file byte for byte unchanged."""
+    drill_path = create_drill_note(tmp_path, title="Dated Drill")
+    content = drill_path.read_text(encoding="utf-8")
+    frontmatter, _ = parse_frontmatter(content)
+
+    updates = {"next_review": frontmatter["next_review"].isoformat()}
+    assert patch_frontmatter(content, updates) == content
+
+
+def test_mark_drill_keeps_body_bytes(tmp_path):
+    """Marking a drill rewrites only its header lines."""
+    (tmp_path / "01_Drills").mkdir(parents=True)
+    drill_path = create_drill_note(tmp_path, title="Stable Drill", topics=["python"])
+    before = drill_path.read_text(encoding="utf-8")
+
+    mark_drill(tmp_path, drill_path, "passed")
+
+    after = drill_path.read_text(encoding="utf-8")
+    assert after.split("\n---\n", 1)[1] == before.split("\n---\n", 1)[1]
+    assert "topics: ['python']" in after
+    assert "status: passed" in after and "review_count: 1" in after
+
+
+def test_dashboard_skips_unchanged_rewrites(tmp_path):
+    """The note is only rewritten when its inputs and rendered content change."""
+    drill = create_drill_note(tmp_path, title="Dash Drill")
+    dashboard = update_obsidian_dashboard(tmp_path)
+    written = dashboard.stat().st_mtime_ns
+
+    with patch("vibe_dojo.trainer.render_dashboard") as render:
+        update_obsidian_dashboard(tmp_path)
+        render.assert_not_called()
+
+    # A folder change triggers a re-render, but identical content isn't written
+    (tmp_path / "01_Drills" / "notes.txt").write_text("x")
+    with patch("vibe_dojo.trainer.vault_io.write_text") as write:
+        update_obsidian_dashboard(tmp_path)
+        write.assert_not_called()
+    assert dashboard.stat().st_mtime_ns == written
+
+    mark_drill(tmp_path, drill, "passed", rating=4)
+    update_obsidian_dashboard(tmp_path)
+    assert "**Streak:** 1 days" in dashboard.read_text(encoding="utf-8")
+
+
+def test_dashboard_notices_in_place_edits(tmp_path):
+    """Editing a drill's frontmatter in place re-renders the dashboard."""
+    drill = create_drill_note(tmp_path, title="Dash Drill")
+    update_obsidian_dashboard(tmp_path)
+
+    content = drill.read_text(encoding="utf-8")
+    drill.write_text(content.replace("status: untried", "status: passed"), encoding="utf-8")
+    with patch("vibe_dojo.trainer.render_dashboard", return_value="") as render:
+        update_obsidian_dashboard(tmp_path)
+        render.assert_called_once()
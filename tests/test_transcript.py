@@ -0,0 +1,61 @@
+"""Test transcript compaction."""
+
+from vibe_dojo.transcript import clean_fragment, compact_transcript
+
+RAW = """[00:00] [Music]
+[00:02] so umm today we're going to
+[00:04] today we're going to look at
+[00:06] look at async &amp; await
+[00:31] uh the event loop runs
+[00:50] one task at a time
+[01:05] >> next question
+[01:10] how do you cancel tasks"""
+
+
+def test_clean_fragment_drops_noise():
+    """Sound cues, fillers and HTML entities are removed."""
+    assert clean_fragment("[Music] umm so &amp; that") == "so & that"
+    assert clean_fragment("♪♪ [Applause]") == ""
+
+
+def test_clean_fragment_keeps_german_um():
+    """German "um" is a word, not a filler; "ähm" still goes."""
+    text = "ähm wir treffen uns um 10 Uhr, um das zu klären"
+    assert clean_fragment(text) == "wir treffen uns um 10 Uhr, um das zu klären"
+
+
+def test_compact_merges_fragments_into_windows():
+    """Fragments merge into ~window-sized paragraphs without rolling repeats."""
+    compact, stats = compact_transcript(RAW, window_seconds=45)
+
+    assert compact.split("\n\n") == [
+        "[00:00] so today we're going to look at async & await the event loop runs",
+        "[00:50] one task at a time next question how do you cancel tasks",
+    ]
+    assert stats["fragments"] == 8
+    assert stats["paragraphs"] == 2
+    assert stats["compact_tokens"] < stats["raw_tokens"]
+
+
+def test_compact_breaks_at_chapters():
+    """Chapter boundaries always start a new paragraph."""
+    chapters = [{"timestamp": "00:00", "title": "Intro"}, {"timestamp": "00:30", "title": "Loop"}]
+    compact, _ = compact_transcript(RAW, chapters=chapters, window_seconds=300)
+
+    assert [p[:7] for p in compact.split("\n\n")] == ["[00:00]", "[00:31]"]
+
+
+def test_plain_text_is_untouched():
+    """Articles and manual notes pass through unchanged."""
+    text = "# Title\n\nSome article text."
+    compact, stats = compact_transcript(text)
+    assert compact == text
+    assert stats["fragments"] == 0
+
+
+def test_compact_keeps_text_before_first_timestamp():
+    """Untimed lines before the first timestamp become a leading chunk."""
+    compact, stats = compact_transcript("Intro by the host\n[00:05] first point\n[01:30] second")
+
+    assert compact.split("\n\n") == ["Intro by the host", "[00:05] first point", "[01:30] second"]
+    assert stats["paragraphs"] == 3
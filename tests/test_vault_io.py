@@ -0,0 +1,87 @@
+"""Tests for crash-safe vault writes."""
+
+from unittest.mock import patch
+
+import pytest
+
+from vibe_dojo import vault_io
+from vibe_dojo.trainer import mark_drill, update_frontmatter
+from vibe_dojo.writer import create_drill_note
+
+
+def test_atomic_write_keeps_old_content_on_failure(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text("old", encoding="utf-8")
+
+    with patch("vibe_dojo.vault_io.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            vault_io.atomic_write_text(note, "new")
+
+    assert note.read_text(encoding="utf-8") == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["note.md"]
+
+
+def test_write_behind_commits_on_exit_with_one_barrier(tmp_path):
+    with patch("vibe_dojo.vault_io.fsync_dir") as fsync_dir:
+        with vault_io.write_behind() as queue:
+            for i in range(20):
+                vault_io.write_text(tmp_path / "01_Drills" / f"DRILL__{i}.md", f"drill {i}")
+            assert not (tmp_path / "01_Drills" / "DRILL__0.md").exists()
+            assert vault_io.exists(tmp_path / "01_Drills" / "DRILL__0.md")
+            assert vault_io.read_text(tmp_path / "01_Drills" / "DRILL__3.md") == "drill 3"
+
+    assert queue.committed == 20
+    assert fsync_dir.call_count == 1
+    assert (tmp_path / "01_Drills" / "DRILL__19.md").read_text(encoding="utf-8") == "drill 19"
+
+
+def test_write_behind_commits_queued_writes_on_error(tmp_path):
+    with pytest.raises(RuntimeError):
+        with vault_io.write_behind():
+            vault_io.write_text(tmp_path / "a.md", "a")
+            raise RuntimeError("LLM stream died")
+
+    assert (tmp_path / "a.md").read_text(encoding="utf-8") == "a"
+
+
+def test_queued_drill_can_be_updated_and_archived(tmp_path):
+    """Reads and moves inside a batch see the queued version of a note."""
+    with vault_io.write_behind():
+        drill = create_drill_note(tmp_path, title="Queued Drill")
+        update_frontmatter(drill, {"review_count": 1})
+        mark_drill(tmp_path, drill, "outdated")
+
+    archived = tmp_path / "90_Archive" / drill.name
+    assert not drill.exists()
+    content = archived.read_text(encoding="utf-8")
+    assert "status: outdated" in content
+    assert "review_count: 1" in content
+
+
+def test_archive_delete_waits_for_commit(tmp_path):
+    """Inside a batch the original note stays on disk until its archived copy is written."""
+    drill = create_drill_note(tmp_path, title="Old Drill")
+
+    with vault_io.write_behind():
+        mark_drill(tmp_path, drill, "outdated")
+        archived = tmp_path / "90_Archive" / drill.name
+        assert drill.exists() and not archived.exists()
+        assert not vault_io.exists(drill)
+        with pytest.raises(FileNotFoundError):
+            vault_io.read_text(drill)
+
+    assert archived.exists() and not drill.exists()
+
+
+def test_failed_commit_keeps_originals(tmp_path):
+    """If the queued writes can't be committed, nothing queued for deletion is removed."""
+    note = tmp_path / "note.md"
+    note.write_text("keep", encoding="utf-8")
+
+    with patch("vibe_dojo.vault_io.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            with vault_io.write_behind():
+                vault_io.write_text(tmp_path / "copy.md", "keep")
+                vault_io.remove(note)
+
+    assert note.read_text(encoding="utf-8") == "keep"
@@ -0,0 +1,148 @@
+"""Per-day practice activity index (streaks, today's count, heatmap).
+
+One count per calendar day since the first practice day is kept in
+``.dojo_cache`` and bumped whenever a practice log is written, so streaks
+and the heatmap never have to list the logs folder. As with the topic
+counters, each save records the logs folder's modification time and a
+mismatch (logs added or removed outside Vibe-Dojo) triggers a rebuild.
+"""
+
+import os
+import re
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from . import vault_io
+from .cache import load_json, save_json
+
+ACTIVITY_FILE_NAME = "activity.json"
+ACTIVITY_VERSION = 1
+LOGS_FOLDER = "02_Practice_Logs"
+LOG_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+_pending: dict[Path, "ActivityIndex"] = {}
+_pending_lock = threading.Lock()
+
+
+def _logs_stamp(vault_path: Path) -> Optional[int]:
+    try:
+        return os.stat(vault_path / LOGS_FOLDER).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ActivityIndex:
+    """Practice counts per day, as a dense array starting at ``start``.
+
+    Args:
+        vault_path: Vault path
+        data: Saved index (start date, counts, longest streak)
+    """
+
+    def __init__(self, vault_path: Path, data: Optional[dict] = None):
+        self.vault_path = vault_path
+        data = data or {}
+        start = data.get("start")
+        self.start: Optional[date] = date.fromisoformat(start) if start else None
+        self.counts: list[int] = list(data.get("counts", []))
+        self.longest: int = data.get("longest", 0)
+
+    @classmethod
+    def load(cls, vault_path: Path) -> "ActivityIndex":
+        """Load the index, rebuilding it if missing or out of date."""
+        with _pending_lock:
+            if vault_path in _pending:
+                return _pending[vault_path]
+        data = load_json(vault_path, ACTIVITY_FILE_NAME)
+        if (
+            isinstance(data, dict)
+            and data.get("version") == ACTIVITY_VERSION
+            and data.get("stamp") == _logs_stamp(vault_path)
+        ):
+            return cls(vault_path, data)
+        index = cls(vault_path)
+        index.rebuild()
+        index.save()
+        return index
+
+    def rebuild(self) -> None:
+        """Recount from the practice log names (YYYY-MM-DD__slug.md, daily or packed)."""
+        from .trainer import practice_log_names
+
+        self.start, self.counts, self.longest = None, [], 0
+        for name in practice_log_names(self.vault_path):
+            match = LOG_DATE_RE.match(name)
+            if match:
+                self.add(date.fromisoformat(match.group(1)))
+
+    def _offset(self, day: date) -> int:
+        return (day - self.start).days
+
+    def add(self, day: date, count: int = 1) -> None:
+        """Count ``count`` practices on ``day``."""
+        if self.start is None:
+            self.start = day
+        offset = self._offset(day)
+        if offset < 0:
+            self.counts[:0] = [0] * -offset
+            self.start, offset = day, 0
+        if offset >= len(self.counts):
+            self.counts.extend([0] * (offset + 1 - len(self.counts)))
+        first = not self.counts[offset]
+        self.counts[offset] += count
+        if first:
+            self.longest = max(self.longest, self._run_length(offset))
+
+    def _run_length(self, offset: int) -> int:
+        """Length of the run of active days through ``offset``."""
+        lo = hi = offset
+        while lo > 0 and self.counts[lo - 1]:
+            lo -= 1
+        while hi + 1 < len(self.counts) and self.counts[hi + 1]:
+            hi += 1
+        return hi - lo + 1
+
+    def count(self, day: date) -> int:
+        """Practices logged on ``day``."""
+        if self.start is None:
+            return 0
+        offset = self._offset(day)
+        return self.counts[offset] if 0 <= offset < len(self.counts) else 0
+
+    def streak(self, today: Optional[date] = None) -> int:
+        """Consecutive active days ending today (or yesterday, if today has none yet)."""
+        today = today or datetime.now().date()
+        day = today if self.count(today) else today - timedelta(days=1)
+        streak = 0
+        while self.count(day):
+            streak += 1
+            day -= timedelta(days=1)
+        return streak
+
+    def days(self, end: Optional[date] = None, length: int = 365) -> list[int]:
+        """Counts for the ``length`` days ending on ``end`` (oldest first)."""
+        end = end or datetime.now().date()
+        first = end - timedelta(days=length - 1)
+        return [self.count(first + timedelta(days=i)) for i in range(length)]
+
+    def save(self) -> None:
+        """Persist once the surrounding write-behind block (if any) has committed."""
+        with _pending_lock:
+            if _pending.get(self.vault_path) is self:
+                return
+            _pending[self.vault_path] = self
+
+        def commit():
+            with _pending_lock:
+                _pending.pop(self.vault_path, None)
+            save_json(self.vault_path, ACTIVITY_FILE_NAME, {
+                "version": ACTIVITY_VERSION,
+                "stamp": _logs_stamp(self.vault_path),
+                "start": self.start.isoformat() if self.start else None,
+                "counts": self.counts,
+                "longest": self.longest,
+            })
+
+        vault_io.on_commit(commit)
@@ -0,0 +1,267 @@
+"""Content-addressed storage for source attachments (transcripts, article text)."""
+
+import gzip
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional
+
+from . import vault_io
+
+ATTACHMENTS_DIR = "00_Inbox/_attachments"
+COMPRESSIONS = ("none", "gzip", "zstd")
+SUFFIXES = {"none": ".txt", "gzip": ".txt.gz", "zstd": ".txt.zst"}
+# 32 hex chars of sha256 is plenty for a personal vault
+HASH_LENGTH = 32
+ZSTD_LEVEL = 10
+PREVIEW_CHARS = 300
+# Matches distiller.estimate_tokens
+CHARS_PER_TOKEN = 4
+
+TRANSCRIPT_PATH_RE = re.compile(r"^transcript_path:\s*(.*?)\s*$", re.MULTILINE)
+
+
+def _zstd():
+    """zstd codec: stdlib ``compression.zstd`` (3.14+) or the ``zstandard`` package."""
+    try:
+        from compression import zstd
+
+        return zstd.compress, zstd.decompress
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return (
+        lambda data: zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+def resolve_compression(compression: Optional[str]) -> str:
+    """Normalize a configured compression name, falling back to gzip without zstd."""
+    compression = (compression or "none").lower()
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unknown attachment compression '{compression}' "
+            f"(use one of {', '.join(COMPRESSIONS)})"
+        )
+    if compression == "zstd" and _zstd() is None:
+        return "gzip"
+    return compression
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+
+
+def encode(content: str, compression: str) -> bytes:
+    data = content.encode("utf-8")
+    if compression == "gzip":
+        # mtime=0 keeps the bytes reproducible for identical content
+        return gzip.compress(data, mtime=0)
+    if compression == "zstd":
+        return _zstd()[0](data)
+    return data
+
+
+def decode(path: Path) -> str:
+    """Read an attachment in any supported encoding (chosen by suffix)."""
+    data = path.read_bytes()
+    if path.name.endswith(".gz"):
+        data = gzip.decompress(data)
+    elif path.name.endswith(".zst"):
+        codec = _zstd()
+        if codec is None:
+            raise RuntimeError(f"{path.name} is zstd-compressed; install 'zstandard' to read it")
+        data = codec[1](data)
+    return data.decode("utf-8")
+
+
+def _open_writer(raw: BinaryIO, compression: str) -> BinaryIO:
+    """Wrap a raw file in an incremental compressor."""
+    if compression == "gzip":
+        return gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0)
+    if compression == "zstd":
+        try:
+            from compression import zstd
+
+            return zstd.ZstdFile(raw, "wb")
+        except ImportError:
+            import zstandard
+
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=False)
+    return raw
+
+
+def write_attachment_stream(
+    vault_path: Path,
+    chunks: Iterable[str],
+    compression: Optional[str] = None,
+    preview_chars: int = PREVIEW_CHARS,
+) -> dict:
+    """Stream text chunks into the content-addressed store.
+
+    Chunks go straight to a temp file while the hash, a preview and the
+    character count are collected, so the full text is never held in
+    memory. The temp file is then renamed to its hash (or dropped if that
+    content is already stored).
+
+    Args:
+        vault_path: Path to vault
+        chunks: Text pieces, e.g. transcript lines
+        compression: none, gzip or zstd
+        preview_chars: How many leading characters to keep as a preview
+
+    Returns:
+        Dict with ``path``, ``created`` (False if the content was already
+        stored), ``preview``, ``chars`` and ``tokens``
+    """
+    compression = resolve_compression(compression)
+    attachments_path = vault_path / ATTACHMENTS_DIR
+    attachments_path.mkdir(parents=True, exist_ok=True)
+
+    digest = hashlib.sha256()
+    preview: list[str] = []
+    preview_len = 0
+    chars = 0
+    fd, tmp_name = tempfile.mkstemp(prefix=".incoming-", suffix=".tmp", dir=attachments_path)
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            writer = _open_writer(raw, compression)
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                data = chunk.encode("utf-8")
+                digest.update(data)
+                writer.write(data)
+                chars += len(chunk)
+                if preview_len < preview_chars:
+                    preview.append(chunk[:preview_chars - preview_len])
+                    preview_len += len(preview[-1])
+            if writer is not raw:
+                writer.close()
+
+        path = attachments_path / f"{digest.hexdigest()[:HASH_LENGTH]}{SUFFIXES[compression]}"
+        created = not path.exists()
+        if created:
+            os.replace(tmp_path, path)
+        else:
+            tmp_path.unlink()
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return {
+        "path": path,
+        "created": created,
+        "preview": "".join(preview),
+        "chars": chars,
+        "tokens": chars // CHARS_PER_TOKEN,
+    }
+
+
+def store_attachment(vault_path: Path, content: str, compression: Optional[str] = None) -> Path:
+    """Store content under its hash and return the attachment path.
+
+    Identical content maps to the same file, so re-capturing a source costs
+    no extra disk.
+
+    Args:
+        vault_path: Path to vault
+        content: Attachment text
+        compression: none, gzip or zstd
+
+    Returns:
+        Absolute path of the stored attachment
+    """
+    compression = resolve_compression(compression)
+    path = vault_path / ATTACHMENTS_DIR / f"{content_hash(content)}{SUFFIXES[compression]}"
+    if path.exists():
+        return path
+    return write_attachment_stream(vault_path, [content], compression)["path"]
+
+
+def resolve_attachment(vault_path: Path, transcript_path: str) -> Optional[Path]:
+    """Locate the file behind a note's ``transcript_path``.
+
+    Falls back to the same name with another suffix, so a note still reads
+    if its attachment was recompressed.
+    """
+    transcript_path = str(transcript_path or "").strip().lstrip("/\\")
+    if not transcript_path:
+        return None
+    path = vault_path / transcript_path
+    if path.exists():
+        return path
+    stem = path.name.split(".", 1)[0]
+    for suffix in SUFFIXES.values():
+        candidate = path.with_name(stem + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def read_attachment(vault_path: Path, transcript_path: str) -> Optional[str]:
+    """Text behind a note's ``transcript_path``, or None if it's missing."""
+    path = resolve_attachment(vault_path, transcript_path)
+    return decode(path) if path else None
+
+
+def migrate_attachments(vault_path: Path, compression: Optional[str] = None) -> dict:
+    """Move every source attachment into the content-addressed store.
+
+    Rewrites each note's ``transcript_path`` and deletes the old files once no
+    note references them.
+
+    Returns:
+        Stats dict: notes, migrated, missing, removed, bytes_before, bytes_after
+    """
+    compression = resolve_compression(compression)
+    stats = {
+        "notes": 0,
+        "migrated": 0,
+        "missing": 0,
+        "removed": 0,
+        "bytes_before": 0,
+        "bytes_after": 0,
+    }
+    attachments_path = vault_path / ATTACHMENTS_DIR
+    if not attachments_path.exists():
+        return stats
+    stats["bytes_before"] = sum(p.stat().st_size for p in attachments_path.iterdir() if p.is_file())
+
+    referenced = set()
+    replaced = set()
+    for note in sorted((vault_path / "00_Inbox").glob("SOURCE__*.md")):
+        text = note.read_text(encoding="utf-8")
+        match = TRANSCRIPT_PATH_RE.search(text)
+        if not match or not match.group(1):
+            continue
+        stats["notes"] += 1
+        old_path = resolve_attachment(vault_path, match.group(1))
+        if old_path is None:
+            stats["missing"] += 1
+            continue
+        content = decode(old_path)
+
+        new_path = store_attachment(vault_path, content, compression)
+        relative = new_path.relative_to(vault_path).as_posix()
+        referenced.add(new_path)
+        replaced.add(old_path)
+        if match.group(1) != relative:
+            text = text[:match.start(1)] + relative + text[match.end(1):]
+            text = text.replace(f"`{match.group(1)}`", f"`{relative}`")
+            vault_io.write_text(note, text)
+            stats["migrated"] += 1
+
+    for path in replaced - referenced:
+        path.unlink()
+        stats["removed"] += 1
+
+    stats["bytes_after"] = sum(p.stat().st_size for p in attachments_path.iterdir() if p.is_file())
+    return stats
@@ -0,0 +1,68 @@
+"""Derived-data cache stored in the vault's .dojo_cache/ folder."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_NAME = ".dojo_cache"
+
+
+def cache_file(vault_path: Path, name: str) -> Path:
+    """Path of a cache file inside the vault."""
+    return vault_path / CACHE_DIR_NAME / name
+
+
+def load_json(vault_path: Path, name: str, default: Any = None) -> Any:
+    """Load a JSON cache file, returning ``default`` if missing or corrupt."""
+    path = cache_file(vault_path, name)
+    if not path.exists():
+        return default
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return default
+
+
+def save_json(vault_path: Path, name: str, data: Any) -> None:
+    """Write a JSON cache file via a temp file so readers never see half a file."""
+    path = cache_file(vault_path, name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(json.dumps(data, default=str), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable short hash of JSON-serializable parts."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def listing_fingerprint(folder: Path, pattern: str = "*.md") -> str:
+    """Hash of the file names in a folder (no file reads)."""
+    if not folder.exists():
+        return fingerprint([])
+    return fingerprint(sorted(p.name for p in folder.glob(pattern)))
+
+
+def folder_stamp(folder: Path) -> Any:
+    """Cheap change stamp for a folder's files (no file reads).
+
+    Combines the folder's own mtime (files added, removed or renamed) with
+    the file count, newest file mtime and total size, so a note edited in
+    place (as Obsidian saves) changes it too. Costs one stat per file.
+    """
+    try:
+        stamp = [os.stat(folder).st_mtime_ns, 0, 0, 0]
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    info = entry.stat()
+                    stamp[1] += 1
+                    stamp[2] = max(stamp[2], info.st_mtime_ns)
+                    stamp[3] += info.st_size
+    except OSError:
+        return None
+    return stamp
@@ -88,19 +88,22 @@ dojo insights            # Get AI learning coaching
 
 @app.command()
 def ingest(
-    url_or_text: str = typer.Argument(..., help="URL to fetch or text content"),
+    url_or_text: str = typer.Argument(
+        ..., help="URL (http(s):// or file://) to fetch or text content"
+    ),
     vault: Optional[Path] = typer.Option(None, help="Vault path (default: current directory)"),
     title: Optional[str] = typer.Option(None, help="Custom title for source note"),
     no_fetch: bool = typer.Option(False, "--no-fetch", help="Don't fetch URL, treat as text"),
 ):
     """Ingest content from URL or text and create a source note."""
+    from .fetchers import is_url
     from .ingestor import create_source_note
 
     vault_path = vault or Path.cwd()
     vault_path = vault_path.resolve()
 
     try:
-        if no_fetch or not url_or_text.startswith("http"):
+        if no_fetch or not is_url(url_or_text):
             # Treat as text
             note_path = create_source_note(
                 vault_path, text=url_or_text, title=title, no_fetch=True
@@ -117,6 +120,106 @@ def ingest(
         raise typer.Exit(1)
 
 
+@app.command()
+def ingest_batch(
+    source: str = typer.Argument(..., help="File with one URL or text per line, or '-' for stdin"),
+    vault: Optional[Path] = typer.Option(None, help="Vault path (default: current directory)"),
+    workers: int = typer.Option(8, help="Concurrent fetches"),
+    per_domain: int = typer.Option(2, "--per-domain", help="Concurrent fetches per host"),
+    timeout: float = typer.Option(120.0, help="Seconds before a single fetch is abandoned"),
+):
+    """Ingest many URLs or text entries concurrently."""
+    import sys
+
+    from .ingestor import ingest_batch as run_batch
+    from .ingestor import parse_batch_entries
+
+    vault_path = vault or Path.cwd()
+    vault_path = vault_path.resolve()
+
+    if source == "-":
+        entries = parse_batch_entries(sys.stdin)
+    else:
+        source_path = Path(source)
+        if not source_path.exists():
+            console.print(f"[bold red]✗ File not found:[/bold red] {source}")
+            raise typer.Exit(1)
+        entries = parse_batch_entries(source_path.read_text(encoding="utf-8").splitlines())
+
+    if not entries:
+        console.print("[yellow]No entries to ingest.[/yellow]")
+        return
+
+    console.print(f"[bold blue]📦 Ingesting {len(entries)} entries...[/bold blue]\n")
+
+    def show(result: dict) -> None:
+        label = result["entry"] if len(result["entry"]) <= 80 else result["entry"][:77] + "..."
+        if result["status"] == "created":
+            console.print(f"  [green]✓[/green] {label} → {result['path'].name}")
+        elif result["status"] == "skipped":
+            console.print(f"  [yellow]↷[/yellow] {label} [dim]({result['reason']})[/dim]")
+        else:
+            console.print(f"  [red]✗[/red] {label} [dim]({result['reason']})[/dim]")
+
+    results = run_batch(
+        vault_path,
+        entries,
+        max_workers=workers,
+        per_domain=per_domain,
+        timeout=timeout,
+        on_result=show,
+    )
+
+    counts = {
+        status: sum(1 for r in results if r["status"] == status)
+        for status in ("created", "skipped", "failed")
+    }
+    console.print(
+        f"\n[bold]Summary:[/bold] [green]{counts['created']} created[/green], "
+        f"[yellow]{counts['skipped']} skipped[/yellow], [red]{counts['failed']} failed[/red]"
+    )
+    if counts["failed"]:
+        raise typer.Exit(1)
+
+
+@app.command()
+def import_folder(
+    folder: Path = typer.Argument(..., help="Markdown/Obsidian folder to import"),
+    vault: Optional[Path] = typer.Option(None, help="Vault path (default: current directory)"),
+    workers: int = typer.Option(8, help="Reader threads"),
+    batch_size: int = typer.Option(200, "--batch-size", help="Notes written per batch"),
+):
+    """Import every Markdown/text file in a folder as a source note."""
+    from .importer import import_folder as run_import
+
+    vault_path = vault or Path.cwd()
+    vault_path = vault_path.resolve()
+
+    if not folder.is_dir():
+        console.print(f"[bold red]✗ Not a folder:[/bold red] {folder}")
+        raise typer.Exit(1)
+
+    with console.status("[bold green]Importing...[/bold green]") as status:
+        stats = run_import(
+            vault_path,
+            folder,
+            workers=workers,
+            batch_size=batch_size,
+            on_progress=lambda s: status.update(
+                f"[bold green]Importing...[/bold green] {s['imported']} imported, "
+                f"{s['files']} files scanned"
+            ),
+        )
+
+    console.print(
+        f"[bold green]✓ Imported {stats['imported']} of {stats['files']} files[/bold green] "
+        f"({stats['duplicates']} duplicates, {stats['skipped']} empty or too large, "
+        f"{stats['failed']} failed)"
+    )
+    for path, error in stats["errors"][:10]:
+        console.print(f"  [red]✗[/red] {path}: {error}")
+
+
 @app.command()
 def capture(
     url: str = typer.Argument(..., help="URL to capture"),
@@ -124,6 +227,7 @@ def capture(
 ):
     """Quick-capture a URL to the inbox without fetching immediately."""
     from .ingestor import slugify
+    from .vault_io import atomic_write_text
     from datetime import datetime
     from ulid import ULID
 
@@ -149,7 +253,7 @@ Pending distillation. Run `dojo distill-inbox` to process.
     inbox_path.mkdir(parents=True, exist_ok=True)
     
     note_file = inbox_path / f"SOURCE__pending__{source_id}.md"
-    note_file.write_text(note_content, encoding="utf-8")
+    atomic_write_text(note_file, note_content)
     
     console.print(f"[bold green]✓ URL Captured:[/bold green] {url}")
     console.print(f"[dim]Run 'dojo distill-inbox' later to process.[/dim]")
@@ -360,6 +464,7 @@ def distill_inbox(
     """Process all pending/captured URLs in the inbox."""
     from .ingestor import create_source_note
     from .distiller import create_drills_from_source
+    from .gemini import CircuitOpenError
     from .trainer import parse_frontmatter
 
     vault_path = vault or Path.cwd()
@@ -400,6 +505,10 @@ def distill_inbox(
             pending_file.unlink()
             console.print(f"  [green]✓ Success![/green]\n")
 
+        except CircuitOpenError as e:
+            # The API is down; stop instead of failing every remaining capture
+            console.print(f"  [red]✗ Stopping:[/red] {e}\n")
+            break
         except Exception as e:
             console.print(f"  [red]✗ Failed:[/red] {e}\n")
 
@@ -472,41 +581,41 @@ def next_drill(
     content = drill_path.read_text(encoding="utf-8")
     frontmatter, body = parse_frontmatter(content)
 
-    from rich.markdown import Markdown
-    from rich.panel import Panel
-    from rich.prompt import Prompt
-    from .trainer import mark_drill, promote_to_mastery, get_topics_stats
+    from .practice import context_panel, drill_panel
+    from .topic_counters import TopicCounters, drill_topics
 
-    # Calculate Context
-    status = frontmatter.get("status", "untried")
-    topics = frontmatter.get("topics", [])
-    topic_str = "General"
+    # Calculate Context: progress for the first topic, from the precomputed counters
+    topic_progress = None
+    topics = drill_topics(frontmatter)
     if topics:
-        # Get progress for the first topic
-        ts = get_topics_stats(vault_path)
-        topic_data = next((t for t in ts if t["name"] == topics[0]), None)
-        if topic_data:
-            topic_str = f"{topics[0]}: {topic_data['passed']}/{topic_data['total']} mastered"
-
-    if status == "untried":
-        reason = "New drill added to your inbox"
-    elif status == "failed":
-        reason = "Scheduled review after previous failure"
-    else:
-        reason = "Spaced repetition review"
-
-    timebox = frontmatter.get('timebox_min', 10)
+        topic_progress = TopicCounters.load(vault_path).progress(topics[0])
 
     # Show Context Panel
-    console.print(Panel(
-        f"[bold cyan]Reason:[/bold cyan] {reason}\n"
-        f"[bold gold1]Topic:[/bold gold1] {topic_str}\n"
-        f"[bold yellow]Timebox:[/bold yellow] {timebox} mins",
-        title="[bold]CONTEXT[/bold]",
-        border_style="dim"
-    ))
-
-    console.print(Panel(Markdown(content), title=f"[bold blue]NEXT DRILL[/bold blue]", border_style="blue"))
+    console.print(context_panel(frontmatter, topic_progress))
+    console.print(drill_panel(content))
+    review_drill(vault_path, drill_path, frontmatter)
+
+
+def review_drill(
+    vault_path: Path, drill_path: Path, frontmatter: dict, update_dashboard: bool = True
+) -> Optional[str]:
+    """Ask for the outcome of a displayed drill and record it.
+
+    Args:
+        vault_path: Vault path
+        drill_path: Path to drill file
+        frontmatter: The drill's frontmatter (as displayed)
+        update_dashboard: Regenerate _Dashboard.md afterwards (practice
+            sessions do this in the background instead)
+
+    Returns:
+        The result (passed/failed), or None if skipped
+    """
+    from rich.prompt import Prompt
+
+    from .scheduler import get_scheduler
+    from .trainer import mark_drill, promote_to_mastery
+
     console.print("[dim]Focus deeply. Do the work. Verify against validation steps.[/dim]\n")
 
     # Interactive Loop
@@ -520,7 +629,7 @@ def next_drill(
         raise typer.Exit()
     elif action == "s":
         console.print("[dim]Skipped. Use 'dojo next' to see another.[/dim]")
-        return
+        return None
 
     result_map = {"p": "passed", "f": "failed"}
     result = result_map[action]
@@ -529,10 +638,20 @@ def next_drill(
     if result == "passed":
         notes = Prompt.ask("Reflection: [italic]What did you learn? (optional)[/italic]", default="")
 
-    rating = Prompt.ask("Rate this drill quality (1-5)", choices=["1", "2", "3", "4", "5"], default="5")
+    rating = Prompt.ask(
+        "Rate this drill quality (1-5)", choices=["1", "2", "3", "4", "5"], default="5"
+    )
+
+    effort = "0"
+    if result == "passed" and get_scheduler(vault_path).graded:
+        effort = Prompt.ask(
+            "How did it go? (1 = struggled, 5 = effortless)",
+            choices=["1", "2", "3", "4", "5"],
+            default="4",
+        )
 
     try:
-        mark_drill(vault_path, drill_path, result, notes, rating=int(rating))
+        mark_drill(vault_path, drill_path, result, notes, rating=int(rating), effort=int(effort))
         
         if result == "passed":
             # AUTO-PROMOTE ON PASS
@@ -563,13 +682,16 @@ def next_drill(
             console.print("\n[yellow]Keep at it! This drill will reappear tomorrow for another shot.[/yellow]")
 
         # Update Obsidian dashboard
-        from .trainer import update_obsidian_dashboard
-        update_obsidian_dashboard(vault_path)
+        if update_dashboard:
+            from .trainer import update_obsidian_dashboard
+            update_obsidian_dashboard(vault_path)
 
     except Exception as e:
         console.print(f"[bold red]✗ Error marking drill:[/bold red] {e}")
         raise typer.Exit(1)
 
+    return result
+
 
 @app.command()
 def topics(
@@ -620,6 +742,7 @@ def topics(
 def insights(
     vault: Optional[Path] = typer.Option(None, help="Vault path (default: current directory)"),
     model: str = typer.Option("gemini-3-flash-preview", help="Gemini model to use"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore the cached briefing"),
 ):
     """Get AI-powered coaching insights on your learning progress."""
     from .distiller import analyze_insights
@@ -632,7 +755,7 @@ def insights(
     
     with console.status("[bold green]Synthesizing logs and mastery...[/bold green]"):
         try:
-            insight_text = analyze_insights(vault_path, model_name=model)
+            insight_text = analyze_insights(vault_path, model_name=model, refresh=refresh)
             from rich.markdown import Markdown
             console.print("\n")
             console.print(Panel(Markdown(insight_text), title="🥋 Coach's Briefing", border_style="magenta"))
@@ -641,16 +764,106 @@ def insights(
             raise typer.Exit(1)
 
 
+@app.command()
+def usage(
+    days: int = typer.Option(30, help="Only include calls from the last N days"),
+    top: int = typer.Option(10, help="Number of most expensive sources to show"),
+):
+    """Show LLM and embedding usage: latency percentiles, tokens and cost."""
+    from rich.table import Table
+
+    from .telemetry import TELEMETRY_PATH, load_records, summarize
+
+    records = load_records(days=days)
+    if not records:
+        console.print(f"[yellow]No API calls recorded in the last {days} days.[/yellow]")
+        console.print(f"[dim]Ledger: {TELEMETRY_PATH}[/dim]")
+        return
+
+    summary = summarize(records)
+
+    def cost_str(cost: float) -> str:
+        return f"${cost:.4f}" if cost else "[dim]-[/dim]"
+
+    model_table = Table(title=f"🔌 API Usage by Model (last {days} days)", expand=True)
+    model_table.add_column("Operation", style="bold cyan")
+    model_table.add_column("Model")
+    model_table.add_column("Calls", justify="right")
+    model_table.add_column("Errors", justify="right")
+    model_table.add_column("Retries", justify="right")
+    model_table.add_column("p50", justify="right")
+    model_table.add_column("p95", justify="right")
+    model_table.add_column("Max", justify="right")
+    model_table.add_column("Tokens In/Out", justify="right")
+    model_table.add_column("Est. Cost", justify="right", style="gold1")
+
+    for (op, model), b in sorted(summary["by_model"].items(), key=lambda x: -x[1]["cost"]):
+        model_table.add_row(
+            op,
+            model,
+            str(b["calls"]),
+            f"[red]{b['errors']}[/red]" if b["errors"] else "0",
+            str(b["retries"]),
+            f"{b['p50_ms'] / 1000:.1f}s",
+            f"{b['p95_ms'] / 1000:.1f}s",
+            f"{b['max_ms'] / 1000:.1f}s",
+            f"{b['prompt_tokens']:,}/{b['output_tokens']:,}",
+            cost_str(b["cost"]),
+        )
+    console.print(model_table)
+
+    day_table = Table(title="\n📅 Per-Day Totals", expand=True)
+    day_table.add_column("Day", style="bold")
+    day_table.add_column("Calls", justify="right")
+    day_table.add_column("Errors", justify="right")
+    day_table.add_column("Tokens In/Out", justify="right")
+    day_table.add_column("Est. Cost", justify="right", style="gold1")
+    for day, b in sorted(summary["by_day"].items(), reverse=True):
+        day_table.add_row(
+            day,
+            str(b["calls"]),
+            str(b["errors"]),
+            f"{b['prompt_tokens']:,}/{b['output_tokens']:,}",
+            cost_str(b["cost"]),
+        )
+    console.print(day_table)
+
+    if summary["by_source"]:
+        source_table = Table(title="\n💸 Most Expensive Sources", expand=True)
+        source_table.add_column("Source ID", style="cyan")
+        source_table.add_column("Calls", justify="right")
+        source_table.add_column("p95", justify="right")
+        source_table.add_column("Tokens In/Out", justify="right")
+        source_table.add_column("Est. Cost", justify="right", style="gold1")
+        ranked = sorted(
+            summary["by_source"].items(),
+            key=lambda x: (x[1]["cost"], x[1]["prompt_tokens"]),
+            reverse=True,
+        )
+        for source_id, b in ranked[:top]:
+            source_table.add_row(
+                source_id,
+                str(b["calls"]),
+                f"{b['p95_ms'] / 1000:.1f}s",
+                f"{b['prompt_tokens']:,}/{b['output_tokens']:,}",
+                cost_str(b["cost"]),
+            )
+        console.print(source_table)
+
+    console.print(f"\n[dim]Costs are estimates from list prices. Ledger: {TELEMETRY_PATH}[/dim]")
+
+
 @app.command()
 def dashboard(
     vault: Optional[Path] = typer.Option(None, help="Vault path (default: current directory)"),
+    force: bool = typer.Option(False, "--force", help="Rewrite the note even if nothing changed"),
 ):
     """Update the Obsidian dashboard note."""
     from .trainer import update_obsidian_dashboard
     vault_path = vault or Path.cwd()
     vault_path = vault_path.resolve()
     
-    path = update_obsidian_dashboard(vault_path)
+    path = update_obsidian_dashboard(vault_path, force=force)
     console.print(f"[bold green]✓ Dashboard updated:[/bold green] {path.name}")
 
 
@@ -714,13 +927,16 @@ def distill(
     console.print(f"[dim]Generating {num_drills} drill(s)...[/dim]\n")
 
     try:
+        # Drills are written (and listed) while generation is still streaming
         drill_paths = create_drills_from_source(
-            vault_path, source_id, num_drills=num_drills, model_name=model
+            vault_path,
+            source_id,
+            num_drills=num_drills,
+            model_name=model,
+            on_drill=lambda p: console.print(f"  • {p.name}"),
         )
 
-        console.print(f"[bold green]✓ Generated {len(drill_paths)} drill(s):[/bold green]")
-        for drill_path in drill_paths:
-            console.print(f"  • {drill_path.name}")
+        console.print(f"\n[bold green]✓ Generated {len(drill_paths)} drill(s)[/bold green]")
 
         console.print("\n[dim]Run 'dojo next' to start practicing![/dim]")
 
@@ -813,6 +1029,241 @@ def dedup(
         raise typer.Exit(1)
 
 
+@app.command()
+def migrate_attachments(
+    vault: Optional[Path] = typer.Option(None, help="Vault path (default: current directory)"),
+    compression: Optional[str] = typer.Option(
+        None, help="none, gzip or zstd (default: attachments.compression from config)"
+    ),
+):
+    """Move source attachments into the content-addressed (optionally compressed) store."""
+    from .attachments import migrate_attachments as run_migration
+    from .config import Config
+
+    vault_path = vault or Path.cwd()
+    vault_path = vault_path.resolve()
+
+    if compression is None:
+        compression = Config(vault_path).config.get("attachments", {}).get("compression", "none")
+
+    try:
+        stats = run_migration(vault_path, compression)
+    except Exception as e:
+        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    console.print(
+        f"[bold green]✓ Migrated {stats['migrated']} of {stats['notes']} attachments[/bold green] "
+        f"({stats['removed']} old files removed)"
+    )
+    console.print(
+        f"  Size: {stats['bytes_before'] / 1024:.0f} KB → {stats['bytes_after'] / 1024:.0f} KB"
+    )
+    if stats["missing"]:
+        console.print(f"  [yellow]{stats['missing']} notes point to a missing attachment[/yellow]")
+
+
+@app.command()
+def forecast(
+    vault: Optional[Path] = typer.Option(None, help="Vault path (default: current directory)"),
+    days: int = typer.Option(365, min=1, help="Forecast horizon in days"),
+    algorithm: Optional[str] = typer.Option(
+        None, help="ladder, sm2 or fsrs (default: scheduler.algorithm from config)"
+    ),
+):
+    """Forecast the daily review load to help tune max_drills_per_day."""
+    import math
+    from datetime import date, timedelta
+
+    import numpy as np
+    from rich.table import Table
+
+    from .config import Config
+    from .scheduler import forecast_load, get_scheduler, load_review_states
+
+    vault_path = vault or Path.cwd()
+    vault_path = vault_path.resolve()
+
+    try:
+        scheduler = get_scheduler(vault_path, algorithm)
+    except ValueError as e:
+        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    states = load_review_states(vault_path, scheduler)
+    if not len(states["due"]):
+        console.print("[yellow]No active drills to forecast.[/yellow]")
+        return
+
+    load = forecast_load(states, scheduler, days=days)
+    cap = Config(vault_path).config.get("defaults", {}).get("max_drills_per_day", 5)
+
+    table = Table(
+        title=f"📅 Expected reviews per day ({scheduler.name}, {len(states['due'])} drills)"
+    )
+    table.add_column("Window")
+    table.add_column("Avg/day", justify="right")
+    table.add_column("Peak", justify="right")
+    table.add_column(f"Days over {cap}", justify="right")
+    windows = [
+        (0, 1, "Today (incl. overdue)"),
+        (1, 8, "Next 7 days"),
+        (8, 31, "Days 8-30"),
+        (31, 91, "Days 31-90"),
+        (91, 181, "Days 91-180"),
+        (181, days, f"Days 181-{days - 1}"),
+    ]
+    for start, end, label in windows:
+        window = load[start:min(end, days)]
+        if not len(window):
+            continue
+        over_cap = str(int((window > cap).sum()))
+        table.add_row(label, f"{window.mean():.1f}", f"{window.max():.1f}", over_cap)
+    console.print(table)
+
+    peak_day = int(load.argmax())
+    p95 = float(np.percentile(load[1:], 95)) if days > 1 else float(load[0])
+    console.print(
+        f"Peak: {load[peak_day]:.1f} reviews on {date.today() + timedelta(days=peak_day)} · "
+        f"95th percentile: {p95:.1f}/day"
+    )
+    suggested = max(1, math.ceil(p95))
+    if suggested > cap:
+        console.print(
+            f"[yellow]max_drills_per_day is {cap}; about {suggested} keeps up on 95% of days "
+            f"(otherwise reviews pile up).[/yellow]"
+        )
+    else:
+        console.print(f"[green]✓ max_drills_per_day = {cap} covers 95% of days.[/green]")
+
+
+@app.command()
+def simulate(
+    algorithm: Optional[list[str]] = typer.Option(
+        None, help="Scheduler(s) to compare: ladder, sm2, fsrs (default: all)"
+    ),
+    drills: int = typer.Option(500, help="Synthetic drills in the simulated vault"),
+    days: int = typer.Option(730, help="Days of practice to replay"),
+    per_day: int = typer.Option(5, help="Daily practice cap (max_drills_per_day)"),
+    new_per_day: float = typer.Option(1.0, help="New drills added per day"),
+    seed: int = typer.Option(0, help="Random seed for the simulated learner"),
+):
+    """Benchmark schedulers on a synthetic learner (no vault files are touched)."""
+    from rich.table import Table
+
+    from .scheduler import SCHEDULERS, get_scheduler
+    from .simulate import RETENTION_CHECKPOINTS
+    from .simulate import simulate as run_simulation
+
+    names = algorithm or list(SCHEDULERS)
+    try:
+        schedulers = [get_scheduler(algorithm=name) for name in names]
+    except ValueError as e:
+        console.print(f"[bold red]✗ Error:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    checkpoints = [d for d in RETENTION_CHECKPOINTS if d <= days]
+    table = Table(title=f"🧪 {drills} drills · {days} days · {per_day}/day · seed {seed}")
+    table.add_column("Scheduler", style="bold cyan")
+    table.add_column("Decisions/s", justify="right")
+    table.add_column("Reviews", justify="right")
+    table.add_column("Pass rate", justify="right")
+    table.add_column("Queue avg/max", justify="right")
+    for day in checkpoints:
+        table.add_column(f"Recall d{day}", justify="right")
+
+    for scheduler in schedulers:
+        with console.status(f"[dim]Simulating {scheduler.name}...[/dim]"):
+            stats = run_simulation(scheduler, drills, days, per_day, new_per_day, seed)
+        reviews = stats["decisions"]
+        queue = stats["queue"]
+        retention = [stats["retention"][day - 1] for day in checkpoints]
+        table.add_row(
+            scheduler.name,
+            f"{stats['decisions_per_sec']:,.0f}",
+            str(reviews),
+            f"{stats['passed'] / reviews:.0%}" if reviews else "-",
+            f"{sum(queue) / len(queue):.1f} / {max(queue)}" if queue else "-",
+            *[f"{r:.0%}" if r is not None else "-" for r in retention],
+        )
+    console.print(table)
+
+
+HEATMAP_COLORS = ("grey23", "dark_green", "green4", "green3", "bright_green")
+
+
+@app.command()
+def heatmap(
+    vault: Optional[Path] = typer.Option(None, help="Vault path (default: current directory)"),
+    weeks: int = typer.Option(52, min=1, help="Number of weeks to show"),
+):
+    """Show a practice activity heatmap with streak stats."""
+    from datetime import date, timedelta
+
+    from rich.text import Text
+
+    from .activity import ActivityIndex
+
+    vault_path = vault or Path.cwd()
+    vault_path = vault_path.resolve()
+
+    index = ActivityIndex.load(vault_path)
+    today = date.today()
+    # Columns are Monday-aligned weeks, the last one containing today
+    first = today - timedelta(days=today.weekday() + 7 * (weeks - 1))
+    counts = index.days(today, (today - first).days + 1)
+    peak = max(counts) or 1
+
+    grid = Text()
+    for weekday, label in enumerate(["Mon", "", "Wed", "", "Fri", "", "Sun"]):
+        grid.append(f"{label:<4}", style="dim")
+        for week in range(weeks):
+            offset = week * 7 + weekday
+            if offset >= len(counts):
+                break
+            count = counts[offset]
+            level = 0 if not count else 1 + min(3, (count - 1) * 4 // peak)
+            grid.append("■ ", style=HEATMAP_COLORS[level])
+        grid.append("\n")
+
+    console.print(f"\n[bold blue]🥋 Practice activity[/bold blue] [dim]| {first} – {today}[/dim]\n")
+    console.print(grid)
+    legend = Text("Less ", style="dim")
+    for color in HEATMAP_COLORS:
+        legend.append("■ ", style=color)
+    legend.append("More", style="dim")
+    console.print(legend)
+    console.print(
+        f"\n[bold]{sum(counts)}[/bold] drills on [bold]{sum(1 for c in counts if c)}[/bold] days · "
+        f"Today: [bold]{index.count(today)}[/bold] · "
+        f"Streak: [bold orange_red1]{index.streak(today)} days[/bold orange_red1] · "
+        f"Longest: [bold]{index.longest} days[/bold]"
+    )
+
+
+@app.command()
+def compact_logs(
+    vault: Optional[Path] = typer.Option(None, help="Vault path (default: current directory)"),
+    older_than: int = typer.Option(90, help="Pack logs older than this many days"),
+):
+    """Pack old practice logs into one Markdown file per month."""
+    from .trainer import compact_practice_logs
+
+    vault_path = vault or Path.cwd()
+    vault_path = vault_path.resolve()
+
+    with console.status("[dim]Packing practice logs...[/dim]"):
+        result = compact_practice_logs(vault_path, older_than_days=older_than)
+
+    if not result["logs"]:
+        console.print(f"[yellow]No practice logs older than {older_than} days to pack.[/yellow]")
+        return
+    console.print(
+        f"[bold green]✓ Packed {result['logs']} logs[/bold green] "
+        f"into {result['months']} monthly files "
+        f"[dim](02_Practice_Logs/YYYY-MM__practice-logs.md)[/dim]"
+    )
+
 
 if __name__ == "__main__":
     import sys
@@ -29,6 +29,25 @@ class Config:
                 "provider": "gemini",
                 "model": "gemini-2.5-flash",
                 "temperature": 0.3,
+                "chunk_token_budget": 60000,
+                "compact_transcripts": True,
+                "compact_window_seconds": 45,
+            },
+            "attachments": {
+                # none, gzip or zstd (zstd needs the 'zstandard' package)
+                "compression": "none",
+            },
+            "ingest": {
+                # What to do with near-duplicate sources: warn, skip or off
+                "near_duplicate": "warn",
+                # Max SimHash bit distance (values above 3 may miss matches)
+                "near_duplicate_distance": 3,
+            },
+            "scheduler": {
+                # ladder (fixed 7/21/60/90 days), sm2 or fsrs
+                "algorithm": "ladder",
+                # Target recall probability when a drill comes due
+                "retention": 0.9,
             },
             "defaults": {
                 "timebox_min": 10,
@@ -1,23 +1,26 @@
 """LLM-powered drill generation from source content."""
 
+import contextvars
 import json
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 from google import genai
 from google.genai import types
 
+from .gemini import call_with_retry, get_client, stream_with_retry
+from .telemetry import paused, record_usage, tag, track_call
+from .transcript import DEFAULT_WINDOW_SECONDS, TIMESTAMP_LINE_RE, compact_transcript
 
-def get_client() -> genai.Client:
-    """Initialize and return the Gen AI client."""
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError(
-            "GEMINI_API_KEY not found in environment. "
-            "Create a .env file with your API key."
-        )
-    return genai.Client(api_key=api_key)
+# Map-reduce distillation kicks in above this estimated prompt size
+DEFAULT_CHUNK_TOKEN_BUDGET = 60000
+# Fallback window for transcripts without chapter markers
+CHUNK_WINDOW_MINUTES = 15
+MAX_PARALLEL_CHUNKS = 4
+MAX_MERGED_DRILLS = 10
+
+INSIGHTS_CACHE_FILE_NAME = "insights_cache.json"
 
 
 def load_source_content(vault_path: Path, source_id: str) -> tuple[str, dict]:
@@ -44,35 +47,38 @@ def load_source_content(vault_path: Path, source_id: str) -> tuple[str, dict]:
     if not source_note:
         raise ValueError(f"Source note with ID {source_id} not found")
 
-    # Parse frontmatter
+    # Parse frontmatter (YAML keeps nested video_metadata such as chapters intact)
     content = source_note.read_text(encoding="utf-8")
-    lines = content.split("\n")
-
-    metadata = {}
-    in_frontmatter = False
-    for line in lines:
-        if line.strip() == "---":
-            if not in_frontmatter:
-                in_frontmatter = True
-            else:
-                break
-        elif in_frontmatter and ":" in line:
-            key, value = line.split(":", 1)
-            metadata[key.strip()] = value.strip()
+    try:
+        from .trainer import parse_frontmatter
+        metadata, _ = parse_frontmatter(content)
+    except Exception:
+        metadata = {}
+
+    if not metadata:
+        # Fallback: flat key/value scan for notes with malformed YAML
+        in_frontmatter = False
+        for line in content.split("\n"):
+            if line.strip() == "---":
+                if not in_frontmatter:
+                    in_frontmatter = True
+                else:
+                    break
+            elif in_frontmatter and ":" in line:
+                key, value = line.split(":", 1)
+                metadata[key.strip()] = value.strip()
 
     # Load full content from attachment
-    transcript_path = metadata.get("transcript_path", "")
+    transcript_path = str(metadata.get("transcript_path") or "")
     if transcript_path:
-        # Handle relative paths properly
-        if transcript_path.startswith("/") or transcript_path.startswith("\\"):
-             transcript_path = transcript_path.lstrip("/\\")
+        # Plain or compressed attachments are read transparently
+        from .attachments import read_attachment
 
-        full_content_path = vault_path / transcript_path
-        if full_content_path.exists():
-            full_content = full_content_path.read_text(encoding="utf-8")
-        else:
+        full_content = read_attachment(vault_path, transcript_path)
+        if full_content is None:
             # Fallback to note content but warn
-            print(f"[WARN] Transcript not found at {full_content_path}, using note content.")
+            missing = vault_path / transcript_path.lstrip("/")
+            print(f"[WARN] Transcript not found at {missing}, using note content.")
             full_content = content
     else:
         full_content = content
@@ -99,16 +105,29 @@ def distill_drills(
     Returns:
         List of drill dictionaries with structure matching create_drill_note
     """
-    client = get_client()
+    return list(stream_drills(source_content, source_metadata, model_name, existing_context))
 
-    # Prepare prompt
-    # Prepare prompt
+
+def build_distill_prompt(
+    source_content: str, source_metadata: dict, existing_context: str = ""
+) -> str:
+    """Build the drill extraction prompt for a source."""
     metadata_text = ""
     if source_metadata:
         import yaml
         metadata_text = yaml.dump(source_metadata, sort_keys=False)
+    chapters_hint = ""
+    if get_chapters(source_metadata):
+        chapters_hint = (
+            "**Hint:** Use the provided chapters (if available) to organize drills by key topics."
+        )
+
+    intro = (
+        "You are an expert learning designer creating practice drills "
+        "from educational content."
+    )
 
-    prompt = f"""You are an expert learning designer creating practice drills from educational content.
+    return f"""{intro}
 
 **Source Metadata:**
 {metadata_text}
@@ -131,7 +150,7 @@ For each drill:
 4. Be trainer-first: emphasize DOING, not just reading
 5. **Reference specific timestamps** where the concept is explained (e.g., "See 12:45")
 
-{f"**Hint:** Use the provided chapters (if available) to organize drills by key topics." if source_metadata.get('chapters') else ""}
+{chapters_hint}
 
 **Output Format (JSON):**
 Return a JSON array of drill objects. Each drill must have:
@@ -154,69 +173,391 @@ Return a JSON array of drill objects. Each drill must have:
 
 Generate the drill proposal list now:"""
 
+
+class DrillStreamParser:
+    """Incremental JSON array parser for streamed drill responses.
+
+    Feed text fragments as they arrive; every top-level object of the array
+    is returned as soon as its closing brace is seen. Leading markdown fences
+    and anything after the closing bracket are ignored, so a truncated stream
+    keeps every drill that was completed before the cut.
+    """
+
+    def __init__(self):
+        self.started = False
+        self.finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._buffer: list[str] = []
+
+    @property
+    def truncated(self) -> bool:
+        """True if the array was opened but never closed."""
+        return self.started and not self.finished
+
+    def feed(self, text: str) -> list[dict]:
+        """Consume a fragment and return the objects it completed."""
+        completed = []
+        for ch in text:
+            if self.finished:
+                break
+            if not self.started:
+                # Skip fences / preamble until the array opens
+                if ch == "[":
+                    self.started = True
+                continue
+            if self._depth == 0:
+                # Between elements: only care about object starts and the array end
+                if ch == "{":
+                    self._depth = 1
+                    self._buffer = [ch]
+                elif ch == "]":
+                    self.finished = True
+                continue
+
+            self._buffer.append(ch)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        obj = json.loads("".join(self._buffer))
+                    except json.JSONDecodeError:
+                        obj = None
+                    self._buffer = []
+                    if isinstance(obj, dict):
+                        completed.append(obj)
+        return completed
+
+
+def stream_drills(
+    source_content: str,
+    source_metadata: dict,
+    model_name: str = "gemini-1.5-flash",
+    existing_context: str = "",
+) -> Iterator[dict]:
+    """Stream drills from Gemini, yielding each one as soon as it is complete.
+
+    Args:
+        source_content: Full source text
+        source_metadata: Source metadata (url, kind, etc)
+        model_name: Gemini model to use
+        existing_context: String summarizing user's known concepts
+
+    Yields:
+        Drill dictionaries with structure matching create_drill_note
+    """
+    client = get_client()
+    prompt = build_distill_prompt(source_content, source_metadata, existing_context)
+
+    parser = DrillStreamParser()
+    preview = ""
+    count = 0
+
     # Call Gemini (1M token window allows full transcripts)
-    try:
-        response = client.models.generate_content(
-            model=model_name,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.7,
-                top_p=0.95,
-                top_k=40,
-                max_output_tokens=8192,
-                response_mime_type='application/json',
-            ),
+    with track_call("distill", model_name, input_chars=len(prompt)) as call:
+        try:
+            # Retries (429/5xx) only happen before the first chunk arrives
+            stream = stream_with_retry(
+                lambda: client.models.generate_content_stream(
+                    model=model_name,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        temperature=0.7,
+                        top_p=0.95,
+                        top_k=40,
+                        max_output_tokens=8192,
+                        response_mime_type='application/json',
+                    ),
+                ),
+                est_tokens=estimate_tokens(prompt),
+                call=call,
+            )
+            for chunk in stream:
+                record_usage(call, chunk)
+                text = chunk.text or ""
+                if len(preview) < 500:
+                    preview += text[:500 - len(preview)]
+                for drill in parser.feed(text):
+                    count += 1
+                    # The consumer's time (writing notes, rendering) isn't API latency
+                    with paused(call):
+                        yield drill
+                if parser.finished:
+                    break
+        except genai.errors.ClientError as e:
+            print(f"\n[ERROR] Gemini API Refused: {e}")
+            print(f"Model used: {model_name}")
+            print(
+                "Note: If you get a 404, the model might not be enabled "
+                "for your API key's project or region."
+            )
+            raise
+
+        if not parser.started:
+            raise ValueError(f"Failed to parse Gemini response as a JSON array.\n\n{preview}...")
+        if parser.truncated:
+            call["outcome"] = "truncated"
+            print(f"[INFO] Response was truncated; kept {count} complete drills.")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token for Gemini models)."""
+    return len(text) // 4
+
+
+def get_chapters(source_metadata: dict) -> list[dict]:
+    """Return chapter markers from source metadata, if any."""
+    if not isinstance(source_metadata, dict):
+        return []
+    chapters = source_metadata.get("chapters")
+    if not chapters and isinstance(source_metadata.get("video_metadata"), dict):
+        chapters = source_metadata["video_metadata"].get("chapters")
+    return chapters if isinstance(chapters, list) else []
+
+
+def compact_source(
+    source_content: str,
+    source_metadata: dict,
+    window_seconds: int = DEFAULT_WINDOW_SECONDS,
+) -> str:
+    """Compact a caption transcript for prompting and report the token savings.
+
+    The raw attachment on disk is left untouched; only the prompt text shrinks.
+    """
+    compact, stats = compact_transcript(
+        source_content, get_chapters(source_metadata), window_seconds
+    )
+    if stats["fragments"] and stats["raw_tokens"]:
+        saved_pct = (stats["raw_tokens"] - stats["compact_tokens"]) / stats["raw_tokens"] * 100
+        print(
+            f"[INFO] Compacted transcript: {stats['fragments']} fragments -> "
+            f"{stats['paragraphs']} paragraphs, ~{stats['raw_tokens']:,} -> "
+            f"~{stats['compact_tokens']:,} tokens (-{saved_pct:.0f}%)"
         )
-    except genai.errors.ClientError as e:
-        print(f"\n[ERROR] Gemini API Refused: {e}")
-        print(f"Model used: {model_name}")
-        print("Note: If you get a 404, the model might not be enabled for your API key's project or region.")
-        raise
+    return compact
 
-    # Parse JSON response
-    response_text = response.text.strip()
 
-    # Remove markdown code fences if present
-    if response_text.startswith("```json"):
-        response_text = response_text[7:]
-    if response_text.startswith("```"):
-        response_text = response_text[3:]
-    if response_text.endswith("```"):
-        response_text = response_text[:-3]
+def split_transcript(
+    content: str,
+    chapters: Optional[list[dict]] = None,
+    token_budget: int = DEFAULT_CHUNK_TOKEN_BUDGET,
+    window_minutes: int = CHUNK_WINDOW_MINUTES,
+) -> list[dict]:
+    """Split a transcript into chunks that each fit the token budget.
 
-    response_text = response_text.strip()
+    Segments follow chapter boundaries when available, otherwise fixed
+    timestamp windows. Consecutive small segments are packed together and
+    oversized segments are split on line boundaries.
 
-    try:
-        drills = json.loads(response_text)
-    except json.JSONDecodeError:
-        # SALVAGE LOGIC: Try to recover complete drills from a truncated array
+    Args:
+        content: Transcript text (``[MM:SS] text`` lines or plain text)
+        chapters: Optional list of ``{"timestamp", "title"}`` dicts
+        token_budget: Maximum estimated tokens per chunk
+        window_minutes: Window size when no chapters are available
+
+    Returns:
+        List of chunk dicts with ``title``, ``start`` and ``text`` keys
+    """
+    from .ingestor import parse_timestamp
+
+    # Chapter starts in seconds, sorted
+    boundaries = []
+    for chapter in chapters or []:
         try:
-            # 1. Try to find the last occurrence of a closing brace for an object in the array
-            # We look for "}," followed by anything or just "}" at the end of a mostly complete array
-            last_valid_object = response_text.rfind("},")
-            if last_valid_object == -1:
-                # Try finding just a closing brace if it's the very last one
-                last_valid_object = response_text.rfind("}")
-            
-            if last_valid_object != -1:
-                # Cut the string at the end of the last complete object
-                salvaged_text = response_text[:last_valid_object + 1]
-                # Ensure it's a valid array
-                if salvaged_text.startswith("["):
-                    salvaged_text += "]"
-                elif not salvaged_text.startswith("[") and "[" in response_text:
-                    # In case the start was also messy
-                    salvaged_text = "[" + salvaged_text + "]"
-                
-                drills = json.loads(salvaged_text)
-                print(f"[INFO] Salvaged {len(drills)} drills from truncated response.")
+            start = parse_timestamp(chapter["timestamp"])
+            boundaries.append((start, str(chapter.get("title", ""))))
+        except (KeyError, TypeError, ValueError):
+            continue
+    boundaries.sort()
+
+    # 1. Group lines into segments
+    segments = []
+    current = {"title": "", "start": "", "lines": []}
+    chapter_idx = -1
+    window_idx = -1
+    for line in content.splitlines():
+        match = TIMESTAMP_LINE_RE.match(line)
+        if match:
+            seconds = parse_timestamp(match.group(1))
+            if boundaries:
+                idx = chapter_idx
+                while idx + 1 < len(boundaries) and boundaries[idx + 1][0] <= seconds:
+                    idx += 1
+                if idx != chapter_idx:
+                    chapter_idx = idx
+                    if current["lines"]:
+                        segments.append(current)
+                    current = {"title": boundaries[idx][1], "start": match.group(1), "lines": []}
             else:
-                raise ValueError(f"Failed to parse or salvage Gemini response as JSON.\n\n{response_text[:500]}...")
-        except Exception as e_inner:
-             raise ValueError(f"Failed to parse Gemini response as JSON and salvage failed: {e_inner}\n\n{response_text[:500]}...")
+                idx = seconds // (window_minutes * 60)
+                if idx != window_idx:
+                    window_idx = idx
+                    if current["lines"]:
+                        segments.append(current)
+                    current = {"title": "", "start": match.group(1), "lines": []}
+        current["lines"].append(line)
+    if current["lines"]:
+        segments.append(current)
+
+    # 2. Hard-split segments that exceed the budget on their own
+    char_budget = max(token_budget * 4, 1)
+    pieces = []
+    for segment in segments:
+        text = "\n".join(segment["lines"])
+        if len(text) <= char_budget:
+            pieces.append({"title": segment["title"], "start": segment["start"], "text": text})
+            continue
+        meta = {"title": segment["title"], "start": segment["start"]}
+        buffer, size = [], 0
+        for line in segment["lines"]:
+            if buffer and size + len(line) + 1 > char_budget:
+                pieces.append({**meta, "text": "\n".join(buffer)})
+                buffer, size = [], 0
+            buffer.append(line)
+            size += len(line) + 1
+        if buffer:
+            pieces.append({**meta, "text": "\n".join(buffer)})
+
+    # 3. Pack consecutive pieces up to the budget
+    chunks = []
+    for piece in pieces:
+        if chunks and len(chunks[-1]["text"]) + len(piece["text"]) + 1 <= char_budget:
+            last = chunks[-1]
+            last["text"] += "\n" + piece["text"]
+            if piece["title"] and piece["title"] not in last["title"]:
+                if last["title"]:
+                    last["title"] = f"{last['title']} / {piece['title']}"
+                else:
+                    last["title"] = piece["title"]
+        else:
+            chunks.append(dict(piece))
+
+    return chunks
+
+
+def merge_drills(drill_lists: list[list[dict]], max_drills: int = MAX_MERGED_DRILLS) -> list[dict]:
+    """Reduce step: merge per-chunk drills and drop near-identical titles.
+
+    Drills whose titles share most of their words are treated as duplicates;
+    the one with the higher confidence_score wins. The result is ordered by
+    confidence and capped at ``max_drills``.
+    """
+    from .ingestor import slugify
+
+    def title_words(drill: dict) -> set[str]:
+        return {w for w in slugify(drill.get("title", "")).split("-") if len(w) > 2}
+
+    def confidence(drill: dict) -> int:
+        try:
+            return int(drill.get("confidence_score", 3))
+        except (TypeError, ValueError):
+            return 3
+
+    merged: list[dict] = []
+    for drills in drill_lists:
+        for drill in drills:
+            if not isinstance(drill, dict) or not drill.get("title"):
+                continue
+            words = title_words(drill)
+            duplicate_idx = None
+            for idx, kept in enumerate(merged):
+                kept_words = title_words(kept)
+                union = words | kept_words
+                if union and len(words & kept_words) / len(union) >= 0.6:
+                    duplicate_idx = idx
+                    break
+            if duplicate_idx is None:
+                merged.append(drill)
+            elif confidence(drill) > confidence(merged[duplicate_idx]):
+                merged[duplicate_idx] = drill
+
+    # Stable sort keeps source order among equal confidence
+    merged.sort(key=confidence, reverse=True)
+    return merged[:max_drills]
+
+
+def distill_drills_chunked(
+    source_content: str,
+    source_metadata: dict,
+    model_name: str = "gemini-1.5-flash",
+    existing_context: str = "",
+    token_budget: int = DEFAULT_CHUNK_TOKEN_BUDGET,
+    max_workers: int = MAX_PARALLEL_CHUNKS,
+) -> list[dict]:
+    """Map-reduce distillation for long sources.
+
+    Splits the transcript along chapters/timestamp windows, distills each
+    chunk in parallel, then merges and dedups the candidate drills locally.
+    """
+    chunks = split_transcript(source_content, get_chapters(source_metadata), token_budget)
+    print(f"[INFO] Long source: distilling {len(chunks)} chunks in parallel.")
+
+    def distill_chunk(chunk: dict) -> list[dict]:
+        chunk_metadata = dict(source_metadata or {})
+        chunk_metadata["chunk"] = {
+            "start": chunk["start"],
+            "chapter": chunk["title"],
+        }
+        try:
+            return distill_drills(chunk["text"], chunk_metadata, model_name, existing_context)
+        except ValueError as e:
+            # One unparseable chunk should not sink the whole source
+            print(f"[WARN] Skipping chunk at {chunk['start'] or 'start'}: {e}")
+            return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as pool:
+        # Copy the context per chunk so telemetry tags follow into worker threads
+        futures = [pool.submit(contextvars.copy_context().run, distill_chunk, c) for c in chunks]
+        results = [f.result() for f in futures]
+
+    return merge_drills(results)
+
+
+def distill_source(
+    source_content: str,
+    source_metadata: dict,
+    model_name: str = "gemini-1.5-flash",
+    existing_context: str = "",
+    token_budget: int = DEFAULT_CHUNK_TOKEN_BUDGET,
+) -> list[dict]:
+    """Distill drills, switching to map-reduce above the token budget."""
+    if token_budget and estimate_tokens(source_content) > token_budget:
+        return distill_drills_chunked(
+            source_content, source_metadata, model_name, existing_context, token_budget
+        )
+    return distill_drills(source_content, source_metadata, model_name, existing_context)
 
-    return drills
 
+def iter_source_drills(
+    source_content: str,
+    source_metadata: dict,
+    model_name: str = "gemini-1.5-flash",
+    existing_context: str = "",
+    token_budget: int = DEFAULT_CHUNK_TOKEN_BUDGET,
+) -> Iterator[dict]:
+    """Streaming counterpart of distill_source.
+
+    Sources that fit one prompt yield drills while Gemini is still
+    generating; long sources yield the merged map-reduce result.
+    """
+    if token_budget and estimate_tokens(source_content) > token_budget:
+        yield from distill_drills_chunked(
+            source_content, source_metadata, model_name, existing_context, token_budget
+        )
+    else:
+        yield from stream_drills(source_content, source_metadata, model_name, existing_context)
 
 
 def get_existing_context(vault_path: Path, query_text: str = "") -> str:
@@ -239,7 +580,12 @@ def get_existing_context(vault_path: Path, query_text: str = "") -> str:
         # But we can try to index blindly? No, distracting.
         # Just use what we have.
         
-        similar_items = index.find_similar(query=query_text, limit=10, threshold=0.6)
+        try:
+            similar_items = index.find_similar(query=query_text, limit=10, threshold=0.6)
+        except Exception as e:
+            # Context is a nice-to-have; never block distillation on the embedding call
+            print(f"[WARN] Semantic context unavailable: {e}")
+            similar_items = []
         
         if similar_items:
             context_lines.append("RELATED EXISTING CONTENT (DO NOT DUPLICATE):")
@@ -273,88 +619,113 @@ def create_drills_from_source(
     source_id: str,
     num_drills: int = 3,
     model_name: str = "gemini-1.5-flash",
+    on_drill: Optional[Callable[[Path], None]] = None,
 ) -> list[Path]:
     """Load source, distill drills with LLM, and create drill notes.
 
+    Drills are streamed: each note is written as soon as Gemini finishes
+    generating it, while the rest of the response is still arriving.
+
     Args:
         vault_path: Path to vault
         source_id: Source note ID
         num_drills: Number of drills to generate
         model_name: Gemini model to use
+        on_drill: Optional callback invoked with each drill path as it is written
 
     Returns:
         List of paths to created drill notes
     """
-    from .writer import create_drill_note
+    from .config import Config
+    from .writer import create_drill_notes
 
-    # Load source
+    llm_config = Config(vault_path).config.get("llm", {})
+
+    # Load source (compacted for the prompt; the raw attachment stays on disk)
     source_content, source_metadata = load_source_content(vault_path, source_id)
-    
+    if llm_config.get("compact_transcripts", True):
+        source_content = compact_source(
+            source_content,
+            source_metadata,
+            llm_config.get("compact_window_seconds", DEFAULT_WINDOW_SECONDS),
+        )
+
     # Get existing context to avoid duplicates
     # Use first 2000 chars of source content for semantic query to save tokens/time
     query_preview = source_content[:2000] if source_content else ""
     existing_context = get_existing_context(vault_path, query_text=query_preview)
 
-    # Distill drills
-    drill_data = distill_drills(
-        source_content, 
-        source_metadata, 
+    # Distill drills (map-reduce for long sources)
+    drill_stream = iter_source_drills(
+        source_content,
+        source_metadata,
         model_name,
-        existing_context=existing_context
+        existing_context=existing_context,
+        token_budget=llm_config.get("chunk_token_budget", DEFAULT_CHUNK_TOKEN_BUDGET),
     )
 
-    # Create drill notes
-    created_drills = []
-    for drill in drill_data:
-        drill_path = create_drill_note(
-            vault_path=vault_path,
-            title=drill["title"],
-            pattern=drill.get("pattern", []),
-            drill_goal=drill.get("drill_goal", ""),
-            drill_steps=drill.get("drill_steps", []),
-            validation=drill.get("validation", []),
-            snippet_type=drill.get("snippet_type", "code"),
-            snippet_content=drill.get("snippet_content", ""),
-            topics=drill.get("topics", []),
-            timebox_min=drill.get("timebox_min", 10),
-            source_id=source_id,
+    # Create drill notes as they arrive, behind one durability barrier for
+    # the whole source (also on a mid-stream error)
+    with tag(source=source_id):
+        created_drills = create_drill_notes(
+            vault_path, drill_stream, source_id=source_id, on_drill=on_drill
         )
-        created_drills.append(drill_path)
 
     return created_drills
 
 
-def analyze_insights(vault_path: Path, model_name: str = "gemini-3-flash-preview") -> str:
-    """Use Gemini to analyze practice logs and mastery notes for insights."""
-    client = get_client()
+def analyze_insights(
+    vault_path: Path,
+    model_name: str = "gemini-3-flash-preview",
+    refresh: bool = False,
+) -> str:
+    """Use Gemini to analyze practice logs and mastery notes for insights.
+
+    The prompt is built from incremental practice rollups (see rollups.py),
+    and the briefing is cached against a fingerprint of the vault state, so
+    repeated runs without new practice return instantly.
+
+    Args:
+        vault_path: Path to vault
+        model_name: Gemini model to use
+        refresh: Ignore the cached briefing and ask Gemini again
+    """
+    from .cache import fingerprint, listing_fingerprint, load_json, save_json
+    from .rollups import format_rollup, update_practice_rollup
 
     # 1. Gather context
     mastery_path = vault_path / "10_Mastery"
-    logs_path = vault_path / "02_Practice_Logs"
-    
+
     mastery_titles = []
     if mastery_path.exists():
-        mastery_titles = [f.stem.replace("MASTERY__", "") for f in mastery_path.glob("*.md")]
-    
-    recent_logs = []
-    if logs_path.exists():
-        # Get last 20 logs for context
-        log_files = sorted(list(logs_path.glob("*.md")), reverse=True)[:20]
-        for lf in log_files:
-            content = lf.read_text(encoding="utf-8")
-            # Extract result and description/notes
-            recent_logs.append(content[:500]) # Snippet is enough
-
-    if not mastery_titles and not recent_logs:
+        mastery_files = sorted(
+            mastery_path.glob("*.md"), key=lambda f: f.stat().st_mtime, reverse=True
+        )
+        mastery_titles = [f.stem.replace("MASTERY__", "") for f in mastery_files]
+
+    rollup = update_practice_rollup(vault_path)
+
+    if not mastery_titles and not rollup["totals"]["logs"]:
         return "Not enough data yet. Complete some drills to get insights!"
 
-    prompt = f"""You are a high-level learning coach. Analyze the user's progress in their "Vibe-Dojo" vault.
+    # 2. Serve the cached briefing if nothing changed since it was generated
+    state = fingerprint(
+        model_name,
+        rollup["processed"],
+        listing_fingerprint(mastery_path),
+    )
+    cached = load_json(vault_path, INSIGHTS_CACHE_FILE_NAME, {})
+    if not refresh and cached.get("fingerprint") == state and cached.get("text"):
+        with track_call("insights", model_name) as call:
+            call["cache_hit"] = True
+        return cached["text"]
 
-**Mastery Notes (What they know):**
-{", ".join(mastery_titles)}
+    client = get_client()
+
+    prompt = f"""You are a high-level learning coach. Analyze the user's progress in their "Vibe-Dojo" vault.
 
-**Recent Practice Logs (What they've been doing):**
-{"".join(recent_logs)}
+**Practice Summary (What they've been doing):**
+{format_rollup(rollup, mastery_titles)}
 
 ---
 **Your Task:**
@@ -367,12 +738,20 @@ Provide a concise, motivating "Coach's Briefing" (max 300 words).
 Format with bullet points and bold text for readability. No specific student name, just address "The Student".
 """
 
-    response = client.models.generate_content(
-        model=model_name,
-        contents=prompt,
-        config=types.GenerateContentConfig(
-            temperature=0.7,
-        ),
-    )
+    with track_call("insights", model_name, input_chars=len(prompt)) as call:
+        response = call_with_retry(
+            lambda: client.models.generate_content(
+                model=model_name,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.7,
+                ),
+            ),
+            est_tokens=estimate_tokens(prompt),
+            call=call,
+        )
+        record_usage(call, response)
 
-    return response.text.strip()
+    text = response.text.strip()
+    save_json(vault_path, INSIGHTS_CACHE_FILE_NAME, {"fingerprint": state, "text": text})
+    return text
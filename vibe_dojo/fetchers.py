@@ -0,0 +1,159 @@
+"""Source fetcher registry: URL matching, lazy backend loading, per-fetcher policy."""
+
+import importlib
+import re
+import threading
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+ENTRY_POINT_GROUP = "vibe_dojo.fetchers"
+URL_RE = re.compile(r"^(?:https?|file)://", re.IGNORECASE)
+
+
+class Fetcher:
+    """A registered source backend.
+
+    The backend function is named by ``loader`` ("module:function") and only
+    imported the first time a URL selects this fetcher.
+
+    Args:
+        name: Registry key
+        kind: ``source_kind`` written to the source note
+        loader: "module:function" returning (content, fetch_method, metadata)
+        domains: Hosts handled (subdomains included)
+        schemes: URL schemes handled (default http/https)
+        match: Extra predicate on the URL, checked after domains/schemes
+        max_concurrency: Fetches of this kind allowed in flight at once
+        cache_max_age: Seconds the HTTP cache may serve a response without
+            revalidating; None if the backend doesn't use the HTTP cache
+    """
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        loader: str,
+        domains: tuple[str, ...] = (),
+        schemes: tuple[str, ...] = ("http", "https"),
+        match: Optional[Callable[[str], bool]] = None,
+        max_concurrency: int = 4,
+        cache_max_age: Optional[float] = None,
+    ):
+        self.name = name
+        self.kind = kind
+        self.loader = loader
+        self.domains = domains
+        self.schemes = schemes
+        self.match = match
+        self.max_concurrency = max_concurrency
+        self.cache_max_age = cache_max_age
+        self._fn: Optional[Callable] = None
+        self._limit = threading.BoundedSemaphore(max_concurrency)
+
+    def __repr__(self) -> str:
+        return f"Fetcher({self.name!r})"
+
+    def matches(self, url: str) -> bool:
+        parts = urlsplit(url)
+        if (parts.scheme or "").lower() not in self.schemes:
+            return False
+        if self.domains:
+            host = (parts.hostname or "").lower()
+            if not any(host == d or host.endswith("." + d) for d in self.domains):
+                return False
+        return self.match(url) if self.match else True
+
+    def load(self) -> Callable:
+        """Import the backend function (once)."""
+        if self._fn is None:
+            module_name, _, attr = self.loader.partition(":")
+            self._fn = getattr(importlib.import_module(module_name), attr)
+        return self._fn
+
+    def fetch(self, url: str, **kwargs) -> tuple:
+        """Fetch within this backend's concurrency limit and cache policy."""
+        fn = self.load()
+        if self.cache_max_age is not None:
+            kwargs.setdefault("max_age", self.cache_max_age)
+        with self._limit:
+            return fn(url, **kwargs)
+
+
+def _is_pdf_target(url: str) -> bool:
+    from .local_fetchers import file_url_to_path
+
+    path = file_url_to_path(url)
+    return path.suffix.lower() == ".pdf" or path.is_dir()
+
+
+# Checked in order; the article fetcher is the http(s) catch-all and stays last
+FETCHERS: list[Fetcher] = [
+    Fetcher(
+        "youtube", "youtube", "vibe_dojo.ingestor:fetch_youtube_transcript",
+        domains=("youtube.com", "youtu.be", "youtube-nocookie.com"),
+        max_concurrency=4,
+    ),
+    Fetcher(
+        "reddit", "reddit", "vibe_dojo.ingestor:fetch_reddit_content",
+        domains=("reddit.com",),
+        max_concurrency=2,
+        cache_max_age=15 * 60,
+    ),
+    Fetcher(
+        "pdf", "pdf", "vibe_dojo.local_fetchers:fetch_pdf",
+        schemes=("file",), match=_is_pdf_target,
+        max_concurrency=2,
+    ),
+    Fetcher(
+        "local", "local", "vibe_dojo.local_fetchers:fetch_local_file",
+        schemes=("file",),
+        max_concurrency=8,
+    ),
+    Fetcher(
+        "article", "blog", "vibe_dojo.ingestor:fetch_article",
+        max_concurrency=8,
+        cache_max_age=24 * 60 * 60,
+    ),
+]
+
+_registry_lock = threading.Lock()
+_entry_points_loaded = False
+
+
+def register_fetcher(fetcher: Fetcher) -> None:
+    """Add a fetcher ahead of the catch-all article fetcher (replacing one with the same name)."""
+    with _registry_lock:
+        FETCHERS[:] = [f for f in FETCHERS if f.name != fetcher.name]
+        FETCHERS.insert(max(0, len(FETCHERS) - 1), fetcher)
+
+
+def _load_entry_points() -> None:
+    """Register fetchers published by installed packages under ``vibe_dojo.fetchers``."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            loaded = entry_point.load()
+        except Exception as e:
+            print(f"[WARN] Could not load fetcher plugin '{entry_point.name}': {e}")
+            continue
+        for fetcher in loaded if isinstance(loaded, (list, tuple)) else [loaded]:
+            register_fetcher(fetcher)
+
+
+def is_url(entry: str) -> bool:
+    """True if ``entry`` is something a fetcher can handle rather than plain text."""
+    return bool(URL_RE.match(entry.strip()))
+
+
+def get_fetcher(url: str) -> Fetcher:
+    """The first registered fetcher that matches ``url``."""
+    _load_entry_points()
+    for fetcher in FETCHERS:
+        if fetcher.matches(url):
+            return fetcher
+    raise ValueError(f"No fetcher registered for {url}")
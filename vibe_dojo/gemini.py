@@ -0,0 +1,370 @@
+"""Shared Gemini client and call layer: connection pooling, rate limiting, retries."""
+
+import os
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Iterable, Iterator, Optional, TypeVar
+
+from google import genai
+from google.genai import types
+
+T = TypeVar("T")
+
+# Defaults are conservative paid-tier limits; override via .env
+DEFAULT_RPM = 60
+DEFAULT_TPM = 1_000_000
+MAX_RETRIES = 5
+BACKOFF_BASE_S = 1.0
+BACKOFF_CAP_S = 60.0
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN_S = 30.0
+# A caller sleeps through an open breaker only if it is about to half-open;
+# anything longer fails fast with CircuitOpenError
+BREAKER_MAX_WAIT_S = 5.0
+
+# Connection pool for the shared client
+POOL_MAX_CONNECTIONS = 20
+POOL_MAX_KEEPALIVE = 10
+KEEPALIVE_EXPIRY_S = 60.0
+REQUEST_TIMEOUT_MS = 600_000
+
+_client: Optional[genai.Client] = None
+_client_lock = threading.Lock()
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when the circuit breaker rejects a call."""
+
+
+def _http_options() -> types.HttpOptions:
+    """HTTP settings for the shared client: pooled keep-alive connections."""
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=POOL_MAX_KEEPALIVE,
+        keepalive_expiry=KEEPALIVE_EXPIRY_S,
+    )
+    return types.HttpOptions(
+        timeout=REQUEST_TIMEOUT_MS,
+        client_args={"limits": limits},
+        async_client_args={"limits": limits},
+    )
+
+
+def get_client() -> genai.Client:
+    """Return the process-wide Gen AI client, creating it on first use.
+
+    The distiller, SemanticIndex and insights all share this client, so one
+    command reuses a single pool of keep-alive connections instead of
+    paying a fresh TLS handshake per call.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                api_key = os.getenv("GEMINI_API_KEY")
+                if not api_key:
+                    raise ValueError(
+                        "GEMINI_API_KEY not found in environment. "
+                        "Create a .env file with your API key."
+                    )
+                _client = genai.Client(api_key=api_key, http_options=_http_options())
+    return _client
+
+
+def get_async_client():
+    """Async interface (``client.aio``) of the shared client for concurrent callers."""
+    return get_client().aio
+
+
+def reset_client() -> None:
+    """Close and drop the shared client (e.g. after the API key changed)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            try:
+                _client.close()
+            except Exception:
+                pass
+        _client = None
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``rate_per_min``."""
+
+    def __init__(self, rate_per_min: float, capacity: Optional[float] = None):
+        self.rate = rate_per_min / 60.0
+        self.capacity = capacity or rate_per_min
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens and return how long the caller must wait.
+
+        Tokens may go negative so concurrent callers queue up fairly instead
+        of all waking at the same moment.
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            self._refill()
+            self.tokens -= amount
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """Block until ``amount`` tokens are available."""
+        wait = self.reserve(amount)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """Requests-per-minute plus tokens-per-minute limiter."""
+
+    def __init__(self, rpm: float = DEFAULT_RPM, tpm: float = DEFAULT_TPM):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+
+    def acquire(self, est_tokens: int = 0) -> None:
+        wait = max(self.requests.reserve(1), self.tokens.reserve(est_tokens) if est_tokens else 0.0)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures and rejects calls until a cooldown passes.
+
+    After the cooldown a single trial call is let through (half-open) while
+    other callers keep being rejected; its success closes the breaker, a
+    failure re-opens it for another cooldown. A trial that never reports
+    back stops blocking others after one cooldown.
+    """
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN_S):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def remaining(self) -> float:
+        """Seconds until the breaker lets a trial call through."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+    def before_call(self) -> None:
+        """Admit a call, or raise CircuitOpenError if the breaker rejects it."""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return
+            now = time.monotonic()
+            probe_running = self.probe_at is not None and now - self.probe_at < self.cooldown
+            if state == "half-open" and not probe_running:
+                self.probe_at = now
+                return
+        if state == "half-open":
+            reason = "a trial call is in progress"
+        else:
+            reason = f"retry in {self.remaining():.0f}s"
+        raise CircuitOpenError(
+            f"Gemini circuit breaker open after {self.failures} consecutive failures; {reason}"
+        )
+
+    def release(self) -> None:
+        """End a trial call that neither succeeded nor failed retryably."""
+        with self._lock:
+            self.probe_at = None
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probe_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.probe_at is not None or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+            self.probe_at = None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """True for rate limits (429), server errors (5xx) and transport failures."""
+    if isinstance(exc, genai.errors.APIError):
+        return exc.code == 429 or (exc.code or 0) >= 500
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    return type(exc).__module__.startswith("httpx")
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff."""
+    return random.uniform(0, min(BACKOFF_CAP_S, BACKOFF_BASE_S * 2 ** attempt))
+
+
+_limiter: Optional[RateLimiter] = None
+_breaker = CircuitBreaker()
+_setup_lock = threading.Lock()
+
+
+def get_limiter() -> RateLimiter:
+    """Process-wide limiter, sized from GEMINI_RPM / GEMINI_TPM if set."""
+    global _limiter
+    with _setup_lock:
+        if _limiter is None:
+            _limiter = RateLimiter(
+                rpm=float(os.getenv("GEMINI_RPM") or DEFAULT_RPM),
+                tpm=float(os.getenv("GEMINI_TPM") or DEFAULT_TPM),
+            )
+        return _limiter
+
+
+def get_breaker() -> CircuitBreaker:
+    return _breaker
+
+
+def _wait_for_breaker() -> None:
+    breaker = get_breaker()
+    if breaker.state == "open" and breaker.remaining() <= BREAKER_MAX_WAIT_S:
+        time.sleep(breaker.remaining())
+    breaker.before_call()
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    est_tokens: int = 0,
+    call: Optional[dict] = None,
+    max_retries: int = MAX_RETRIES,
+) -> T:
+    """Run one Gemini request through the limiter, breaker and retry policy.
+
+    Args:
+        fn: Zero-argument callable performing the request
+        est_tokens: Estimated prompt tokens, charged against the TPM bucket
+        call: Optional telemetry record; its ``retries`` count is updated
+        max_retries: Retries after the first attempt for retryable errors
+
+    Returns:
+        Whatever ``fn`` returns
+    """
+    breaker = get_breaker()
+    for attempt in range(max_retries + 1):
+        _wait_for_breaker()
+        get_limiter().acquire(est_tokens)
+        try:
+            result = fn()
+        except Exception as e:
+            if not is_retryable(e):
+                breaker.release()
+                raise
+            breaker.record_failure()
+            if attempt == max_retries:
+                raise
+            if call is not None:
+                call["retries"] = call.get("retries", 0) + 1
+            time.sleep(backoff_delay(attempt))
+            continue
+        breaker.record_success()
+        return result
+    raise AssertionError("unreachable")
+
+
+def stream_with_retry(
+    make_stream: Callable[[], Iterable[T]],
+    est_tokens: int = 0,
+    call: Optional[dict] = None,
+    max_retries: int = MAX_RETRIES,
+) -> Iterator[T]:
+    """Streaming variant of call_with_retry.
+
+    The request is retried only if it fails before the first chunk arrives;
+    once output has been yielded a failure propagates to the caller.
+    """
+    breaker = get_breaker()
+    for attempt in range(max_retries + 1):
+        _wait_for_breaker()
+        get_limiter().acquire(est_tokens)
+        started = False
+        try:
+            for chunk in make_stream():
+                if not started:
+                    started = True
+                    breaker.record_success()
+                yield chunk
+        except Exception as e:
+            if started:
+                raise
+            if not is_retryable(e):
+                breaker.release()
+                raise
+            breaker.record_failure()
+            if attempt == max_retries:
+                raise
+            if call is not None:
+                call["retries"] = call.get("retries", 0) + 1
+            time.sleep(backoff_delay(attempt))
+            continue
+        if not started:
+            breaker.record_success()
+        return
+
+
+async def acall_with_retry(
+    make_call: Callable[[], Awaitable[T]],
+    est_tokens: int = 0,
+    call: Optional[dict] = None,
+    max_retries: int = MAX_RETRIES,
+) -> T:
+    """Async variant of call_with_retry for ``get_async_client()`` requests.
+
+    Shares the process-wide limiter and breaker with synchronous callers.
+    """
+    import asyncio
+
+    breaker = get_breaker()
+    for attempt in range(max_retries + 1):
+        if breaker.state == "open" and breaker.remaining() <= BREAKER_MAX_WAIT_S:
+            await asyncio.sleep(breaker.remaining())
+        breaker.before_call()
+        limiter = get_limiter()
+        token_wait = limiter.tokens.reserve(est_tokens) if est_tokens else 0.0
+        wait = max(limiter.requests.reserve(1), token_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            result = await make_call()
+        except Exception as e:
+            if not is_retryable(e):
+                breaker.release()
+                raise
+            breaker.record_failure()
+            if attempt == max_retries:
+                raise
+            if call is not None:
+                call["retries"] = call.get("retries", 0) + 1
+            await asyncio.sleep(backoff_delay(attempt))
+            continue
+        breaker.record_success()
+        return result
+    raise AssertionError("unreachable")
@@ -0,0 +1,157 @@
+"""Shared HTTP layer for the ingestor: pooled sessions and an on-disk response cache."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+HTTP_CACHE_DIR = Path.home() / ".vibe_dojo_http_cache"
+USER_AGENT = "vibe-dojo/0.1.0"
+
+# (connect, read) seconds
+DEFAULT_TIMEOUT = (10.0, 30.0)
+# Cached responses younger than this are served without any request
+DEFAULT_MAX_AGE_S = 3600
+# Bodies above this size are fetched but not cached
+MAX_CACHED_BYTES = 20 * 1024 * 1024
+POOL_SIZE = 10
+
+_local = threading.local()
+
+
+def get_session():
+    """Per-thread ``requests.Session`` with keep-alive pooling and transport retries.
+
+    Sessions aren't guaranteed thread-safe, so each worker thread (e.g. in
+    ``ingest-batch``) gets its own, reused for every fetch on that thread.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+        )
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _local.session = session
+    return session
+
+
+def _cache_paths(url: str) -> tuple[Path, Path]:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return HTTP_CACHE_DIR / f"{key}.json", HTTP_CACHE_DIR / f"{key}.body"
+
+
+def _load_entry(url: str) -> Optional[tuple[dict, bytes]]:
+    meta_path, body_path = _cache_paths(url)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        body = body_path.read_bytes()
+    except (OSError, json.JSONDecodeError):
+        return None
+    if meta.get("url") != url:
+        return None
+    return meta, body
+
+
+def _replace(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _save_entry(url: str, meta: dict, body: Optional[bytes] = None) -> None:
+    meta_path, body_path = _cache_paths(url)
+    try:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if body is not None:
+            _replace(body_path, body)
+        _replace(meta_path, json.dumps(meta).encode("utf-8"))
+    except OSError:
+        # The cache is an optimization; never fail a fetch over it
+        pass
+
+
+def _cacheable(headers) -> bool:
+    cache_control = headers.get("Cache-Control", "").lower()
+    return "no-store" not in cache_control
+
+
+def cached_get(
+    url: str,
+    headers: Optional[dict] = None,
+    timeout: tuple[float, float] = DEFAULT_TIMEOUT,
+    max_age: float = DEFAULT_MAX_AGE_S,
+) -> dict:
+    """GET a URL through the shared session and the on-disk cache.
+
+    A cached response younger than ``max_age`` is returned without touching
+    the network. An older one is revalidated with If-None-Match /
+    If-Modified-Since, so an unchanged page costs a 304.
+
+    Args:
+        url: URL to fetch
+        headers: Extra request headers
+        timeout: (connect, read) timeout in seconds
+        max_age: Seconds a cached response is used without revalidation
+
+    Returns:
+        Dict with ``content`` (bytes), ``status``, ``headers``,
+        ``from_cache`` and ``revalidated``
+
+    Raises:
+        requests.HTTPError: For non-2xx responses
+    """
+    entry = _load_entry(url)
+    if entry:
+        meta, body = entry
+        if time.time() - meta["stored_at"] < max_age:
+            return {"content": body, "status": meta["status"], "headers": meta["headers"],
+                    "from_cache": True, "revalidated": False}
+
+    request_headers = dict(headers or {})
+    if entry:
+        if meta["headers"].get("ETag"):
+            request_headers["If-None-Match"] = meta["headers"]["ETag"]
+        if meta["headers"].get("Last-Modified"):
+            request_headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+
+    response = get_session().get(url, headers=request_headers, timeout=timeout)
+
+    if entry and response.status_code == 304:
+        meta["stored_at"] = time.time()
+        _save_entry(url, meta)
+        return {"content": body, "status": meta["status"], "headers": meta["headers"],
+                "from_cache": True, "revalidated": True}
+
+    response.raise_for_status()
+    kept_headers = {
+        name: response.headers[name]
+        for name in ("ETag", "Last-Modified", "Content-Type")
+        if name in response.headers
+    }
+    if _cacheable(response.headers) and len(response.content) <= MAX_CACHED_BYTES:
+        _save_entry(
+            url,
+            {
+                "url": url,
+                "status": response.status_code,
+                "headers": kept_headers,
+                "stored_at": time.time(),
+            },
+            response.content,
+        )
+    return {"content": response.content, "status": response.status_code, "headers": kept_headers,
+            "from_cache": False, "revalidated": False}
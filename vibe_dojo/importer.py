@@ -0,0 +1,190 @@
+"""Bulk import of an existing Markdown / Obsidian folder as source notes."""
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+IMPORT_SUFFIXES = {".md", ".markdown", ".txt"}
+# Obsidian/VCS internals and trash folders are never imported
+SKIP_DIRS = {".obsidian", ".git", ".trash", ".dojo_cache", "node_modules", "_attachments"}
+MAX_FILE_BYTES = 5 * 1024 * 1024
+DEFAULT_IMPORT_WORKERS = 8
+DEFAULT_BATCH_SIZE = 200
+# Reads queued per worker ahead of the writer
+READ_AHEAD = 4
+
+
+def iter_import_files(folder: Path) -> Iterator[Path]:
+    """Walk ``folder`` with scandir, yielding importable files in a stable order."""
+    try:
+        entries = sorted(os.scandir(folder), key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in SKIP_DIRS:
+                yield from iter_import_files(Path(entry.path))
+        elif entry.is_file() and Path(entry.name).suffix.lower() in IMPORT_SUFFIXES:
+            yield Path(entry.path)
+
+
+def read_import_file(path: Path, root: Path) -> Optional[dict]:
+    """Read one file into an import record (runs in a worker thread).
+
+    Returns:
+        Dict with path, title, content, hash and metadata, or None for files
+        that are empty or too large
+    """
+    from .attachments import content_hash
+    from .local_fetchers import HEADING_RE
+    from .trainer import parse_frontmatter
+
+    if path.stat().st_size > MAX_FILE_BYTES:
+        return None
+    text = path.read_text(encoding="utf-8", errors="replace")
+    try:
+        frontmatter, body = parse_frontmatter(text)
+    except Exception:
+        frontmatter, body = {}, text
+    if not isinstance(frontmatter, dict):
+        frontmatter = {}
+    body = body.strip()
+    if not body:
+        return None
+
+    heading = HEADING_RE.search(body)
+    title = str(frontmatter.get("title") or (heading.group(1).strip() if heading else path.stem))
+    metadata = {"title": title, "path": path.relative_to(root).as_posix()}
+    tags = frontmatter.get("tags")
+    if tags:
+        metadata["tags"] = tags if isinstance(tags, list) else [tags]
+
+    return {
+        "path": path,
+        "title": title,
+        "content": body,
+        "hash": content_hash(body),
+        "metadata": metadata,
+    }
+
+
+def _stored_hashes(vault_path: Path) -> set[str]:
+    """Content hashes already in the attachment store (taken from file names)."""
+    from .attachments import ATTACHMENTS_DIR
+
+    attachments_path = vault_path / ATTACHMENTS_DIR
+    if not attachments_path.exists():
+        return set()
+    return {
+        name.split(".", 1)[0]
+        for name in os.listdir(attachments_path)
+        if not name.startswith(".")
+    }
+
+
+def import_folder(
+    vault_path: Path,
+    folder: Path,
+    workers: int = DEFAULT_IMPORT_WORKERS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    on_progress: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """Import every Markdown/text file under ``folder`` as a source note.
+
+    Files are read and hashed in a worker pool while the walk continues;
+    content already in the vault (or seen earlier in the walk) is skipped.
+    Notes and attachments are written in batches from the calling thread.
+
+    Args:
+        vault_path: Path to vault
+        folder: Folder to import
+        workers: Reader threads
+        batch_size: Records written per batch
+        on_progress: Called with the running stats after each batch
+
+    Returns:
+        Stats dict: files, imported, duplicates, skipped, failed, errors
+    """
+    from .ingestor import DuplicateSourceError, ingest_settings, write_source_note
+    from .neardup import NearDuplicateIndex
+    from .vault_io import write_behind
+
+    folder = folder.resolve()
+    settings = ingest_settings(vault_path)
+    index = NearDuplicateIndex.load(vault_path)
+    seen = _stored_hashes(vault_path)
+    stats = {"files": 0, "imported": 0, "duplicates": 0, "skipped": 0, "failed": 0, "errors": []}
+
+    def write_batch(batch: list[dict]) -> None:
+        # One durability barrier per batch
+        with write_behind(max_pending=len(batch) + 1):
+            for record in batch:
+                write_one(record)
+        index.save()
+        if on_progress:
+            on_progress(stats)
+
+    def write_one(record: dict) -> None:
+        try:
+            write_source_note(
+                vault_path,
+                record["content"],
+                fetch_method="import-folder",
+                source_kind="local",
+                url=record["path"].as_uri(),
+                title=record["title"],
+                extra_metadata=record["metadata"],
+                settings=settings,
+                near_dup_index=index,
+            )
+            stats["imported"] += 1
+        except DuplicateSourceError:
+            stats["duplicates"] += 1
+        except Exception as e:
+            stats["failed"] += 1
+            stats["errors"].append((str(record["path"]), str(e)))
+
+    def read(path: Path):
+        try:
+            return path, read_import_file(path, folder), None
+        except Exception as e:
+            return path, None, e
+
+    def read_all() -> Iterator[tuple]:
+        # Bounded window of in-flight reads: Executor.map would submit the
+        # whole walk up front and hold every file's content at once
+        window = max(1, workers) * READ_AHEAD
+        pending: deque = deque()
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for path in iter_import_files(folder):
+                pending.append(pool.submit(read, path))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    batch: list[dict] = []
+    for path, record, error in read_all():
+        stats["files"] += 1
+        if error is not None:
+            stats["failed"] += 1
+            stats["errors"].append((str(path), str(error)))
+            continue
+        if record is None:
+            stats["skipped"] += 1
+            continue
+        if record["hash"] in seen:
+            stats["duplicates"] += 1
+            continue
+        seen.add(record["hash"])
+        batch.append(record)
+        if len(batch) >= batch_size:
+            write_batch(batch)
+            batch = []
+    if batch:
+        write_batch(batch)
+    return stats
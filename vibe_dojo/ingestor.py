@@ -1,12 +1,40 @@
 """Content ingestion from URLs and text."""
 
 import re
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, TypeVar, Union
 
 from ulid import ULID
 
+from . import vault_io
+
+T = TypeVar("T")
+
+# Query parameters that never change the content behind a URL
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "si", "feature"}
+YOUTUBE_HOSTS = {"youtube.com", "m.youtube.com", "youtu.be", "youtube-nocookie.com"}
+YOUTUBE_ID_RE = re.compile(r"(?:v=|youtu\.be/|shorts/|embed/)([a-zA-Z0-9_-]{11})")
+
+DEFAULT_BATCH_WORKERS = 8
+DEFAULT_PER_DOMAIN = 2
+DEFAULT_FETCH_TIMEOUT_S = 120.0
+# SimHash bits two sources may differ by and still count as near-duplicates
+NEAR_DUPLICATE_DISTANCE = 3
+
+# videos.list accepts at most 50 ids per call
+YOUTUBE_BATCH_SIZE = 50
+YOUTUBE_DEADLINE_S = 90.0
+
+_youtube_local = threading.local()
+
+
+class DuplicateSourceError(ValueError):
+    """Raised when new content duplicates a source already in the vault."""
+
 
 def slugify(text: str) -> str:
     """Convert text to URL-safe slug."""
@@ -27,6 +55,14 @@ def format_timestamp(seconds: float) -> str:
     return f"{minutes:02d}:{seconds:02d}"
 
 
+def parse_timestamp(timestamp: str) -> int:
+    """Parse MM:SS or HH:MM:SS to seconds (inverse of format_timestamp)."""
+    seconds = 0
+    for part in str(timestamp).strip().split(":"):
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
 def parse_iso8601_duration(duration_str: str) -> int:
     """Parse ISO 8601 duration string to minutes."""
     match = re.search(
@@ -51,116 +87,204 @@ def parse_iso8601_duration(duration_str: str) -> int:
     return total_minutes
 
 
-def fetch_youtube_metadata_official(video_id: str) -> dict:
-    """Fetch official metadata using YouTube Data API v3."""
-    import os
+@lru_cache(maxsize=4)
+def get_youtube_client(api_key: str):
+    """YouTube Data API client, built (discovery included) once per key."""
     from googleapiclient.discovery import build
-    from dotenv import load_dotenv
+
+    return build('youtube', 'v3', developerKey=api_key, cache_discovery=False)
+
+
+def _youtube_http():
+    """Per-thread httplib2 transport; the shared client's default one isn't thread-safe."""
+    from googleapiclient.http import build_http
+
+    http = getattr(_youtube_local, "http", None)
+    if http is None:
+        http = _youtube_local.http = build_http()
+    return http
+
+
+def _parse_video_item(item: dict) -> dict:
+    """Metadata dict for one ``videos.list`` item."""
+    snippet = item['snippet']
+    content_details = item['contentDetails']
     
+    # Simple chapter extraction from description
+    chapters = []
+    description = snippet.get('description', '')
+    # Regex for "00:00 Chapter Name" or "0:00 Chapter Name"
+    chapter_matches = re.findall(r'(\d{1,2}:\d{2}(?::\d{2})?)\s+(.+)', description)
+    for timestamp, title in chapter_matches:
+        chapters.append({"timestamp": timestamp, "title": title})
+        
+    return {
+        'title': snippet['title'],
+        'description': description,
+        'duration': content_details['duration'],
+        'duration_minutes': parse_iso8601_duration(content_details['duration']),
+        'upload_date': snippet['publishedAt'],
+        'channel': snippet['channelTitle'],
+        'chapters': chapters
+    }
+
+
+def fetch_youtube_metadata_batch(video_ids: list[str]) -> dict[str, dict]:
+    """Fetch official metadata for many videos, up to 50 ids per API call.
+
+    Returns:
+        Dict of video_id -> metadata; videos the API didn't return (or all of
+        them, if no API key is configured) are missing from the result
+    """
+    import os
+
+    from dotenv import load_dotenv
+
     load_dotenv()
     api_key = os.getenv("YOUTUBE_API_KEY")
-    if not api_key:
-        return {}
-        
-    try:
-        youtube = build('youtube', 'v3', developerKey=api_key)
-        response = youtube.videos().list(
-            part='snippet,contentDetails',
-            id=video_id
-        ).execute()
-        
-        if not response['items']:
-            return {}
-            
-        item = response['items'][0]
-        snippet = item['snippet']
-        content_details = item['contentDetails']
-        
-        # Simple chapter extraction from description
-        chapters = []
-        description = snippet.get('description', '')
-        # Regex for "00:00 Chapter Name" or "0:00 Chapter Name"
-        chapter_matches = re.findall(r'(\d{1,2}:\d{2}(?::\d{2})?)\s+(.+)', description)
-        for timestamp, title in chapter_matches:
-            chapters.append({"timestamp": timestamp, "title": title})
-            
-        return {
-            'title': snippet['title'],
-            'description': description,
-            'duration': content_details['duration'],
-            'duration_minutes': parse_iso8601_duration(content_details['duration']),
-            'upload_date': snippet['publishedAt'],
-            'channel': snippet['channelTitle'],
-            'chapters': chapters
-        }
-    except Exception:
-        # Silently fail back to basic metadata if API errors
+    if not api_key or not video_ids:
         return {}
 
+    unique_ids = list(dict.fromkeys(video_ids))
+    metadata = {}
+    youtube = get_youtube_client(api_key)
+    for i in range(0, len(unique_ids), YOUTUBE_BATCH_SIZE):
+        batch = unique_ids[i:i + YOUTUBE_BATCH_SIZE]
+        try:
+            response = youtube.videos().list(
+                part='snippet,contentDetails',
+                id=",".join(batch),
+            ).execute(http=_youtube_http())
+        except Exception:
+            # Silently fail back to basic metadata if API errors
+            continue
+        for item in response.get('items', []):
+            try:
+                metadata[item['id']] = _parse_video_item(item)
+            except KeyError:
+                continue
+    return metadata
+
+
+def fetch_youtube_metadata_official(video_id: str) -> dict:
+    """Fetch official metadata using YouTube Data API v3."""
+    return fetch_youtube_metadata_batch([video_id]).get(video_id, {})
+
+
+def extract_youtube_id(url: str) -> Optional[str]:
+    """Video id from a watch, youtu.be, shorts or embed URL."""
+    video_id_match = YOUTUBE_ID_RE.search(url)
+    return video_id_match.group(1) if video_id_match else None
 
-def fetch_youtube_transcript(url: str) -> tuple[str, str, dict]:
-    """Fetch YouTube transcript with timestamps and official metadata."""
+
+def fetch_youtube_transcript_entries(video_id: str):
+    """Fetch the raw de/en transcript entries (the network part)."""
     from youtube_transcript_api import YouTubeTranscriptApi
-    
-    # Extract video ID
-    video_id_match = re.search(r"(?:v=|youtu\.be/)([a-zA-Z0-9_-]{11})", url)
-    if not video_id_match:
-        raise ValueError("Invalid YouTube URL")
-        
-    video_id = video_id_match.group(1)
-    
-    # Fetch Official Metadata
-    metadata = fetch_youtube_metadata_official(video_id)
-    metadata["video_id"] = video_id
-    
-    try:
-        # Fetch transcript
-        # Compatibility: Handling different library versions found in wild
-        if hasattr(YouTubeTranscriptApi, 'list_transcripts'):
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-        elif hasattr(YouTubeTranscriptApi, 'list'):
-            # Fallback for version requiring instantiation
-            transcript_list = YouTubeTranscriptApi().list(video_id)
+
+    # Compatibility: Handling different library versions found in wild
+    if hasattr(YouTubeTranscriptApi, 'list_transcripts'):
+        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+    elif hasattr(YouTubeTranscriptApi, 'list'):
+        # Fallback for version requiring instantiation
+        transcript_list = YouTubeTranscriptApi().list(video_id)
+    else:
+         # Try instantiation with list_transcripts (just in case)
+         transcript_list = YouTubeTranscriptApi().list_transcripts(video_id)
+
+    transcript = transcript_list.find_transcript(["de", "en"])
+    return transcript.fetch()
+
+
+def iter_transcript_lines(transcript_data: Iterable) -> Iterator[str]:
+    """Format transcript entries as ``[MM:SS] text`` lines, one at a time.
+
+    Lines after the first carry their leading newline, so joining the
+    chunks yields the newline-separated transcript.
+    """
+    for i, entry in enumerate(transcript_data):
+        # Handle both dict (standard) and object (legacy/variant) responses
+        if isinstance(entry, dict):
+            start = entry['start']
+            text = entry['text']
         else:
-             # Try instantiation with list_transcripts (just in case)
-             transcript_list = YouTubeTranscriptApi().list_transcripts(video_id)
-             
-        transcript = transcript_list.find_transcript(["de", "en"])
-        transcript_data = transcript.fetch()
-        
-        # Format with timestamps
-        formatted_lines = []
-        for entry in transcript_data:
-            # Handle both dict (standard) and object (legacy/variant) responses
-            if isinstance(entry, dict):
-                start = entry['start']
-                text = entry['text']
-            else:
-                # Assume object attributes
-                start = getattr(entry, 'start', 0)
-                text = getattr(entry, 'text', "")
-                
-            timestamp = format_timestamp(start)
-            formatted_lines.append(f"[{timestamp}] {text}")
+            # Assume object attributes
+            start = getattr(entry, 'start', 0)
+            text = getattr(entry, 'text', "")
             
-        full_text = "\n".join(formatted_lines)
-        
-        return full_text, "youtube-transcript-api-v1.2.3+timestamps", metadata
-        
-    except Exception as e:
-        raise ValueError(f"Could not retrieve transcript for {url}: {e}")
+        timestamp = format_timestamp(start)
+        line = f"[{timestamp}] {text}"
+        yield line if i == 0 else "\n" + line
+
+
+def fetch_youtube_transcript(
+    url: str,
+    metadata: Optional[dict] = None,
+    deadline: float = YOUTUBE_DEADLINE_S,
+) -> tuple[Iterator[str], str, dict]:
+    """Fetch YouTube transcript with timestamps and official metadata.
+
+    Metadata and transcript are independent requests and run concurrently
+    under one shared deadline. Missing metadata is tolerated; a missing
+    transcript is an error.
+
+    Args:
+        url: YouTube URL
+        metadata: Already-fetched metadata (e.g. from a batch lookup); skips
+            the metadata request
+        deadline: Seconds allowed for both requests together
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from concurrent.futures import TimeoutError as FutureTimeout
+
+    video_id = extract_youtube_id(url)
+    if not video_id:
+        raise ValueError("Invalid YouTube URL")
+
+    started = time.monotonic()
+    pool = ThreadPoolExecutor(max_workers=2)
+    try:
+        transcript_future = pool.submit(fetch_youtube_transcript_entries, video_id)
+        metadata_future = None
+        if metadata is None:
+            metadata_future = pool.submit(fetch_youtube_metadata_official, video_id)
+
+        try:
+            transcript_data = transcript_future.result(timeout=deadline)
+        except FutureTimeout:
+            raise ValueError(
+                f"Could not retrieve transcript for {url}: timed out after {deadline:.0f}s"
+            )
+        except Exception as e:
+            raise ValueError(f"Could not retrieve transcript for {url}: {e}")
+
+        if metadata_future is not None:
+            remaining = max(0.0, deadline - (time.monotonic() - started))
+            try:
+                metadata = metadata_future.result(timeout=remaining)
+            except Exception:
+                metadata = {}
+    finally:
+        # Don't let a stuck request hold the caller past the deadline
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    metadata = dict(metadata or {})
+    metadata["video_id"] = video_id
+    # Formatted lazily: the caller streams the lines into the attachment
+    method = "youtube-transcript-api-v1.2.3+timestamps"
+    return iter_transcript_lines(transcript_data), method, metadata
 
 
-def fetch_reddit_content(url: str) -> tuple[str, str, dict]:
+def fetch_reddit_content(url: str, max_age: Optional[float] = None) -> tuple[str, str, dict]:
     """Fetch Reddit post content."""
-    import requests
+    import json
+
+    from .http_cache import DEFAULT_MAX_AGE_S, cached_get
     
     # Add .json to URL
     json_url = url.rstrip("/") + ".json"
-    response = requests.get(json_url, headers={"User-Agent": "vibe-dojo/0.1.0"})
-    response.raise_for_status()
+    response = cached_get(json_url, max_age=DEFAULT_MAX_AGE_S if max_age is None else max_age)
     
-    data = response.json()
+    data = json.loads(response["content"])
     post = data[0]["data"]["children"][0]["data"]
     
     # Combine title and selftext
@@ -173,15 +297,21 @@ def fetch_reddit_content(url: str) -> tuple[str, str, dict]:
     return text, "reddit-json-api", metadata
 
 
-def fetch_article(url: str) -> tuple[str, str, dict]:
+def fetch_article(url: str, max_age: Optional[float] = None) -> tuple[str, str, dict]:
     """Fetch article content using trafilatura."""
     import trafilatura
-    
-    downloaded = trafilatura.fetch_url(url)
+
+    from .http_cache import DEFAULT_MAX_AGE_S, cached_get
+
+    max_age = DEFAULT_MAX_AGE_S if max_age is None else max_age
+    try:
+        downloaded = cached_get(url, max_age=max_age)["content"]
+    except Exception as e:
+        raise ValueError(f"Failed to download URL: {e}")
     if not downloaded:
         raise ValueError("Failed to download URL")
         
-    text = trafilatura.extract(downloaded)
+    text = trafilatura.extract(downloaded, url=url)
     if not text:
         raise ValueError("Failed to extract content")
         
@@ -191,92 +321,171 @@ def fetch_article(url: str) -> tuple[str, str, dict]:
 
 
 def fetch_url(url: str) -> tuple[str, str, dict]:
-    """Auto-detect and fetch content from URL."""
-    if "youtube.com" in url or "youtu.be" in url:
-        return fetch_youtube_transcript(url)
-    elif "reddit.com" in url:
-        return fetch_reddit_content(url)
-    else:
-        return fetch_article(url)
+    """Auto-detect and fetch content from URL via the fetcher registry."""
+    from .fetchers import get_fetcher
 
+    return get_fetcher(url).fetch(url)
 
-def create_source_note(
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so trivially different links compare equal.
+
+    Lowercases scheme and host, drops ``www.``, fragments, tracking
+    parameters and trailing slashes, and rewrites YouTube links
+    (youtu.be, shorts, embeds) to ``https://www.youtube.com/watch?v=<id>``.
+    """
+    from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+    url = url.strip()
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    if host in YOUTUBE_HOSTS:
+        video_id = extract_youtube_id(url)
+        if video_id:
+            return f"https://www.youtube.com/watch?v={video_id}"
+
+    netloc = host
+    if parts.port and parts.port not in (80, 443):
+        netloc = f"{host}:{parts.port}"
+    query = urlencode([
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ])
+    path = parts.path.rstrip("/") or ""
+    return urlunsplit(((parts.scheme or "https").lower(), netloc, path, query, ""))
+
+
+def source_kind_for(url: str) -> str:
+    """Source kind recorded in the note frontmatter for a fetched URL."""
+    from .fetchers import get_fetcher
+
+    return get_fetcher(url).kind
+
+
+def existing_source_urls(vault_path: Path) -> dict[str, str]:
+    """Map canonical URL -> note name for every ingested source in the inbox.
+
+    Pending captures (``SOURCE__pending__*``) are not counted, since ingesting
+    them is exactly what ``distill-inbox`` does.
+    """
+    urls = {}
+    inbox_path = vault_path / "00_Inbox"
+    if not inbox_path.exists():
+        return urls
+    for note in inbox_path.glob("SOURCE__*.md"):
+        if note.name.startswith("SOURCE__pending__"):
+            continue
+        try:
+            txt = note.read_text(encoding="utf-8")
+        except OSError:
+            continue
+        match = re.search(r"^url:\s*(\S+)\s*$", txt, re.MULTILINE)
+        if match:
+            urls[canonicalize_url(match.group(1))] = note.name
+    return urls
+
+
+def ingest_settings(vault_path: Path) -> dict:
+    """Ingest-related settings from config.yaml, read once per (bulk) operation."""
+    from .config import Config
+
+    config = Config(vault_path).config
+    ingest_config = config.get("ingest", {})
+    policy = ingest_config.get("near_duplicate", "warn")
+    # YAML reads a bare `off` as False
+    policy = "off" if policy is False else str(policy).lower()
+    return {
+        "compression": config.get("attachments", {}).get("compression", "none"),
+        "near_duplicate": policy,
+        "near_duplicate_distance": ingest_config.get(
+            "near_duplicate_distance", NEAR_DUPLICATE_DISTANCE
+        ),
+    }
+
+
+def write_source_note(
     vault_path: Path,
+    content: Union[str, Iterable[str]],
+    fetch_method: str,
+    source_kind: str,
     url: Optional[str] = None,
-    text: Optional[str] = None,
     title: Optional[str] = None,
-    no_fetch: bool = False,
+    extra_metadata: Optional[dict] = None,
+    settings: Optional[dict] = None,
+    near_dup_index=None,
 ) -> Path:
-    """Create a source note in 00_Inbox/.
-    
+    """Write the attachment and source note for already-fetched content.
+
     Args:
         vault_path: Path to vault
-        url: URL to fetch (if provided)
-        text: Manual text (if no URL or no_fetch)
+        content: Full source content, or an iterable of text chunks that is
+            streamed into the attachment without being joined in memory
+        fetch_method: How the content was obtained
+        source_kind: youtube, reddit, blog or manual
+        url: Source URL, if any
         title: Optional title override
-        no_fetch: If True, don't fetch URL (requires text)
-        
+        extra_metadata: Fetcher metadata embedded under ``video_metadata``
+        settings: Result of ingest_settings(); read from config.yaml if None
+        near_dup_index: Shared NearDuplicateIndex for bulk callers, who are
+            then responsible for saving it; loaded and saved per call if None
+
     Returns:
         Path to created source note
+
+    Raises:
+        DuplicateSourceError: If the content is a near-duplicate of an
+            existing source and the policy is ``skip``
     """
+    extra_metadata = extra_metadata or {}
     source_id = str(ULID())
     captured_at = datetime.now().isoformat()
-    extra_metadata = {}
 
-    # Check for duplicate URL
-    if url:
-        inbox_path = vault_path / "00_Inbox"
-        if inbox_path.exists():
-            for note in inbox_path.glob("SOURCE__*.md"):
-                try:
-                    txt = note.read_text(encoding="utf-8")
-                    # Regex check for url in frontmatter
-                    if re.search(r"^url:\s*" + re.escape(url) + r"\s*$", txt, re.MULTILINE):
-                         raise ValueError(f"URL already ingested in {note.name}")
-                except OSError:
-                    continue
+    # Save large content to a content-addressed attachment
+    from .attachments import write_attachment_stream
+    from .neardup import NearDuplicateIndex, SimHasher
 
-    # Determine content and method
-    if url and not no_fetch:
-        try:
-            content, fetch_method, extra_metadata = fetch_url(url)
-            source_kind = "youtube" if "youtube" in url else "reddit" if "reddit" in url else "blog"
-        except Exception as e:
-            raise ValueError(f"Failed to fetch URL: {e}")
-    elif text:
-        content = text
-        fetch_method = "manual"
-        source_kind = "manual"
-    else:
-        raise ValueError("Must provide either URL or text")
+    settings = settings or ingest_settings(vault_path)
+    chunks = [content] if isinstance(content, str) else content
+    hasher = SimHasher() if settings["near_duplicate"] != "off" else None
+    inbox_path = vault_path / "00_Inbox"
+    stored = write_attachment_stream(
+        vault_path, hasher.tee(chunks) if hasher else chunks, settings["compression"]
+    )
+    attachment_path = stored["path"].relative_to(vault_path).as_posix()
+    preview = stored["preview"]
+
+    # Near-duplicate check before the note exists (and long before distillation)
+    signature = hasher.digest() if hasher else None
+    index = None
+    duplicate_of = None
+    if signature is not None:
+        index = near_dup_index or NearDuplicateIndex.load(vault_path)
+        match = index.find(signature, settings["near_duplicate_distance"])
+        if match:
+            if settings["near_duplicate"] == "skip":
+                if stored["created"]:
+                    stored["path"].unlink()
+                raise DuplicateSourceError(
+                    f"Near-duplicate of {match['note']} ({match['distance']} bits apart)"
+                )
+            duplicate_of = match["note"]
+            print(f"[WARN] Near-duplicate of {match['note']} ({match['distance']} bits apart)")
 
     # Generate title if not provided
     if not title:
         if extra_metadata.get("title"):
              title = extra_metadata["title"]
         elif url:
-            title = url.split("/")[-1][:50]
+            title = url.rstrip("/").split("/")[-1][:50]
         else:
-            title = content[:50].replace("\n", " ")
+            title = preview[:50].replace("\n", " ")
 
-    # Quality Gate: Check duration
     duration_mins = extra_metadata.get("duration_minutes", 0)
-    if duration_mins > 180:
-        from rich.prompt import Confirm
-        print(f"\n⚠️  [yellow]Warning: Video is {duration_mins} minutes long (very long).[/yellow]")
-        print("   Distilliation might take longer and use more tokens.")
-        if not Confirm.ask("   Continue processing?"):
-            return None # Or handle graceful exit
-
     slug = slugify(title)
-
-    # Save large content to attachment
-    inbox_path = vault_path / "00_Inbox"
-    attachments_path = inbox_path / "_attachments"
-    attachments_path.mkdir(parents=True, exist_ok=True)
-
-    attachment_file = attachments_path / f"{source_id}.txt"
-    attachment_file.write_text(content, encoding="utf-8")
     
     # Format metadata as YAML block if it exists
     metadata_yaml = ""
@@ -287,6 +496,8 @@ def create_source_note(
         # Indent it for embedding
         metadata_yaml = "\n".join("  " + line for line in metadata_yaml.splitlines())
 
+    duplicate_line = f"near_duplicate_of: {duplicate_of}\n" if duplicate_of else ""
+
     # Create lean source note
     frontmatter = f"""---
 id: {source_id}
@@ -294,8 +505,10 @@ source_kind: {source_kind}
 url: {url or ""}
 captured_at: {captured_at}
 fetch_method: {fetch_method}
-transcript_path: 00_Inbox/_attachments/{source_id}.txt
-video_metadata:
+transcript_path: {attachment_path}
+content_chars: {stored["chars"]}
+content_tokens: {stored["tokens"]}
+{duplicate_line}video_metadata:
 {metadata_yaml}
 ---
 
@@ -306,13 +519,270 @@ video_metadata:
 {f"**Duration:** {duration_mins} min" if duration_mins > 0 else ""}
 
 ## Content Preview
-{content[:300]}...
+{preview}...
 
 ---
-*Full content in: `{attachment_file.relative_to(vault_path)}`*
+*Full content in: `{attachment_path}`*
 """
 
     note_file = inbox_path / f"SOURCE__{slug}.md"
-    note_file.write_text(frontmatter, encoding="utf-8")
+    if vault_io.exists(note_file):
+        # Two sources with the same title: keep both
+        note_file = inbox_path / f"SOURCE__{slug}-{source_id[-6:].lower()}.md"
+    vault_io.write_text(note_file, frontmatter)
+
+    if index is not None:
+        index.add(source_id, signature, note_file.name)
+        if near_dup_index is None:
+            index.save()
 
     return note_file
+
+
+def create_source_note(
+    vault_path: Path,
+    url: Optional[str] = None,
+    text: Optional[str] = None,
+    title: Optional[str] = None,
+    no_fetch: bool = False,
+) -> Path:
+    """Create a source note in 00_Inbox/.
+    
+    Args:
+        vault_path: Path to vault
+        url: URL to fetch (if provided)
+        text: Manual text (if no URL or no_fetch)
+        title: Optional title override
+        no_fetch: If True, don't fetch URL (requires text)
+        
+    Returns:
+        Path to created source note
+    """
+    extra_metadata = {}
+
+    # Check for duplicate URL
+    if url:
+        existing = existing_source_urls(vault_path).get(canonicalize_url(url))
+        if existing:
+            raise ValueError(f"URL already ingested in {existing}")
+
+    # Determine content and method
+    if url and not no_fetch:
+        try:
+            content, fetch_method, extra_metadata = fetch_url(url)
+            source_kind = source_kind_for(url)
+        except Exception as e:
+            raise ValueError(f"Failed to fetch URL: {e}")
+    elif text:
+        content = text
+        fetch_method = "manual"
+        source_kind = "manual"
+    else:
+        raise ValueError("Must provide either URL or text")
+
+    # Quality Gate: Check duration
+    duration_mins = extra_metadata.get("duration_minutes", 0)
+    if duration_mins > 180:
+        from rich.prompt import Confirm
+        print(f"\n⚠️  [yellow]Warning: Video is {duration_mins} minutes long (very long).[/yellow]")
+        print("   Distilliation might take longer and use more tokens.")
+        if not Confirm.ask("   Continue processing?"):
+            return None # Or handle graceful exit
+
+    return write_source_note(
+        vault_path,
+        content,
+        fetch_method=fetch_method,
+        source_kind=source_kind,
+        url=url,
+        title=title,
+        extra_metadata=extra_metadata,
+    )
+
+
+def parse_batch_entries(lines: Iterable[str]) -> list[str]:
+    """Read batch entries: one URL or text per line, ``#`` comments skipped."""
+    entries = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            entries.append(line)
+    return entries
+
+
+def _call_with_timeout(fn: Callable[[], T], timeout: float) -> T:
+    """Run ``fn`` in a daemon thread and give up after ``timeout`` seconds.
+
+    The fetch libraries don't all accept a deadline, so a stuck fetch is
+    abandoned rather than cancelled; the daemon thread can't block exit.
+    """
+    outcome: dict = {}
+
+    def target():
+        try:
+            outcome["value"] = fn()
+        except BaseException as e:
+            outcome["error"] = e
+
+    worker = threading.Thread(target=target, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TimeoutError(f"Timed out after {timeout:.0f}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+def ingest_batch(
+    vault_path: Path,
+    entries: Iterable[str],
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    per_domain: int = DEFAULT_PER_DOMAIN,
+    timeout: float = DEFAULT_FETCH_TIMEOUT_S,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> list[dict]:
+    """Ingest many URLs / text entries concurrently.
+
+    Entries are canonicalized and deduplicated (within the batch and against
+    the inbox) before any fetch starts. Fetches run in a thread pool with at
+    most ``per_domain`` in flight per host; notes are written from the calling
+    thread as fetches complete, so a failure never loses finished work.
+
+    Args:
+        vault_path: Path to vault
+        entries: URLs or manual text, one per entry
+        max_workers: Concurrent fetches overall
+        per_domain: Concurrent fetches per host
+        timeout: Seconds before a single fetch is abandoned
+        on_result: Optional callback invoked with each result as it lands
+
+    Returns:
+        One result dict per entry with ``entry``, ``status`` (created, skipped
+        or failed), and ``path`` or ``reason``
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from urllib.parse import urlsplit
+
+    from .fetchers import get_fetcher, is_url
+    from .neardup import NearDuplicateIndex
+    from .vault_io import write_behind
+
+    results = []
+
+    def report(result: dict) -> None:
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    existing = existing_source_urls(vault_path)
+    seen = set()
+    urls, texts = [], []
+    for entry in entries:
+        if is_url(entry):
+            key = canonicalize_url(entry)
+            if key in existing:
+                reason = f"already ingested in {existing[key]}"
+                report({"entry": entry, "status": "skipped", "reason": reason})
+                continue
+            target = urls
+        else:
+            key = entry
+            target = texts
+        if key in seen:
+            report({"entry": entry, "status": "skipped", "reason": "duplicate in batch"})
+            continue
+        seen.add(key)
+        target.append((entry, key))
+
+    # One config read and one near-duplicate index for the whole batch
+    settings = ingest_settings(vault_path)
+    index = NearDuplicateIndex.load(vault_path)
+
+    def write(entry: str, content, **kwargs) -> None:
+        try:
+            path = write_source_note(
+                vault_path, content, settings=settings, near_dup_index=index, **kwargs
+            )
+            report({"entry": entry, "status": "created", "path": path})
+        except DuplicateSourceError as e:
+            report({"entry": entry, "status": "skipped", "reason": str(e)})
+        except Exception as e:
+            report({"entry": entry, "status": "failed", "reason": str(e) or type(e).__name__})
+
+    try:
+        # Notes are committed in groups behind one fsync barrier
+        with write_behind():
+            # Manual text needs no fetch
+            for entry, _ in texts:
+                write(entry, entry, fetch_method="manual", source_kind="manual")
+
+            fetchers = {}
+            for entry, url in list(urls):
+                try:
+                    fetchers[url] = get_fetcher(url)
+                except ValueError as e:
+                    urls.remove((entry, url))
+                    report({"entry": entry, "status": "failed", "reason": str(e)})
+            if not urls:
+                return results
+
+            domain_limits: dict[str, threading.Semaphore] = {}
+            for _, url in urls:
+                host = urlsplit(url).hostname or ""
+                domain_limits.setdefault(host, threading.Semaphore(per_domain))
+
+            # One videos.list call per 50 videos instead of one per video
+            video_ids = {
+                url: extract_youtube_id(url)
+                for url, fetcher in fetchers.items()
+                if fetcher.name == "youtube"
+            }
+            video_ids = {url: vid for url, vid in video_ids.items() if vid}
+            youtube_metadata = {}
+            if video_ids:
+                try:
+                    youtube_metadata = fetch_youtube_metadata_batch(list(video_ids.values()))
+                except Exception:
+                    youtube_metadata = {}
+
+            def fetch(url: str) -> tuple[str, str, dict]:
+                kwargs = {}
+                if url in video_ids:
+                    kwargs["metadata"] = youtube_metadata.get(video_ids[url], {})
+                limit = domain_limits[urlsplit(url).hostname or ""]
+                if not limit.acquire(timeout=timeout):
+                    raise TimeoutError(f"Timed out after {timeout:.0f}s waiting for the host")
+
+                # The slot is released by the fetch itself, so an abandoned
+                # (timed-out) fetch keeps counting against its host until it ends
+                def guarded():
+                    try:
+                        return fetchers[url].fetch(url, **kwargs)
+                    finally:
+                        limit.release()
+
+                return _call_with_timeout(guarded, timeout)
+
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+                futures = {pool.submit(fetch, url): (entry, url) for entry, url in urls}
+                for future in as_completed(futures):
+                    entry, url = futures[future]
+                    try:
+                        content, fetch_method, metadata = future.result()
+                    except Exception as e:
+                        reason = str(e) or type(e).__name__
+                        report({"entry": entry, "status": "failed", "reason": reason})
+                        continue
+                    write(
+                        entry,
+                        content,
+                        fetch_method=fetch_method,
+                        source_kind=fetchers[url].kind,
+                        url=url,
+                        extra_metadata=metadata,
+                    )
+    finally:
+        index.save()
+
+    return results
@@ -143,65 +143,70 @@ class InteractiveApp:
     def _propose_and_select_drills(self, source_id: str):
         """Analyze content and let user select drills."""
         from .config import Config
-        from .distiller import distill_drills
-        from .writer import create_drill_note
-        from .distiller import load_source_content, get_existing_context
+        from .distiller import iter_source_drills, DEFAULT_CHUNK_TOKEN_BUDGET
+        from .writer import create_drill_notes
+        from .distiller import load_source_content, get_existing_context, compact_source
+        from .transcript import DEFAULT_WINDOW_SECONDS
+        from .telemetry import tag
         
         config = Config(self.vault_path).config
         model = config.get("llm", {}).get("model", "gemini-1.5-flash")
         
         console.print(f"\n[bold blue]🧠 Analyzing content with {model}...[/bold blue]")
         
-        # 1. Get Proposals
+        # 1. Get Proposals (streamed into a live table as Gemini generates them)
+        from rich.live import Live
+        from rich.table import Table
+        table = Table(
+            title="Proposed Drills from Content", show_header=True, header_style="bold magenta"
+        )
+        table.add_column("#", style="dim", width=4)
+        table.add_column("Confidence", justify="center", width=12)
+        table.add_column("Drill", style="bold")
+        table.add_column("Est. Time", justify="right")
+
+        proposals = []
         try:
-             # Manually loading content here to pass to distill_drills
+             # Manually loading content here to pass to the distiller
              # This duplicates logic in create_drills_from_source but gives us the raw list first
              source_content, source_metadata = load_source_content(self.vault_path, source_id)
-             existing_context = get_existing_context(self.vault_path)
-             
-             with console.status("[bold green]Designing drills...[/bold green]"):
-                 proposals = distill_drills(
-                     source_content, 
-                     source_metadata, 
-                     model_name=model, 
-                     existing_context=existing_context
+             llm_config = config.get("llm", {})
+             if llm_config.get("compact_transcripts", True):
+                 source_content = compact_source(
+                     source_content,
+                     source_metadata,
+                     llm_config.get("compact_window_seconds", DEFAULT_WINDOW_SECONDS),
                  )
+             existing_context = get_existing_context(self.vault_path)
+
+             drill_stream = iter_source_drills(
+                 source_content,
+                 source_metadata,
+                 model_name=model,
+                 existing_context=existing_context,
+                 token_budget=llm_config.get("chunk_token_budget", DEFAULT_CHUNK_TOKEN_BUDGET),
+             )
+             with Live(table, console=console, refresh_per_second=8), tag(source=source_id):
+                 for drill in drill_stream:
+                     if not drill.get("title"):
+                         continue
+                     proposals.append(drill)
+                     self._add_proposal_row(table, len(proposals), drill)
         except Exception as e:
             console.print(f"[red]Failed to generate proposals: {e}[/red]")
-            return
+            if not proposals:
+                return
+            console.print(
+                f"[yellow]Keeping {len(proposals)} drills generated before the error.[/yellow]"
+            )
 
         if not proposals:
             console.print("[yellow]No drills found in this content.[/yellow]")
             return
 
-        # 2. Display Proposals
-        from rich.table import Table
-        table = Table(title=f"Proposed Drills from Content", show_header=True, header_style="bold magenta")
-        table.add_column("#", style="dim", width=4)
-        table.add_column("Confidence", justify="center", width=12)
-        table.add_column("Drill", style="bold")
-        table.add_column("Est. Time", justify="right")
-
-        for idx, drill in enumerate(proposals, 1):
-            confidence_val = drill.get('confidence_score', 3)
-            # Ensure int for safety
-            try:
-                confidence_val = int(confidence_val)
-            except:
-                confidence_val = 3
-                
-            stars = "⭐" * confidence_val
-            table.add_row(
-                str(idx), 
-                stars, 
-                f"{drill['title']}\n[dim]{drill.get('drill_goal', 'No goal')}[/dim]", 
-                f"{drill.get('timebox_min', 15)} min"
-            )
-
-        console.print(table)
         console.print("\n[dim]Tip: Enter numbers separated by commas (e.g. 1,3) or range (1-3).[/dim]")
         
-        # 3. Selection
+        # 2. Selection
         selection = Prompt.ask(
             "[bold]Select drills to create[/bold] ([A]ll / [N]one)", 
             default="A"
@@ -232,29 +237,33 @@ class InteractiveApp:
                     except ValueError:
                         pass
                         
-        # 4. Create Files
-        created_count = 0
-        for idx in selected_indices:
-            if idx >= len(proposals): continue
-            
-            drill = proposals[idx]
-            create_drill_note(
-                vault_path=self.vault_path,
-                title=drill["title"],
-                pattern=drill.get("pattern", []),
-                drill_goal=drill.get("drill_goal", ""),
-                drill_steps=drill.get("drill_steps", []),
-                validation=drill.get("validation", []),
-                snippet_type=drill.get("snippet_type", "code"),
-                snippet_content=drill.get("snippet_content", ""),
-                topics=drill.get("topics", []),
-                timebox_min=drill.get("timebox_min", 15),
-                source_id=source_id,
-            )
-            created_count += 1
-            
+        # 3. Create Files (committed together)
+        selected = [
+            {**proposals[idx], "timebox_min": proposals[idx].get("timebox_min", 15)}
+            for idx in dict.fromkeys(selected_indices)
+            if idx < len(proposals)
+        ]
+        created_count = len(create_drill_notes(self.vault_path, selected, source_id=source_id))
+
         console.print(f"\n[bold green]✓ Created {created_count} drills![/bold green]")
 
+    def _add_proposal_row(self, table, idx: int, drill: dict):
+        """Append one proposed drill to the proposal table."""
+        confidence_val = drill.get('confidence_score', 3)
+        # Ensure int for safety
+        try:
+            confidence_val = int(confidence_val)
+        except (TypeError, ValueError):
+            confidence_val = 3
+
+        stars = "⭐" * confidence_val
+        table.add_row(
+            str(idx),
+            stars,
+            f"{drill['title']}\n[dim]{drill.get('drill_goal', 'No goal')}[/dim]",
+            f"{drill.get('timebox_min', 15)} min"
+        )
+
     def _do_distill_inbox(self):
         """Interactive inbox distillation."""
         from .cli import distill_inbox, distill
@@ -325,22 +334,33 @@ class InteractiveApp:
 
     def _do_practice_next(self):
         """Interactive practice session."""
-        from .cli import next_drill
-        from .trainer import get_upcoming_drills
-        from datetime import datetime
+        from .practice import PracticeSession
+
+        # Queue and topic counters stay in memory; the next drill renders in the background
+        with PracticeSession(self.vault_path, console) as session:
+            self._practice_loop(session)
+
+    def _practice_loop(self, session):
+        """Drill picker loop of a practice session."""
         import time
-        
+        from datetime import datetime
+
+        from .cli import review_drill
+
         while True:
             console.clear()
             console.print("\n[bold blue]💪 Vibe-Dojo: Practice Session[/bold blue]")
             
             # 1. Get available drills (showing up to 15 for selection)
-            available = get_upcoming_drills(self.vault_path, count=15)
+            available = session.upcoming(15)
             
             if not available:
                 console.print("[yellow]No drills available for practice right now.[/yellow]")
                 return
 
+            # Render the recommended drill while the user reads the table
+            session.prefetch(available[0]["path"])
+
             # 2. Show Table
             from rich.table import Table
             table = Table(title="Choose your Dojo Task", show_header=True, header_style="bold magenta")
@@ -378,11 +398,11 @@ class InteractiveApp:
             if choice.lower() == 'q':
                 break
             
-            selected_drill_name = None
+            selected_drill = None
             try:
                 idx = int(choice) - 1
                 if 0 <= idx < len(available):
-                    selected_drill_name = available[idx]["path"].name
+                    selected_drill = available[idx]["path"]
                 else:
                     console.print(f"[red]Invalid index: {choice}[/red]")
                     time.sleep(1)
@@ -392,9 +412,19 @@ class InteractiveApp:
                 time.sleep(1)
                 continue
             
-            if selected_drill_name:
+            if selected_drill:
                 try:
-                    next_drill(vault=self.vault_path, drill=selected_drill_name)
+                    prepared = session.prepared(selected_drill)
+                    console.print(prepared.context)
+                    console.print(prepared.body)
+                    result = review_drill(
+                        self.vault_path,
+                        selected_drill,
+                        prepared.frontmatter,
+                        update_dashboard=False,
+                    )
+                    if result:
+                        session.record(selected_drill)
                     
                     # After finishing one, ask if they want more
                     cont = Prompt.ask("\n[bold]Keep training?[/bold] [green](y)es[/green] / [dim](n)o[/dim]", choices=["y", "n"], default="y")
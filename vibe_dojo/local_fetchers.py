@@ -0,0 +1,68 @@
+"""Fetchers for local files: text/Markdown files and PDFs (single file or directory)."""
+
+import re
+from pathlib import Path
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+HEADING_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+
+
+def file_url_to_path(url: str) -> Path:
+    """Local path of a ``file://`` URL."""
+    parts = urlsplit(url)
+    return Path(url2pathname(parts.netloc + parts.path)).expanduser()
+
+
+def fetch_local_file(url: str) -> tuple[str, str, dict]:
+    """Read a local text or Markdown file."""
+    path = file_url_to_path(url)
+    if not path.is_file():
+        raise ValueError(f"File not found: {path}")
+
+    text = path.read_text(encoding="utf-8", errors="replace")
+    heading = HEADING_RE.search(text)
+    metadata = {
+        "title": heading.group(1).strip() if heading else path.stem,
+        "path": str(path),
+    }
+    return text, "local-file", metadata
+
+
+def fetch_pdf(url: str) -> tuple[str, str, dict]:
+    """Extract text from a PDF, or from every PDF in a directory (recursively)."""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ValueError("PDF support needs the 'pypdf' package (pip install 'vibe-dojo[pdf]')")
+
+    path = file_url_to_path(url)
+    if path.is_dir():
+        files = sorted(path.rglob("*.pdf"))
+    elif path.is_file():
+        files = [path]
+    else:
+        raise ValueError(f"File not found: {path}")
+    if not files:
+        raise ValueError(f"No PDF files in {path}")
+
+    sections = []
+    pages = 0
+    for pdf_file in files:
+        reader = PdfReader(pdf_file)
+        page_texts = [page.extract_text() or "" for page in reader.pages]
+        pages += len(page_texts)
+        body = "\n\n".join(t.strip() for t in page_texts if t.strip())
+        sections.append(f"## {pdf_file.name}\n\n{body}" if len(files) > 1 else body)
+
+    text = "\n\n".join(sections)
+    if not text.strip():
+        raise ValueError("No extractable text (scanned PDF?)")
+
+    metadata = {
+        "title": path.stem if path.is_file() else path.name,
+        "path": str(path),
+        "files": len(files),
+        "pages": pages,
+    }
+    return text, "pypdf", metadata
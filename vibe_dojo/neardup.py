@@ -0,0 +1,177 @@
+"""Near-duplicate source detection: 64-bit SimHash with LSH band buckets."""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from . import vault_io
+from .cache import load_json, save_json
+
+INDEX_FILE_NAME = "simhash_index.json"
+INDEX_VERSION = 1
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+# 4 bands of 16 bits: by pigeonhole, any two hashes within Hamming
+# distance 3 share at least one band exactly
+BANDS = 4
+BAND_BITS = SIMHASH_BITS // BANDS
+DEFAULT_MAX_DISTANCE = 3
+# Below this many shingles the signature is too noisy to trust
+MIN_SHINGLES = 30
+
+# Letters only: timestamps, numbering and punctuation don't count
+WORD_RE = re.compile(r"[^\W\d_]+")
+
+
+class SimHasher:
+    """Incremental SimHash over word shingles, fed chunk by chunk."""
+
+    def __init__(self, shingle_size: int = SHINGLE_SIZE):
+        self.shingle_size = shingle_size
+        self.values: list[int] = []
+        self._window: list[str] = []
+        self._partial = ""
+
+    @property
+    def shingles(self) -> int:
+        return len(self.values)
+
+    def _add_word(self, word: str) -> None:
+        self._window.append(word)
+        if len(self._window) > self.shingle_size:
+            self._window.pop(0)
+        if len(self._window) == self.shingle_size:
+            shingle = " ".join(self._window).encode("utf-8")
+            digest = hashlib.blake2b(shingle, digest_size=8).digest()
+            self.values.append(int.from_bytes(digest, "big"))
+
+    def update(self, text: str) -> None:
+        text = self._partial + text.lower()
+        # A word cut at the chunk boundary is finished by the next chunk
+        match = re.search(r"[^\W\d_]+$", text)
+        self._partial = match.group(0) if match else ""
+        if self._partial:
+            text = text[:match.start()]
+        for word in WORD_RE.findall(text):
+            self._add_word(word)
+
+    def digest(self) -> Optional[int]:
+        """The 64-bit signature, or None if the text was too short."""
+        if self._partial:
+            self._add_word(self._partial)
+            self._partial = ""
+        if self.shingles < MIN_SHINGLES:
+            return None
+        import numpy as np
+
+        # Per-bit vote: set bits count +1, clear bits -1
+        values = np.array(self.values, dtype=np.uint64)
+        bits = (values[:, None] >> np.arange(SIMHASH_BITS, dtype=np.uint64)) & np.uint64(1)
+        ones = bits.sum(axis=0)
+        return sum(1 << bit for bit in range(SIMHASH_BITS) if 2 * int(ones[bit]) > len(self.values))
+
+    def tee(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Pass chunks through unchanged while hashing them."""
+        for chunk in chunks:
+            self.update(chunk)
+            yield chunk
+
+
+def simhash(text: str) -> Optional[int]:
+    hasher = SimHasher()
+    hasher.update(text)
+    return hasher.digest()
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def _bands(signature: int) -> list[str]:
+    mask = (1 << BAND_BITS) - 1
+    return [f"{i}:{signature >> (i * BAND_BITS) & mask:04x}" for i in range(BANDS)]
+
+
+class NearDuplicateIndex:
+    """Persistent SimHash index of the vault's sources.
+
+    Signatures are stored in ``.dojo_cache``; band buckets are rebuilt in
+    memory on load, so a lookup only compares against sources sharing a
+    16-bit band instead of scanning every source.
+    """
+
+    def __init__(self, vault_path: Path, sources: Optional[dict] = None):
+        self.vault_path = vault_path
+        self.sources: dict[str, dict] = {}
+        self.buckets: dict[str, set[str]] = {}
+        self.dirty = False
+        for source_id, entry in (sources or {}).items():
+            self._insert(source_id, entry)
+
+    def _insert(self, source_id: str, entry: dict) -> None:
+        self.sources[source_id] = entry
+        for band in _bands(int(entry["simhash"], 16)):
+            self.buckets.setdefault(band, set()).add(source_id)
+
+    @classmethod
+    def load(cls, vault_path: Path) -> "NearDuplicateIndex":
+        """Load the index, building it from existing sources the first time."""
+        data = load_json(vault_path, INDEX_FILE_NAME)
+        if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+            return cls(vault_path, data.get("sources", {}))
+        index = cls(vault_path)
+        index.rebuild()
+        return index
+
+    def rebuild(self) -> None:
+        """Hash every existing source attachment (one-off backfill)."""
+        from .attachments import TRANSCRIPT_PATH_RE, read_attachment
+
+        self.sources, self.buckets = {}, {}
+        inbox_path = self.vault_path / "00_Inbox"
+        for note in sorted(inbox_path.glob("SOURCE__*.md")) if inbox_path.exists() else []:
+            try:
+                text = note.read_text(encoding="utf-8")
+                id_match = re.search(r"^id:\s*(\S+)", text, re.MULTILINE)
+                path_match = TRANSCRIPT_PATH_RE.search(text)
+                if not id_match or not path_match:
+                    continue
+                content = read_attachment(self.vault_path, path_match.group(1))
+            except Exception:
+                continue
+            signature = simhash(content) if content else None
+            if signature is not None:
+                self.add(id_match.group(1), signature, note.name)
+        self.dirty = True
+        self.save()
+
+    def find(self, signature: int, max_distance: int = DEFAULT_MAX_DISTANCE) -> Optional[dict]:
+        """Closest indexed source within ``max_distance`` bits whose note still exists."""
+        candidates = set()
+        for band in _bands(signature):
+            candidates |= self.buckets.get(band, set())
+        best = None
+        for source_id in candidates:
+            entry = self.sources[source_id]
+            distance = hamming(signature, int(entry["simhash"], 16))
+            if distance > max_distance or (best and distance >= best["distance"]):
+                continue
+            if not vault_io.exists(self.vault_path / "00_Inbox" / entry["note"]):
+                continue
+            best = {"source_id": source_id, "note": entry["note"], "distance": distance}
+        return best
+
+    def add(self, source_id: str, signature: int, note_name: str) -> None:
+        self._insert(source_id, {"simhash": f"{signature:016x}", "note": note_name})
+        self.dirty = True
+
+    def save(self) -> None:
+        if self.dirty:
+            save_json(
+                self.vault_path,
+                INDEX_FILE_NAME,
+                {"version": INDEX_VERSION, "sources": self.sources},
+            )
+            self.dirty = False
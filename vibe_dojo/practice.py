@@ -0,0 +1,169 @@
+"""Practice session engine: in-memory drill queue with background pre-rendering."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from rich.console import Console
+from rich.markdown import Markdown
+from rich.panel import Panel
+from rich.segment import Segments
+
+from . import vault_io
+from .topic_counters import TopicCounters, drill_topics
+from .trainer import parse_frontmatter, upcoming_entry, upcoming_sort_key
+
+REASONS = {
+    "untried": "New drill added to your inbox",
+    "failed": "Scheduled review after previous failure",
+}
+
+
+def context_panel(frontmatter: dict, topic_progress: Optional[tuple[int, int]] = None) -> Panel:
+    """The CONTEXT panel shown above a drill.
+
+    Args:
+        frontmatter: The drill's frontmatter
+        topic_progress: (passed, total) drills of its first topic, if known
+    """
+    topics = drill_topics(frontmatter)
+    topic_str = "General"
+    if topics and topic_progress:
+        topic_str = f"{topics[0]}: {topic_progress[0]}/{topic_progress[1]} mastered"
+
+    reason = REASONS.get(frontmatter.get("status", "untried"), "Spaced repetition review")
+    timebox = frontmatter.get('timebox_min', 10)
+
+    return Panel(
+        f"[bold cyan]Reason:[/bold cyan] {reason}\n"
+        f"[bold gold1]Topic:[/bold gold1] {topic_str}\n"
+        f"[bold yellow]Timebox:[/bold yellow] {timebox} mins",
+        title="[bold]CONTEXT[/bold]",
+        border_style="dim"
+    )
+
+
+def drill_panel(content: str) -> Panel:
+    return Panel(Markdown(content), title="[bold blue]NEXT DRILL[/bold blue]", border_style="blue")
+
+
+class PreparedDrill:
+    """A drill read, parsed and rendered to segments, ready to print instantly."""
+
+    def __init__(
+        self, path: Path, content: str, frontmatter: dict, context: Segments, body: Segments
+    ):
+        self.path = path
+        self.content = content
+        self.frontmatter = frontmatter
+        self.context = context
+        self.body = body
+
+
+class PracticeSession:
+    """Keeps the drill queue in memory for a practice session.
+
+    The vault is scanned once when the session starts. After each mark only
+    the practiced drill is re-read, and the next drill's panels are rendered
+    on a background thread while the user is still looking at the result.
+    Topic progress comes from the shared TopicCounters that mark_drill keeps
+    current, so it matches ``dojo next``.
+    Marks only flag the dashboard as stale; it is regenerated once, when
+    the session closes.
+
+    Args:
+        vault_path: Vault path
+        console: Console whose width the drills are rendered for
+    """
+
+    def __init__(self, vault_path: Path, console: Optional[Console] = None):
+        self.vault_path = vault_path
+        self.console = console or Console()
+        self.drills: dict[Path, dict] = {}
+        self.counters = TopicCounters.load(vault_path)
+        self._prepared: dict[Path, Future] = {}
+        self._lock = threading.Lock()
+        self._dashboard_stale = False
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dojo-practice")
+
+        drills_path = vault_path / "01_Drills"
+        for drill_file in sorted(drills_path.glob("DRILL__*.md")) if drills_path.exists() else []:
+            self._load(drill_file)
+
+    def _load(self, drill_file: Path) -> None:
+        """(Re)read one drill."""
+        self.drills.pop(drill_file, None)
+        if not vault_io.exists(drill_file):
+            return
+        frontmatter, _ = parse_frontmatter(vault_io.read_text(drill_file))
+        self.drills[drill_file] = frontmatter
+
+    def upcoming(self, count: int = 15) -> list[dict]:
+        """The next ``count`` drills, same shape as trainer.get_upcoming_drills."""
+        today = datetime.now().date()
+        entries = [upcoming_entry(path, fm, today) for path, fm in self.drills.items()]
+        entries.sort(key=upcoming_sort_key)
+        return entries[:count]
+
+    def topic_progress(self, frontmatter: dict) -> Optional[tuple[int, int]]:
+        """(passed, total) drills of the drill's first topic, as shown by ``dojo next``."""
+        topics = drill_topics(frontmatter)
+        return self.counters.progress(topics[0]) if topics else None
+
+    def _prepare(self, drill_file: Path, topic_progress) -> PreparedDrill:
+        content = vault_io.read_text(drill_file)
+        frontmatter, _ = parse_frontmatter(content)
+        return PreparedDrill(
+            drill_file,
+            content,
+            frontmatter,
+            Segments(list(self.console.render(context_panel(frontmatter, topic_progress)))),
+            Segments(list(self.console.render(drill_panel(content)))),
+        )
+
+    def prefetch(self, drill_file: Path) -> None:
+        """Start preparing a drill in the background (no-op if already queued)."""
+        with self._lock:
+            if drill_file in self._prepared or drill_file not in self.drills:
+                return
+            # Counters are read here, on the caller's thread, so the worker never sees them change
+            progress = self.topic_progress(self.drills[drill_file])
+            self._prepared[drill_file] = self._pool.submit(self._prepare, drill_file, progress)
+
+    def prepared(self, drill_file: Path) -> PreparedDrill:
+        """The prepared drill, waiting for the prefetch or preparing it now."""
+        self.prefetch(drill_file)
+        with self._lock:
+            future = self._prepared.get(drill_file)
+        if future is None:
+            return self._prepare(drill_file, None)
+        return future.result()
+
+    def record(self, drill_file: Path, refresh_dashboard: bool = True) -> None:
+        """Pick up a drill's new state after it was marked, then prefetch the next one."""
+        with self._lock:
+            self._prepared.clear()
+        self._load(drill_file)
+        self.counters = TopicCounters.load(self.vault_path)
+        if refresh_dashboard:
+            self._dashboard_stale = True
+        upcoming = self.upcoming(1)
+        if upcoming:
+            self.prefetch(upcoming[0]["path"])
+
+    def close(self) -> None:
+        """Finish pending background work and refresh the dashboard if anything was marked."""
+        self._pool.shutdown(wait=True)
+        if self._dashboard_stale:
+            from .trainer import update_obsidian_dashboard
+
+            self._dashboard_stale = False
+            update_obsidian_dashboard(self.vault_path)
+
+    def __enter__(self) -> "PracticeSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
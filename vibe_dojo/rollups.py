@@ -0,0 +1,173 @@
+"""Incremental practice rollups used to build the insights prompt."""
+
+from pathlib import Path
+
+from .cache import load_json, save_json
+
+ROLLUP_FILE_NAME = "practice_rollup.json"
+ROLLUP_VERSION = 2
+MAX_REFLECTIONS = 8
+
+
+def _empty_rollup() -> dict:
+    return {
+        "version": ROLLUP_VERSION,
+        "processed": {},
+        "drill_topics": {},
+        "topics": {},
+        "drills": {},
+        "reflections": [],
+        "totals": {"logs": 0, "passed": 0, "failed": 0},
+    }
+
+
+def _lookup_drill_topics(vault_path: Path, drill_title: str) -> list[str]:
+    """Find topics for a logged drill (active or archived) by its slug."""
+    from .trainer import parse_frontmatter
+
+    for folder in ("01_Drills", "90_Archive"):
+        drill_file = vault_path / folder / f"DRILL__{drill_title}.md"
+        if drill_file.exists():
+            fm, _ = parse_frontmatter(drill_file.read_text(encoding="utf-8"))
+            topics = fm.get("topics", [])
+            if isinstance(topics, str):
+                topics = [topics.strip()]
+            return [str(t) for t in topics or []]
+    return []
+
+
+def _apply_log(vault_path: Path, rollup: dict, log: dict) -> None:
+    """Fold one practice log into the rollup."""
+    result = log["result"]
+    totals = rollup["totals"]
+    totals["logs"] += 1
+    if result in ("passed", "failed"):
+        totals[result] += 1
+
+    drill_id = log["drill_id"] or log["drill_title"]
+    if drill_id not in rollup["drill_topics"]:
+        rollup["drill_topics"][drill_id] = _lookup_drill_topics(vault_path, log["drill_title"])
+    topics = rollup["drill_topics"][drill_id] or ["General"]
+
+    drill = rollup["drills"].setdefault(
+        drill_id,
+        {"title": log["drill_title"], "passed": 0, "failed": 0, "fail_streak": 0, "last": ""},
+    )
+    buckets = [drill] + [
+        rollup["topics"].setdefault(
+            topic,
+            {
+                "passed": 0,
+                "failed": 0,
+                "other": 0,
+                "fail_streak": 0,
+                "max_fail_streak": 0,
+                "last": "",
+            },
+        )
+        for topic in topics
+    ]
+    for bucket in buckets:
+        if result == "passed":
+            bucket["passed"] += 1
+            bucket["fail_streak"] = 0
+        elif result == "failed":
+            bucket["failed"] += 1
+            bucket["fail_streak"] += 1
+            if "max_fail_streak" in bucket:
+                bucket["max_fail_streak"] = max(bucket["max_fail_streak"], bucket["fail_streak"])
+        elif "other" in bucket:
+            bucket["other"] += 1
+        bucket["last"] = max(bucket["last"], log["date"])
+
+    if log["notes"]:
+        rollup["reflections"].append({
+            "date": log["date"],
+            "title": log["drill_title"],
+            "result": result,
+            "notes": log["notes"][:300],
+        })
+        rollup["reflections"] = rollup["reflections"][-MAX_REFLECTIONS:]
+
+
+def update_practice_rollup(vault_path: Path) -> dict:
+    """Bring the practice rollup up to date and return it.
+
+    Only logs not seen on a previous run are read. Processed logs are keyed
+    on their file stamps; if one disappeared or was rewritten in place (the
+    same drill practised twice in a day), the rollup is rebuilt from scratch.
+    """
+    from .trainer import practice_log_stamps, read_practice_logs
+
+    rollup = load_json(vault_path, ROLLUP_FILE_NAME)
+    if not isinstance(rollup, dict) or rollup.get("version") != ROLLUP_VERSION:
+        rollup = _empty_rollup()
+
+    # Names survive `dojo compact-logs` and packed entries have no stamp of
+    # their own, so packing logs doesn't force a rebuild
+    current = practice_log_stamps(vault_path)
+    processed = rollup["processed"]
+
+    if any(
+        name not in current or current[name] not in (None, stamp)
+        for name, stamp in processed.items()
+    ):
+        rollup = _empty_rollup()
+        processed = rollup["processed"]
+
+    new_names = sorted(name for name in current if name not in processed)
+    if not new_names:
+        return rollup
+
+    new_logs = read_practice_logs(vault_path, new_names)
+    # Apply in chronological order so streaks are correct
+    new_logs.sort(key=lambda log: (log["timestamp"] or log["date"], log["name"]))
+    for log in new_logs:
+        _apply_log(vault_path, rollup, log)
+
+    for name in new_names:
+        processed[name] = current[name]
+    save_json(vault_path, ROLLUP_FILE_NAME, rollup)
+    return rollup
+
+
+def format_rollup(rollup: dict, mastery_titles: list[str]) -> str:
+    """Render the rollup as compact prompt context."""
+    lines = []
+    totals = rollup["totals"]
+    lines.append(
+        f"Total practice sessions: {totals['logs']} "
+        f"({totals['passed']} passed, {totals['failed']} failed)"
+    )
+
+    lines.append("\n**Per-Topic Results:**")
+    topics = sorted(
+        rollup["topics"].items(),
+        key=lambda item: item[1]["passed"] + item[1]["failed"] + item[1]["other"],
+        reverse=True,
+    )
+    for topic, t in topics[:25]:
+        streak = f", current failure streak {t['fail_streak']}" if t["fail_streak"] else ""
+        lines.append(
+            f"- {topic}: {t['passed']} passed / {t['failed']} failed{streak} "
+            f"(worst streak {t['max_fail_streak']}, last practiced {t['last']})"
+        )
+
+    struggling = sorted(
+        (d for d in rollup["drills"].values() if d["fail_streak"] >= 2),
+        key=lambda d: d["fail_streak"],
+        reverse=True,
+    )
+    if struggling:
+        lines.append("\n**Drills Failing Repeatedly:**")
+        for d in struggling[:10]:
+            lines.append(f"- {d['title']}: failed {d['fail_streak']} times in a row")
+
+    if rollup["reflections"]:
+        lines.append("\n**Recent Reflections:**")
+        for r in reversed(rollup["reflections"]):
+            lines.append(f"- {r['date']} {r['title']} ({r['result']}): {r['notes']}")
+
+    lines.append(f"\n**Mastery Notes ({len(mastery_titles)} total, most recent):**")
+    lines.append(", ".join(mastery_titles[:30]) or "None yet")
+    return "\n".join(lines)
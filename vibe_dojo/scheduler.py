@@ -0,0 +1,333 @@
+"""Spaced-repetition schedulers (ladder, SM-2, FSRS) and the review-load forecast.
+
+Every scheduler's ``review`` works on NumPy arrays (or plain scalars), so the
+same update rule schedules one drill in ``mark_drill`` and every drill at
+once in ``forecast_load``.
+"""
+
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+# Review grades (FSRS naming)
+AGAIN, HARD, GOOD, EASY = 1, 2, 3, 4
+
+DEFAULT_ALGORITHM = "ladder"
+DEFAULT_RETENTION = 0.9
+MAX_INTERVAL_DAYS = 365 * 10
+FORECAST_DAYS = 365
+# Enough review rounds for even a 1-day interval chain to leave a year's horizon
+MAX_FORECAST_ROUNDS = 400
+
+DUE_STATUSES = {"untried", "failed", "passed"}
+
+
+def grade_for(result: str, effort: int = 0) -> int:
+    """Map a practice result and its 1-5 effort to a review grade.
+
+    ``effort`` is the self-assessment asked after a pass (1 = struggled,
+    5 = effortless), not the drill's quality rating. Failed is always
+    AGAIN; a pass with effort 1-2 is HARD, 5 is EASY and anything else
+    (including not asked) is GOOD.
+    """
+    if result == "failed":
+        return AGAIN
+    if result != "passed":
+        raise ValueError(f"No review grade for result: {result}")
+    if 1 <= effort <= 2:
+        return HARD
+    if effort >= 5:
+        return EASY
+    return GOOD
+
+
+def _clamp_interval(interval):
+    return np.clip(np.round(interval), 1, MAX_INTERVAL_DAYS)
+
+
+class Scheduler:
+    """Base class: state lives in drill frontmatter under ``fields``.
+
+    Args:
+        retention: Target probability of recalling a drill when it comes due
+    """
+
+    name = ""
+    # Frontmatter key -> value for a drill that was never reviewed
+    fields: dict = {}
+    # Whether the review grade (and so the effort question) matters
+    graded = True
+
+    def __init__(self, retention: float = DEFAULT_RETENTION):
+        self.retention = retention
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(retention={self.retention})"
+
+    def review(self, state: dict, grade, elapsed_days):
+        """Apply one review.
+
+        Args:
+            state: Field name -> value (scalars or equally shaped arrays)
+            grade: AGAIN/HARD/GOOD/EASY (scalar or array)
+            elapsed_days: Days since the previous review
+
+        Returns:
+            Tuple of (new_state, interval_days)
+        """
+        raise NotImplementedError
+
+    def recall_probability(self, state: dict, elapsed_days):
+        """Chance of passing a review after ``elapsed_days`` (used by the forecast)."""
+        return np.full(np.shape(elapsed_days), self.retention, dtype=float)
+
+
+class LadderScheduler(Scheduler):
+    """The original fixed ladder: 7, 21, 60 then 90 days; failures come back tomorrow."""
+
+    name = "ladder"
+    fields = {"review_count": 0}
+    graded = False
+    LADDER = (7, 21, 60)
+    FINAL_INTERVAL = 90
+
+    def review(self, state, grade, elapsed_days):
+        reps = np.asarray(state["review_count"]).astype(int)
+        ladder = np.array(self.LADDER + (self.FINAL_INTERVAL,))
+        passed = np.asarray(grade) > AGAIN
+        interval = np.where(passed, ladder[np.minimum(reps, len(self.LADDER))], 1)
+        return {"review_count": np.where(passed, reps + 1, reps)}, interval
+
+
+class SM2Scheduler(Scheduler):
+    """SuperMemo-2: an ease factor per drill that scales the previous interval.
+
+    ``stability`` holds the previous interval in days (0 = never reviewed).
+    """
+
+    name = "sm2"
+    fields = {"stability": 0.0, "ease": 2.5}
+    MIN_EASE = 1.3
+    # SM-2 quality (0-5) for each grade
+    QUALITY = np.array([0, 2, 3, 4, 5])
+
+    def review(self, state, grade, elapsed_days):
+        interval = np.asarray(state["stability"], dtype=float)
+        ease = np.asarray(state["ease"], dtype=float)
+        q = self.QUALITY[np.asarray(grade)]
+
+        ease = np.maximum(self.MIN_EASE, ease + 0.1 - (5 - q) * (0.08 + (5 - q) * 0.02))
+        grown = np.where(interval < 1, 1, np.where(interval < 6, 6, interval * ease))
+        interval = _clamp_interval(np.where(q < 3, 1, grown))
+        return {"stability": interval, "ease": ease}, interval
+
+
+class FSRSScheduler(Scheduler):
+    """FSRS (v4.5 default weights): per-drill stability and difficulty.
+
+    Stability is the number of days until recall probability falls to 90%;
+    the next interval is chosen so recall is at ``retention`` when due.
+    """
+
+    name = "fsrs"
+    fields = {"stability": 0.0, "difficulty": 0.0}
+    W = (
+        0.4872, 1.4003, 3.7145, 13.8206, 5.1618, 1.2298, 0.8975, 0.031, 1.6474,
+        0.1367, 1.0461, 2.1072, 0.0793, 0.3246, 1.587, 0.2272, 2.8755,
+    )
+    DECAY = -0.5
+    FACTOR = 19 / 81
+
+    def recall_probability(self, state, elapsed_days):
+        stability = np.maximum(np.asarray(state["stability"], dtype=float), 0.01)
+        known = np.asarray(state["stability"]) > 0
+        forgetting = (1 + self.FACTOR * np.asarray(elapsed_days) / stability) ** self.DECAY
+        return np.where(known, forgetting, self.retention)
+
+    def _initial_difficulty(self, grade):
+        return np.clip(self.W[4] - (grade - 3) * self.W[5], 1, 10)
+
+    def review(self, state, grade, elapsed_days):
+        w = self.W
+        grade = np.asarray(grade)
+        stability = np.maximum(np.asarray(state["stability"], dtype=float), 0.01)
+        difficulty = np.clip(np.asarray(state["difficulty"], dtype=float), 1, 10)
+        new = np.asarray(state["stability"]) <= 0
+        recall = self.recall_probability(state, elapsed_days)
+
+        # Difficulty moves with the grade and reverts towards an EASY first review
+        moved = difficulty - w[6] * (grade - 3)
+        next_difficulty = np.clip(
+            w[7] * self._initial_difficulty(EASY) + (1 - w[7]) * moved, 1, 10
+        )
+        bonus = np.where(grade == HARD, w[15], 1.0) * np.where(grade == EASY, w[16], 1.0)
+        growth = np.exp(w[10] * (1 - recall)) - 1
+        recalled = stability * (
+            1 + np.exp(w[8]) * (11 - difficulty) * stability ** -w[9] * growth * bonus
+        )
+        forgot = (
+            w[11] * difficulty ** -w[12] * ((stability + 1) ** w[13] - 1)
+            * np.exp(w[14] * (1 - recall))
+        )
+        next_stability = np.where(grade == AGAIN, np.minimum(forgot, stability), recalled)
+
+        initial_stability = np.array(w[:4])[grade - 1]
+        next_stability = np.where(new, initial_stability, next_stability)
+        next_difficulty = np.where(new, self._initial_difficulty(grade), next_difficulty)
+
+        interval = next_stability / self.FACTOR * (self.retention ** (1 / self.DECAY) - 1)
+        next_state = {"stability": next_stability, "difficulty": next_difficulty}
+        return next_state, _clamp_interval(interval)
+
+
+SCHEDULERS = {cls.name: cls for cls in (LadderScheduler, SM2Scheduler, FSRSScheduler)}
+
+
+def get_scheduler(vault_path: Optional[Path] = None, algorithm: Optional[str] = None) -> Scheduler:
+    """The scheduler configured under ``scheduler:`` in config.yaml.
+
+    Args:
+        vault_path: Vault whose config to read
+        algorithm: Override the configured algorithm (ladder, sm2 or fsrs)
+    """
+    settings = {}
+    if vault_path is not None:
+        from .config import Config
+
+        settings = Config(vault_path).config.get("scheduler", {}) or {}
+    name = algorithm or settings.get("algorithm") or DEFAULT_ALGORITHM
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown scheduler '{name}' (choose from {', '.join(SCHEDULERS)})")
+    return SCHEDULERS[name](retention=float(settings.get("retention", DEFAULT_RETENTION)))
+
+
+def _as_date(value) -> Optional[date]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.fromisoformat(str(value)).date()
+    except ValueError:
+        return None
+
+
+def drill_state(scheduler: Scheduler, frontmatter: dict) -> dict:
+    """The scheduler's fields from a drill's frontmatter, defaulting for new drills."""
+    state = {}
+    for key, default in scheduler.fields.items():
+        try:
+            state[key] = type(default)(frontmatter.get(key) or default)
+        except (TypeError, ValueError):
+            state[key] = default
+    return state
+
+
+def compute_review_update(
+    scheduler: Scheduler,
+    frontmatter: dict,
+    result: str,
+    effort: int = 0,
+    today: Optional[date] = None,
+) -> dict:
+    """Frontmatter updates for a drill reviewed ``today`` (no I/O).
+
+    Args:
+        scheduler: Scheduler to apply
+        frontmatter: The drill's current frontmatter
+        result: passed or failed
+        effort: 1-5 effort after a pass (0 = not asked), see grade_for
+        today: Review date (default: today)
+
+    Returns:
+        Dict of status, next_review, last_review, review_count and the
+        scheduler's state fields
+    """
+    today = today or datetime.now().date()
+    last_review = _as_date(frontmatter.get("last_review"))
+    elapsed = (today - last_review).days if last_review else 0
+
+    grade = grade_for(result, effort)
+    state, interval = scheduler.review(drill_state(scheduler, frontmatter), grade, elapsed)
+    review_count = int(frontmatter.get("review_count", 0) or 0)
+    updates = {
+        "status": result,
+        "review_count": review_count + 1 if result == "passed" else review_count,
+        "next_review": date.fromordinal(today.toordinal() + int(interval)).isoformat(),
+        "last_review": today.isoformat(),
+    }
+    for key, value in state.items():
+        value = value.item() if hasattr(value, "item") else value
+        updates[key] = round(value, 4) if isinstance(value, float) else value
+    return updates
+
+
+def load_review_states(
+    vault_path: Path, scheduler: Scheduler, today: Optional[date] = None
+) -> dict:
+    """Collect every active drill's schedule into arrays.
+
+    Returns:
+        Dict with ``due`` (days from today, negative if overdue), ``elapsed``
+        (days since the last review at the time it comes due) and one array
+        per scheduler field
+    """
+    from .trainer import parse_frontmatter
+
+    today = today or datetime.now().date()
+    columns = {"due": [], "elapsed": [], **{key: [] for key in scheduler.fields}}
+    drills_path = vault_path / "01_Drills"
+    for drill_file in sorted(drills_path.glob("DRILL__*.md")) if drills_path.exists() else []:
+        try:
+            frontmatter, _ = parse_frontmatter(drill_file.read_text(encoding="utf-8"))
+        except Exception:
+            continue
+        if frontmatter.get("status", "untried") not in DUE_STATUSES:
+            continue
+        due = _as_date(frontmatter.get("next_review")) or today
+        last_review = _as_date(frontmatter.get("last_review"))
+        columns["due"].append((due - today).days)
+        columns["elapsed"].append((max(due, today) - last_review).days if last_review else 0)
+        for key, value in drill_state(scheduler, frontmatter).items():
+            columns[key].append(value)
+    return {key: np.array(values, dtype=float) for key, values in columns.items()}
+
+
+def forecast_load(states: dict, scheduler: Scheduler, days: int = FORECAST_DAYS) -> np.ndarray:
+    """Expected number of reviews per day for the next ``days`` days.
+
+    All drills advance together, one review round per loop step: each due
+    review counts once, assuming a GOOD grade, and a failure (probability
+    1 - recall) adds a retry the next day. Overdue drills land on day 0.
+
+    Args:
+        states: Result of load_review_states
+        scheduler: Scheduler whose intervals to simulate
+        days: Forecast horizon
+
+    Returns:
+        Array of ``days`` expected review counts, index 0 being today
+    """
+    load = np.zeros(days)
+    due = np.maximum(states["due"], 0)
+    elapsed = states["elapsed"]
+    state = {key: states[key] for key in scheduler.fields}
+
+    for _ in range(MAX_FORECAST_ROUNDS):
+        active = due < days
+        if not active.any():
+            break
+        day = due[active].astype(int)
+        np.add.at(load, day, 1)
+        fail = 1 - scheduler.recall_probability(state, elapsed)[active]
+        retry = day + 1 < days
+        np.add.at(load, day[retry] + 1, fail[retry])
+
+        state, interval = scheduler.review(state, np.full(due.shape, GOOD), elapsed)
+        due = np.where(active, due + interval, due)
+        elapsed = interval
+    return load
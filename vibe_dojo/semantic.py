@@ -6,23 +6,16 @@ from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import hashlib
 
-from google import genai
-from google.genai import types
 import numpy as np
 
+from .gemini import call_with_retry, get_client
+from .telemetry import track_call
+
 CACHE_DIR_NAME = ".dojo_cache"
 INDEX_FILE_NAME = "embeddings_index.json"
 EMBEDDING_MODEL = "models/text-embedding-004"
 
 
-def get_client() -> genai.Client:
-    """Initialize and return the Gen AI client."""
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment.")
-    return genai.Client(api_key=api_key)
-
-
 def cosine_similarity(v1: List[float], v2: List[float]) -> float:
     """Compute cosine similarity between two vectors."""
     dot_product = np.dot(v1, v2)
@@ -77,15 +70,18 @@ class SemanticIndex:
             return []
             
         client = self._get_client()
-        try:
-            result = client.models.embed_content(
-                model=EMBEDDING_MODEL,
-                contents=text
+        # Transient failures are retried by the shared call layer; anything
+        # left is a real error and is raised instead of returning [].
+        with track_call("embed", EMBEDDING_MODEL, input_chars=len(text)) as call:
+            result = call_with_retry(
+                lambda: client.models.embed_content(
+                    model=EMBEDDING_MODEL,
+                    contents=text
+                ),
+                est_tokens=len(text) // 4,
+                call=call,
             )
-            return result.embeddings[0].values
-        except Exception as e:
-            print(f"[ERROR] Embedding generation failed: {e}")
-            return []
+        return result.embeddings[0].values
 
     def update_file(self, file_path: Path, doc_type: str) -> bool:
         """Update embedding for a file if it changed. Returns True if updated."""
@@ -139,26 +135,28 @@ class SemanticIndex:
     def index_vault(self) -> int:
         """Scan vault and update index. Returns number of updated files."""
         updated_count = 0
-        
-        # Index Mastery Notes
-        mastery_path = self.vault_path / "10_Mastery"
-        if mastery_path.exists():
-            for f in mastery_path.glob("MASTERY__*.md"):
-                if self.update_file(f, "mastery"):
-                    updated_count += 1
-                    print(f"Indexing: {f.name}")
-
-        # Index Drills
-        drills_path = self.vault_path / "01_Drills"
-        if drills_path.exists():
-            for f in drills_path.glob("DRILL__*.md"):
-                if self.update_file(f, "drill"):
-                    updated_count += 1
-                    print(f"Indexing: {f.name}")
-
-        if updated_count > 0:
-            self._save_index()
-            
+
+        try:
+            # Index Mastery Notes
+            mastery_path = self.vault_path / "10_Mastery"
+            if mastery_path.exists():
+                for f in mastery_path.glob("MASTERY__*.md"):
+                    if self.update_file(f, "mastery"):
+                        updated_count += 1
+                        print(f"Indexing: {f.name}")
+
+            # Index Drills
+            drills_path = self.vault_path / "01_Drills"
+            if drills_path.exists():
+                for f in drills_path.glob("DRILL__*.md"):
+                    if self.update_file(f, "drill"):
+                        updated_count += 1
+                        print(f"Indexing: {f.name}")
+        finally:
+            # Keep progress even if the API gives up part-way through
+            if updated_count > 0:
+                self._save_index()
+
         return updated_count
 
     def find_similar(self, query: str = "", query_embedding: Optional[List[float]] = None, limit: int = 5, threshold: float = 0.7) -> List[Dict]:
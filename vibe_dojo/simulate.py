@@ -0,0 +1,147 @@
+"""Scheduler simulation: replay years of practice against an in-memory vault.
+
+A synthetic population of drills is practiced by a stochastic learner. Each
+simulated day runs the real ``select_next`` / ``compute_review_update``
+decisions (the pure halves of ``get_next_drill`` and ``mark_drill``) on
+frontmatter dicts, so no files are touched and runs are repeatable for a
+given seed.
+"""
+
+import math
+import random
+import time
+from datetime import date, timedelta
+from typing import Optional
+
+import numpy as np
+
+from .scheduler import Scheduler, compute_review_update
+from .trainer import select_next
+
+DEFAULT_DRILLS = 500
+DEFAULT_DAYS = 730
+DEFAULT_PER_DAY = 5
+DEFAULT_NEW_PER_DAY = 1
+# Days after which the retention curve is sampled in the report
+RETENTION_CHECKPOINTS = (30, 90, 180, 365, 730)
+
+# Learner model: recall after ``elapsed`` days is 0.9 ** (elapsed / memory)
+BASE_RECALL = 0.9
+FIRST_TRY_PASS = 0.6
+MEMORY_GROWTH = 2.5
+LAPSE_FACTOR = 0.3
+
+
+class SimulatedLearner:
+    """Hidden memory model for each drill, independent of any scheduler.
+
+    ``memory`` is the number of days until recall drops to 90%. A pass
+    multiplies it by a per-drill growth factor (harder drills grow slower);
+    a failure cuts it back.
+    """
+
+    def __init__(self, drills: int, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.growth = np.array([MEMORY_GROWTH * self.rng.uniform(0.5, 1.5) for _ in range(drills)])
+        self.memory = np.ones(drills)
+        self.last_seen = np.full(drills, -1)
+
+    def recall_probability(self, index: int, day: int) -> float:
+        if self.last_seen[index] < 0:
+            return FIRST_TRY_PASS
+        return BASE_RECALL ** ((day - self.last_seen[index]) / self.memory[index])
+
+    def practice(self, index: int, day: int) -> tuple[str, int]:
+        """Attempt a drill; returns (result, 1-5 effort)."""
+        recall = self.recall_probability(index, day)
+        passed = self.rng.random() < recall
+        if passed:
+            if self.last_seen[index] >= 0:
+                self.memory[index] *= self.growth[index]
+            effort = 5 if recall > 0.95 else 4 if recall > 0.85 else 3 if recall > 0.7 else 2
+        else:
+            self.memory[index] = max(1.0, self.memory[index] * LAPSE_FACTOR)
+            effort = 3
+        self.last_seen[index] = day
+        return ("passed" if passed else "failed"), effort
+
+    def retention(self, day: int) -> Optional[float]:
+        """Mean recall probability across drills practiced at least once."""
+        seen = self.last_seen >= 0
+        if not seen.any():
+            return None
+        elapsed = day - self.last_seen[seen]
+        return float(np.mean(BASE_RECALL ** (elapsed / self.memory[seen])))
+
+
+def simulate(
+    scheduler: Scheduler,
+    drills: int = DEFAULT_DRILLS,
+    days: int = DEFAULT_DAYS,
+    per_day: int = DEFAULT_PER_DAY,
+    new_per_day: float = DEFAULT_NEW_PER_DAY,
+    seed: int = 0,
+) -> dict:
+    """Replay ``days`` of daily practice sessions.
+
+    Args:
+        scheduler: Scheduler under test
+        drills: Size of the synthetic drill population
+        days: Days to simulate
+        per_day: Daily practice cap (max_drills_per_day)
+        new_per_day: Drills added to the vault per day until all have arrived
+        seed: Random seed for the learner
+
+    Returns:
+        Dict with decisions, decisions_per_sec, passed, failed, and per-day
+        lists queue (due drills left after the session), practiced and
+        retention (mean recall, None before the first practice)
+    """
+    learner = SimulatedLearner(drills, seed=seed)
+    start = date(2000, 1, 1)
+    vault: dict[int, dict] = {}
+    stats = {
+        "decisions": 0,
+        "passed": 0,
+        "failed": 0,
+        "queue": [],
+        "practiced": [],
+        "retention": [],
+    }
+    decision_time = 0.0
+
+    for day in range(days):
+        today = start + timedelta(days=day)
+        for index in range(len(vault), min(drills, math.floor((day + 1) * new_per_day))):
+            vault[index] = {
+                "status": "untried",
+                "next_review": today.isoformat(),
+                "review_count": 0,
+            }
+
+        practiced = 0
+        while practiced < per_day:
+            tick = time.perf_counter()
+            index = select_next(vault.items(), today)
+            decision_time += time.perf_counter() - tick
+            if index is None:
+                break
+
+            result, effort = learner.practice(index, day)
+
+            tick = time.perf_counter()
+            update = compute_review_update(scheduler, vault[index], result, effort, today=today)
+            vault[index].update(update)
+            decision_time += time.perf_counter() - tick
+
+            stats["decisions"] += 1
+            stats[result] += 1
+            practiced += 1
+
+        today_str = today.isoformat()
+        stats["queue"].append(sum(1 for fm in vault.values() if fm["next_review"] <= today_str))
+        stats["practiced"].append(practiced)
+        stats["retention"].append(learner.retention(day))
+
+    stats["decisions_per_sec"] = stats["decisions"] / decision_time if decision_time else 0.0
+    return stats
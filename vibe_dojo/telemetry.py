@@ -0,0 +1,185 @@
+"""Local telemetry ledger for LLM and embedding calls."""
+
+import contextvars
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+
+TELEMETRY_PATH = Path.home() / ".vibe_dojo_telemetry.jsonl"
+
+# Approximate list prices in USD per 1M tokens: (input, output)
+MODEL_PRICES_PER_MTOK = {
+    "gemini-1.5-flash": (0.075, 0.30),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gemini-3-flash-preview": (0.50, 3.00),
+    "models/text-embedding-004": (0.0, 0.0),
+}
+
+_tags: contextvars.ContextVar[dict] = contextvars.ContextVar("telemetry_tags", default={})
+_write_lock = threading.Lock()
+
+
+@contextmanager
+def tag(**tags) -> Iterator[None]:
+    """Attach tags (e.g. source=<id>) to every call recorded in this context."""
+    token = _tags.set({**_tags.get(), **tags})
+    try:
+        yield
+    finally:
+        _tags.reset(token)
+
+
+def record_usage(call: dict, response) -> None:
+    """Copy token counts from a Gemini response's usage_metadata into a call record.
+
+    Safe to call repeatedly while streaming; the last chunk carries the totals.
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_token_count", None)
+    output_tokens = getattr(usage, "candidates_token_count", None)
+    if isinstance(prompt_tokens, int):
+        call["prompt_tokens"] = prompt_tokens
+    if isinstance(output_tokens, int):
+        call["output_tokens"] = output_tokens
+
+
+@contextmanager
+def track_call(op: str, model: str, input_chars: int = 0) -> Iterator[dict]:
+    """Time an API call and append it to the ledger when the block exits.
+
+    The yielded dict can be updated by the caller (token counts, retries,
+    cache_hit, outcome). Exceptions are recorded as outcome "error" and
+    re-raised. Time spent in ``paused(call)`` blocks is left out of the
+    latency.
+    """
+    call = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "op": op,
+        "model": model,
+        "prompt_tokens": None,
+        "output_tokens": None,
+        "input_chars": input_chars,
+        "retries": 0,
+        "cache_hit": False,
+        "outcome": "ok",
+        **_tags.get(),
+    }
+    start = time.perf_counter()
+    try:
+        yield call
+    except GeneratorExit:
+        call["outcome"] = "cancelled"
+        raise
+    except BaseException as e:
+        call["outcome"] = "error"
+        call["error"] = type(e).__name__
+        raise
+    finally:
+        elapsed = time.perf_counter() - start - call.pop("_paused_s", 0.0)
+        call["latency_ms"] = round(elapsed * 1000, 1)
+        append_record(call)
+
+
+@contextmanager
+def paused(call: dict) -> Iterator[None]:
+    """Stop a track_call clock for this block.
+
+    Wrap a streaming generator's ``yield`` in it so the latency covers the
+    API (up to the last chunk), not the consumer writing notes in between.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        call["_paused_s"] = call.get("_paused_s", 0.0) + time.perf_counter() - start
+
+
+def append_record(call: dict) -> None:
+    """Append one call record to the ledger (never raises)."""
+    try:
+        line = json.dumps(call, default=str)
+        with _write_lock:
+            with open(TELEMETRY_PATH, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    except OSError:
+        pass
+
+
+def load_records(days: Optional[int] = None) -> list[dict]:
+    """Load ledger records, optionally limited to the last N days."""
+    if not TELEMETRY_PATH.exists():
+        return []
+    cutoff = (datetime.now() - timedelta(days=days)).isoformat() if days else ""
+    records = []
+    with open(TELEMETRY_PATH, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("ts", "") >= cutoff:
+                records.append(record)
+    return records
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (values need not be sorted)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def estimate_cost(record: dict) -> Optional[float]:
+    """Estimated USD cost of a call, or None for unknown models."""
+    prices = MODEL_PRICES_PER_MTOK.get(record.get("model", ""))
+    if prices is None:
+        return None
+    prompt_tokens = record.get("prompt_tokens") or 0
+    output_tokens = record.get("output_tokens") or 0
+    return (prompt_tokens * prices[0] + output_tokens * prices[1]) / 1_000_000
+
+
+def summarize(records: list[dict]) -> dict:
+    """Aggregate records per (op, model), per day and per source."""
+    def empty() -> dict:
+        return {"calls": 0, "errors": 0, "cache_hits": 0, "retries": 0,
+                "prompt_tokens": 0, "output_tokens": 0, "cost": 0.0, "latencies": []}
+
+    def add(bucket: dict, record: dict) -> None:
+        bucket["calls"] += 1
+        bucket["errors"] += record.get("outcome") == "error"
+        bucket["cache_hits"] += bool(record.get("cache_hit"))
+        bucket["retries"] += record.get("retries") or 0
+        bucket["prompt_tokens"] += record.get("prompt_tokens") or 0
+        bucket["output_tokens"] += record.get("output_tokens") or 0
+        bucket["cost"] += estimate_cost(record) or 0.0
+        if not record.get("cache_hit"):
+            bucket["latencies"].append(record.get("latency_ms", 0.0))
+
+    by_model: dict[tuple, dict] = {}
+    by_day: dict[str, dict] = {}
+    by_source: dict[str, dict] = {}
+    for record in records:
+        add(by_model.setdefault((record.get("op", "?"), record.get("model", "?")), empty()), record)
+        add(by_day.setdefault(record.get("ts", "")[:10], empty()), record)
+        if record.get("source"):
+            add(by_source.setdefault(record["source"], empty()), record)
+
+    for bucket in [*by_model.values(), *by_day.values(), *by_source.values()]:
+        latencies = bucket.pop("latencies")
+        bucket["p50_ms"] = percentile(latencies, 50)
+        bucket["p95_ms"] = percentile(latencies, 95)
+        bucket["max_ms"] = max(latencies) if latencies else 0.0
+
+    return {"by_model": by_model, "by_day": by_day, "by_source": by_source}
@@ -0,0 +1,218 @@
+"""Incremental per-topic counters (drills, passed, mastery, ratings, last practiced).
+
+The counters live in ``.dojo_cache`` and are updated by the functions that
+write drills, practice logs and mastery notes, so topic stats are read
+without parsing any notes. Each save records a stamp of the folders they
+are derived from (see cache.folder_stamp); if anything else changed those
+folders since (a note added, deleted or edited in place outside
+Vibe-Dojo), the counters are rebuilt from a full scan on the next load.
+"""
+
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from . import vault_io
+from .cache import folder_stamp, load_json, save_json
+
+COUNTERS_FILE_NAME = "topic_counters.json"
+COUNTERS_VERSION = 2
+STAMPED_FOLDERS = ("01_Drills", "02_Practice_Logs", "10_Mastery")
+
+# Counters with a save waiting for the current write-behind block to commit,
+# so a second load inside the block sees the same (newer) numbers
+_pending: dict[Path, "TopicCounters"] = {}
+_pending_lock = threading.Lock()
+
+
+def drill_topics(frontmatter: dict) -> list[str]:
+    topics = frontmatter.get("topics", [])
+    if isinstance(topics, str):
+        return [topics.strip()]
+    return [str(t) for t in topics or []]
+
+
+def _folder_stamp(vault_path: Path) -> dict:
+    return {folder: folder_stamp(vault_path / folder) for folder in STAMPED_FOLDERS}
+
+
+def _empty_topic() -> dict:
+    return {
+        "drills": 0,
+        "passed": 0,
+        "mastery": 0,
+        "rating_sum": 0,
+        "rating_count": 0,
+        "last_practiced": None,
+    }
+
+
+class TopicCounters:
+    """Per-topic aggregates plus each active drill's contribution to them.
+
+    Keeping the per-drill part means a status change or an archived drill
+    can be subtracted exactly instead of recounting.
+    """
+
+    def __init__(self, vault_path: Path, data: Optional[dict] = None):
+        self.vault_path = vault_path
+        data = data or {}
+        self.topics: dict[str, dict] = data.get("topics", {})
+        self.drills: dict[str, dict] = data.get("drills", {})
+
+    @classmethod
+    def load(cls, vault_path: Path) -> "TopicCounters":
+        """Load the counters, rebuilding them if missing or out of date."""
+        with _pending_lock:
+            if vault_path in _pending:
+                return _pending[vault_path]
+        data = load_json(vault_path, COUNTERS_FILE_NAME)
+        if (
+            isinstance(data, dict)
+            and data.get("version") == COUNTERS_VERSION
+            and data.get("stamp") == _folder_stamp(vault_path)
+        ):
+            return cls(vault_path, data)
+        counters = cls(vault_path)
+        counters.rebuild()
+        counters.save()
+        return counters
+
+    def rebuild(self) -> None:
+        """Recount everything from the drill, mastery and log notes."""
+        from .trainer import iter_practice_logs, parse_frontmatter
+
+        self.topics, self.drills = {}, {}
+        drills_path = self.vault_path / "01_Drills"
+        if drills_path.exists():
+            for drill_file in drills_path.glob("DRILL__*.md"):
+                fm, _ = parse_frontmatter(drill_file.read_text(encoding="utf-8"))
+                drill_id = str(fm.get("id") or drill_file.stem)
+                self.set_drill(drill_id, drill_topics(fm), fm.get("status", "untried"))
+
+        mastery_path = self.vault_path / "10_Mastery"
+        if mastery_path.exists():
+            for mastery_file in mastery_path.glob("MASTERY__*.md"):
+                fm, _ = parse_frontmatter(mastery_file.read_text(encoding="utf-8"))
+                self.add_mastery(drill_topics(fm))
+
+        for log in iter_practice_logs(self.vault_path):
+            self.add_rating(log["drill_id"], log["rating"], log["date"] or None)
+
+    def _apply(self, drill_id: str, sign: int) -> None:
+        drill = self.drills[drill_id]
+        for topic in drill["topics"]:
+            counts = self.topics.setdefault(topic, _empty_topic())
+            counts["drills"] += sign
+            counts["passed"] += sign * (drill["status"] == "passed")
+            counts["rating_sum"] += sign * drill["rating_sum"]
+            counts["rating_count"] += sign * drill["rating_count"]
+            if sign > 0 and drill["last_practiced"]:
+                counts["last_practiced"] = max(
+                    counts["last_practiced"] or "", drill["last_practiced"]
+                )
+
+    def set_drill(self, drill_id: str, topics: list[str], status: str) -> None:
+        """Add a drill or update its topics/status."""
+        drill = self.drills.get(drill_id)
+        if drill is not None:
+            self._apply(drill_id, -1)
+        else:
+            drill = {"rating_sum": 0, "rating_count": 0, "last_practiced": None}
+        drill.update({"topics": list(topics), "status": status})
+        self.drills[drill_id] = drill
+        self._apply(drill_id, +1)
+
+    def remove_drill(self, drill_id: str) -> None:
+        """Forget an archived drill (its ratings no longer count)."""
+        if drill_id not in self.drills:
+            return
+        self._apply(drill_id, -1)
+        removed = self.drills.pop(drill_id)
+        # A maximum can't be subtracted: recount it from the topic's remaining drills
+        for topic in removed["topics"]:
+            self.topics[topic]["last_practiced"] = max(
+                (
+                    d["last_practiced"]
+                    for d in self.drills.values()
+                    if topic in d["topics"] and d["last_practiced"]
+                ),
+                default=None,
+            )
+
+    def add_rating(self, drill_id: str, rating: int, day: Optional[str] = None) -> None:
+        """Count one practice of an active drill."""
+        if drill_id not in self.drills:
+            return
+        self._apply(drill_id, -1)
+        drill = self.drills[drill_id]
+        if rating > 0:
+            drill["rating_sum"] += rating
+            drill["rating_count"] += 1
+        if day:
+            drill["last_practiced"] = max(drill["last_practiced"] or "", day)
+        self._apply(drill_id, +1)
+
+    def record_review(
+        self, drill_path: Path, frontmatter: dict, updates: dict, rating: int = 0
+    ) -> None:
+        """Fold one mark_drill result (its frontmatter updates) into the counters."""
+        drill_id = str(frontmatter.get("id") or drill_path.stem)
+        if updates.get("status") in {"bullshit", "outdated"}:
+            self.remove_drill(drill_id)
+        else:
+            self.set_drill(drill_id, drill_topics(frontmatter), updates.get("status", "untried"))
+            self.add_rating(drill_id, rating, datetime.now().date().isoformat())
+
+    def add_mastery(self, topics: list[str]) -> None:
+        for topic in topics:
+            self.topics.setdefault(topic, _empty_topic())["mastery"] += 1
+
+    def progress(self, topic: str) -> Optional[tuple[int, int]]:
+        """(passed, total) drills for a topic, or None if it has none."""
+        counts = self.topics.get(topic)
+        if not counts or not counts["drills"]:
+            return None
+        return counts["passed"], counts["drills"]
+
+    def stats(self) -> list[dict]:
+        """Same shape as trainer.get_topics_stats, sorted by mastery count."""
+        results = [
+            {
+                "name": topic,
+                "mastery": counts["mastery"],
+                "passed": counts["passed"],
+                "total": counts["drills"],
+                "avg_rating": (
+                    counts["rating_sum"] / counts["rating_count"] if counts["rating_count"] else 0
+                ),
+                "last_practiced": counts["last_practiced"],
+            }
+            for topic, counts in self.topics.items()
+            if counts["drills"] or counts["mastery"]
+        ]
+        return sorted(results, key=lambda x: x["mastery"], reverse=True)
+
+    def save(self) -> None:
+        """Persist once the surrounding write-behind block (if any) has committed.
+
+        The folder stamp has to be taken after the notes these counters
+        describe are on disk, or the next load would rebuild.
+        """
+        with _pending_lock:
+            if _pending.get(self.vault_path) is self:
+                return
+            _pending[self.vault_path] = self
+
+        def commit():
+            with _pending_lock:
+                _pending.pop(self.vault_path, None)
+            save_json(self.vault_path, COUNTERS_FILE_NAME, {
+                "version": COUNTERS_VERSION,
+                "stamp": _folder_stamp(self.vault_path),
+                "topics": self.topics,
+                "drills": self.drills,
+            })
+
+        vault_io.on_commit(commit)
@@ -1,12 +1,14 @@
 """Trainer loop: next, mark, promote."""
 
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+from . import vault_io
+
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
     """Parse YAML frontmatter from markdown content.
@@ -25,48 +27,91 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     return frontmatter, body
 
 
-def update_frontmatter(file_path: Path, updates: dict) -> None:
-    """Update frontmatter in a markdown file."""
-    content = file_path.read_text(encoding="utf-8")
-    frontmatter, body = parse_frontmatter(content)
+FRONTMATTER_RE = re.compile(r"^---\n(.*?\n)?---\n", re.DOTALL)
+TOP_LEVEL_KEY_RE = re.compile(r"^([A-Za-z0-9_-]+):")
+ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _frontmatter_line(key: str, value) -> str:
+    """One ``key: value`` line; lists stay inline like the drill template writes them."""
+    if isinstance(value, str) and ISO_DATE_RE.match(value):
+        # Unquoted, as the drill template writes dates (YAML quotes them)
+        return f"{key}: {value}"
+    if isinstance(value, (list, dict)):
+        inline = yaml.safe_dump(
+            value, default_flow_style=True, allow_unicode=True, width=float("inf")
+        )
+        return f"{key}: {inline.strip()}"
+    return yaml.safe_dump({key: value}, allow_unicode=True, width=float("inf")).rstrip("\n")
+
+
+def patch_frontmatter(content: str, updates: dict) -> str:
+    """Rewrite only the changed top-level keys of a note's frontmatter.
+
+    Lines for other keys, their order and formatting, and the body are left
+    byte-for-byte as they were. A key's indented continuation lines (block
+    lists, nested maps) are replaced along with it; keys not yet present are
+    appended to the end of the header.
+
+    Args:
+        content: Full note text
+        updates: Top-level keys to set
 
-    # Update frontmatter
-    frontmatter.update(updates)
+    Returns:
+        The patched note text
+    """
+    match = FRONTMATTER_RE.match(content)
+    if not match:
+        header = "".join(_frontmatter_line(k, v) + "\n" for k, v in updates.items())
+        return f"---\n{header}---\n{content}"
+
+    remaining = dict(updates)
+    lines = []
+    replacing = False
+    for line in (match.group(1) or "").splitlines(keepends=True):
+        key_match = TOP_LEVEL_KEY_RE.match(line)
+        if key_match:
+            replacing = key_match.group(1) in remaining
+            if replacing:
+                key = key_match.group(1)
+                lines.append(_frontmatter_line(key, remaining.pop(key)) + "\n")
+                continue
+        elif replacing and line[:1] in {" ", "\t", "-"}:
+            continue
+        else:
+            replacing = False
+        lines.append(line)
+    lines.extend(_frontmatter_line(k, v) + "\n" for k, v in remaining.items())
+
+    return f"---\n{''.join(lines)}---\n{content[match.end():]}"
 
-    # Rebuild file
-    new_content = f"---\n{yaml.dump(frontmatter, default_flow_style=False)}---\n{body}"
-    file_path.write_text(new_content, encoding="utf-8")
+
+def update_frontmatter(file_path: Path, updates: dict) -> None:
+    """Update frontmatter in a markdown file, touching only the changed lines."""
+    content = vault_io.read_text(file_path)
+    vault_io.write_text(file_path, patch_frontmatter(content, updates))
 
 
 def count_today_logs(vault_path: Path) -> int:
     """Count how many drills were practiced today."""
-    logs_path = vault_path / "02_Practice_Logs"
-    if not logs_path.exists():
-        return 0
-    today_str = datetime.now().strftime("%Y-%m-%d")
-    return len(list(logs_path.glob(f"{today_str}__*.md")))
+    from .activity import ActivityIndex
 
+    return ActivityIndex.load(vault_path).count(datetime.now().date())
 
-def get_next_drill(vault_path: Path) -> Optional[Path]:
-    """Get the next drill to practice, respecting daily limits."""
-    from .config import Config
-    config = Config(vault_path).config
-    max_per_day = config.get("defaults", {}).get("max_drills_per_day", 5)
-    
-    if count_today_logs(vault_path) >= max_per_day:
-        return None
 
-    drills_path = vault_path / "01_Drills"
-    if not drills_path.exists():
-        return None
+def select_next(drills, today) -> Optional[object]:
+    """Pick the next due drill (no I/O).
 
-    today = datetime.now().date()
-    candidates = []
+    Args:
+        drills: Iterable of (key, frontmatter) pairs; keys break priority ties
+        today: Current date
 
-    for drill_file in drills_path.glob("DRILL__*.md"):
-        content = drill_file.read_text(encoding="utf-8")
-        frontmatter, _ = parse_frontmatter(content)
+    Returns:
+        Key of the drill to practice, or None if nothing is due
+    """
+    candidates = []
 
+    for key, frontmatter in drills:
         status = frontmatter.get("status", "untried")
         next_review_str = frontmatter.get("next_review", "")
 
@@ -82,18 +127,42 @@ def get_next_drill(vault_path: Path) -> Optional[Path]:
         if is_due:
             # Priority: untried > failed > passed
             priority = {"untried": 0, "failed": 1, "passed": 2}.get(status, 3)
-            candidates.append((priority, drill_file))
+            candidates.append((priority, key))
 
     if not candidates:
         return None
 
-    # Sort by priority, then by filename
-    candidates.sort(key=lambda x: (x[0], x[1].name))
-    return candidates[0][1]
+    # Sort by priority, then by key
+    return min(candidates)[1]
+
+
+def get_next_drill(vault_path: Path) -> Optional[Path]:
+    """Get the next drill to practice, respecting daily limits."""
+    from .config import Config
+    config = Config(vault_path).config
+    max_per_day = config.get("defaults", {}).get("max_drills_per_day", 5)
+    
+    if count_today_logs(vault_path) >= max_per_day:
+        return None
+
+    drills_path = vault_path / "01_Drills"
+    if not drills_path.exists():
+        return None
+
+    drills = (
+        (drill_file, parse_frontmatter(drill_file.read_text(encoding="utf-8"))[0])
+        for drill_file in drills_path.glob("DRILL__*.md")
+    )
+    return select_next(drills, datetime.now().date())
 
 
 def create_practice_log(
-    vault_path: Path, drill_path: Path, result: str, notes: str = "", rating: int = 0
+    vault_path: Path,
+    drill_path: Path,
+    result: str,
+    notes: str = "",
+    rating: int = 0,
+    effort: int = 0,
 ) -> Path:
     """Create a practice log entry.
 
@@ -102,17 +171,20 @@ def create_practice_log(
         drill_path: Path to drill file
         result: Result (passed/failed/bullshit/outdated)
         notes: Optional notes
+        rating: 1-5 drill quality rating
+        effort: 1-5 effort after a pass (only logged if given)
 
     Returns:
         Path to created log file
     """
+    from .activity import ActivityIndex
     from .ingestor import slugify
 
     logs_path = vault_path / "02_Practice_Logs"
     logs_path.mkdir(parents=True, exist_ok=True)
 
     # Get drill info
-    content = drill_path.read_text(encoding="utf-8")
+    content = vault_io.read_text(drill_path)
     frontmatter, _ = parse_frontmatter(content)
     drill_id = frontmatter.get("id", "unknown")
     drill_title = drill_path.stem.replace("DRILL__", "")
@@ -120,13 +192,14 @@ def create_practice_log(
     # Create log
     timestamp = datetime.now().isoformat()
     date_str = datetime.now().strftime("%Y-%m-%d")
+    effort_line = f"effort: {effort}\n" if effort else ""
 
     log_content = f"""---
 drill_id: {drill_id}
 drill_title: {drill_title}
 result: {result}
 rating: {rating}
-timestamp: {timestamp}
+{effort_line}timestamp: {timestamp}
 ---
 
 # Practice Log: {drill_title}
@@ -142,12 +215,244 @@ timestamp: {timestamp}
 """
 
     log_file = logs_path / f"{date_str}__{slugify(drill_title)}.md"
-    log_file.write_text(log_content, encoding="utf-8")
+    activity = ActivityIndex.load(vault_path)
+    is_new = not vault_io.exists(log_file)
+    vault_io.write_text(log_file, log_content)
+    if is_new:
+        activity.add(datetime.now().date())
+        activity.save()
 
     return log_file
 
 
-def mark_drill(vault_path: Path, drill_path: Path, result: str, notes: str = "", rating: int = 0) -> None:
+# Daily logs are YYYY-MM-DD__slug.md; `dojo compact-logs` packs old ones into
+# one YYYY-MM__practice-logs.md per month, each entry headed by a marker line
+# carrying the original file name and frontmatter
+DAILY_LOG_RE = re.compile(r"^(\d{4}-\d{2})-\d{2}__")
+PACKED_LOG_SUFFIX = "__practice-logs.md"
+PACKED_LOG_RE = re.compile(r"^\d{4}-\d{2}__practice-logs\.md$")
+PACKED_ENTRY_RE = re.compile(r"^<!-- dojo-log (\S+) (\{.*\}) -->$", re.MULTILINE)
+
+
+def _practice_log_record(name: str, fm: dict, body: str) -> dict:
+    notes_match = re.search(r"## Notes\n(.*?)(?=\n---|\Z)", body, re.DOTALL)
+    notes = notes_match.group(1).strip() if notes_match else ""
+    if notes == "No notes provided.":
+        notes = ""
+
+    date_match = re.match(r"(\d{4}-\d{2}-\d{2})", name)
+    log_date = date_match.group(1) if date_match else str(fm.get("timestamp", ""))[:10]
+
+    return {
+        "name": name,
+        "date": log_date,
+        "drill_id": str(fm.get("drill_id", "")),
+        "drill_title": str(fm.get("drill_title", "")),
+        "result": str(fm.get("result", "")),
+        "rating": fm.get("rating", 0) or 0,
+        "timestamp": str(fm.get("timestamp", "")),
+        "notes": notes,
+    }
+
+
+def read_practice_log(log_file: Path) -> dict:
+    """Parse a practice log into a flat record.
+
+    Returns:
+        Dict with name, date, drill_id, drill_title, result, rating,
+        timestamp and notes
+    """
+    fm, body = parse_frontmatter(log_file.read_text(encoding="utf-8"))
+    return _practice_log_record(log_file.name, fm, body)
+
+
+def _packed_entries(content: str) -> list[tuple[str, dict, str]]:
+    """(name, frontmatter, body) for each log in a packed monthly file."""
+    import json
+
+    matches = list(PACKED_ENTRY_RE.finditer(content))
+    entries = []
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        name = match.group(1)
+        # Drop the "## <name>" heading _render_packed_entry puts under the marker
+        heading = f"\n## {Path(name).stem}\n"
+        body = content[match.end():end]
+        if body.startswith(heading):
+            body = body[len(heading):]
+        entries.append((name, json.loads(match.group(2)), body))
+    return entries
+
+
+def read_packed_logs(packed_file: Path) -> list[dict]:
+    """Parse every log in a packed monthly file (see read_practice_log)."""
+    content = packed_file.read_text(encoding="utf-8")
+    return [_practice_log_record(name, fm, body) for name, fm, body in _packed_entries(content)]
+
+
+def practice_log_names(vault_path: Path) -> list[str]:
+    """File names of all practice logs, whether still daily files or packed (unsorted)."""
+    return list(practice_log_stamps(vault_path))
+
+
+def practice_log_stamps(vault_path: Path) -> dict:
+    """Practice log names mapped to a change stamp (no log reads).
+
+    Daily files get ``[mtime_ns, size]``, so a log rewritten in place (the
+    same drill practised twice in a day) gets a new stamp. Packed entries
+    are never rewritten and map to None.
+    """
+    logs_path = vault_path / "02_Practice_Logs"
+    stamps = {}
+    for log_file in logs_path.glob("*.md") if logs_path.exists() else []:
+        if PACKED_LOG_RE.match(log_file.name):
+            content = log_file.read_text(encoding="utf-8")
+            for match in PACKED_ENTRY_RE.finditer(content):
+                stamps[match.group(1)] = None
+        else:
+            try:
+                info = log_file.stat()
+            except OSError:
+                continue
+            stamps[log_file.name] = [info.st_mtime_ns, info.st_size]
+    return stamps
+
+
+def read_practice_logs(vault_path: Path, names) -> list[dict]:
+    """Parse the named practice logs from either layout, skipping unreadable ones."""
+    logs_path = vault_path / "02_Practice_Logs"
+    logs, packed_months = [], set()
+    wanted = set(names)
+    for name in wanted:
+        if (logs_path / name).exists():
+            try:
+                logs.append(read_practice_log(logs_path / name))
+            except Exception:
+                continue
+        elif DAILY_LOG_RE.match(name):
+            packed_months.add(DAILY_LOG_RE.match(name).group(1))
+    for month in sorted(packed_months):
+        try:
+            logs.extend(
+                log for log in read_packed_logs(logs_path / f"{month}{PACKED_LOG_SUFFIX}")
+                if log["name"] in wanted
+            )
+        except (OSError, ValueError):
+            continue
+    return logs
+
+
+def iter_practice_logs(vault_path: Path):
+    """Yield parsed practice logs (see read_practice_log) in filename order.
+
+    Entries of packed monthly files are included.
+    """
+    logs_path = vault_path / "02_Practice_Logs"
+    if not logs_path.exists():
+        return
+    logs = []
+    for log_file in logs_path.glob("*.md"):
+        try:
+            if PACKED_LOG_RE.match(log_file.name):
+                logs.extend(read_packed_logs(log_file))
+            else:
+                logs.append(read_practice_log(log_file))
+        except (OSError, ValueError, yaml.YAMLError):
+            continue
+    yield from sorted(logs, key=lambda log: log["name"])
+
+
+def _render_packed_entry(name: str, fm: dict, body: str) -> str:
+    import json
+
+    # The note's own "# Practice Log: ..." title is replaced by the entry heading
+    body = re.sub(r"^\s*# .*\n", "", body, count=1).strip()
+    meta = json.dumps(fm, default=str, ensure_ascii=False)
+    return f"<!-- dojo-log {name} {meta} -->\n## {Path(name).stem}\n\n{body}\n\n"
+
+
+def compact_practice_logs(vault_path: Path, older_than_days: int = 90) -> dict:
+    """Pack daily practice logs older than ``older_than_days`` into monthly files.
+
+    Logs are merged into 02_Practice_Logs/YYYY-MM__practice-logs.md (appending
+    to one packed earlier) and the daily files removed once it is written.
+    Every reader that goes through practice_log_names / iter_practice_logs
+    sees the same logs before and after, so streaks and stats don't change.
+
+    Args:
+        vault_path: Vault path
+        older_than_days: Keep logs from this many recent days as files (min 1)
+
+    Returns:
+        Dict with months (packed files written) and logs (daily files packed)
+    """
+    from datetime import timedelta
+
+    from .activity import ActivityIndex
+    from .topic_counters import TopicCounters
+
+    logs_path = vault_path / "02_Practice_Logs"
+    if not logs_path.exists():
+        return {"months": 0, "logs": 0}
+    cutoff = (datetime.now().date() - timedelta(days=max(1, older_than_days))).isoformat()
+
+    months: dict[str, list[Path]] = {}
+    for log_file in sorted(logs_path.glob("*.md")):
+        match = DAILY_LOG_RE.match(log_file.name)
+        if match and log_file.name[:10] < cutoff:
+            months.setdefault(match.group(1), []).append(log_file)
+    if not months:
+        return {"months": 0, "logs": 0}
+
+    # Loaded up front so their folder stamps are refreshed rather than forcing a rebuild
+    activity = ActivityIndex.load(vault_path)
+    counters = TopicCounters.load(vault_path)
+
+    packed_count = 0
+    for month, log_files in months.items():
+        packed_file = logs_path / f"{month}{PACKED_LOG_SUFFIX}"
+        entries = {}
+        if packed_file.exists():
+            for name, fm, body in _packed_entries(packed_file.read_text(encoding="utf-8")):
+                entries[name] = (fm, body)
+        packed = []
+        for log_file in log_files:
+            try:
+                entries[log_file.name] = parse_frontmatter(log_file.read_text(encoding="utf-8"))
+            except (OSError, yaml.YAMLError) as e:
+                print(f"[WARN] Skipping {log_file.name}: {e}")
+                continue
+            packed.append(log_file)
+
+        content = f"""---
+type: practice-log-archive
+month: "{month}"
+logs: {len(entries)}
+---
+
+# Practice Logs: {month}
+
+""" + "".join(_render_packed_entry(name, *entries[name]) for name in sorted(entries))
+        # The packed file is durable before any daily file goes away
+        vault_io.write_text(packed_file, content)
+        for log_file in packed:
+            log_file.unlink(missing_ok=True)
+        vault_io.fsync_dir(logs_path)
+        packed_count += len(packed)
+
+    activity.save()
+    counters.save()
+    return {"months": len(months), "logs": packed_count}
+
+
+def mark_drill(
+    vault_path: Path,
+    drill_path: Path,
+    result: str,
+    notes: str = "",
+    rating: int = 0,
+    effort: int = 0,
+) -> None:
     """Mark a drill with a result and update its status.
 
     Args:
@@ -155,52 +460,41 @@ def mark_drill(vault_path: Path, drill_path: Path, result: str, notes: str = "",
         drill_path: Path to drill file
         result: Result (passed/failed/bullshit/outdated)
         notes: Optional notes
+        rating: 1-5 drill quality rating
+        effort: 1-5 effort after a pass; sets the review grade (see scheduler.grade_for)
     """
+    from .topic_counters import TopicCounters
+
+    # Loaded before writing, while its folder stamp still matches
+    counters = TopicCounters.load(vault_path)
+
     # Create practice log
-    create_practice_log(vault_path, drill_path, result, notes, rating)
+    create_practice_log(vault_path, drill_path, result, notes, rating, effort)
 
     # Update drill frontmatter
-    content = drill_path.read_text(encoding="utf-8")
+    content = vault_io.read_text(drill_path)
     frontmatter, _ = parse_frontmatter(content)
 
-    review_count = frontmatter.get("review_count", 0)
+    if result in {"passed", "failed"}:
+        from .scheduler import compute_review_update, get_scheduler
 
-    if result == "passed":
-        # Spaced repetition intervals
-        intervals = [7, 21, 60]
-        if review_count < len(intervals):
-            next_review = (datetime.now() + timedelta(days=intervals[review_count])).date()
-        else:
-            next_review = (datetime.now() + timedelta(days=90)).date()
-
-        updates = {
-            "status": "passed",
-            "review_count": review_count + 1,
-            "next_review": next_review.isoformat(),
-        }
-
-    elif result == "failed":
-        # Review tomorrow
-        next_review = (datetime.now() + timedelta(days=1)).date()
-        updates = {
-            "status": "failed",
-            "next_review": next_review.isoformat(),
-        }
+        updates = compute_review_update(get_scheduler(vault_path), frontmatter, result, effort)
+        vault_io.write_text(drill_path, patch_frontmatter(content, updates))
 
     elif result in {"bullshit", "outdated"}:
         # Move to archive
         updates = {"status": result}
         archive_path = vault_path / "90_Archive"
         archive_path.mkdir(parents=True, exist_ok=True)
-        new_path = archive_path / drill_path.name
-        update_frontmatter(drill_path, updates)
-        drill_path.rename(new_path)
-        return
+        # Patched note goes straight to the archive: one write, then the old file is dropped
+        vault_io.write_text(archive_path / drill_path.name, patch_frontmatter(content, updates))
+        vault_io.remove(drill_path)
 
     else:
         raise ValueError(f"Invalid result: {result}")
 
-    update_frontmatter(drill_path, updates)
+    counters.record_review(drill_path, frontmatter, updates, rating)
+    counters.save()
 
 
 def promote_to_mastery(vault_path: Path, drill_path: Path, reflection: str = "") -> Path:
@@ -215,12 +509,14 @@ def promote_to_mastery(vault_path: Path, drill_path: Path, reflection: str = "")
         Path to created mastery note
     """
     from .ingestor import slugify
+    from .topic_counters import TopicCounters, drill_topics
 
+    counters = TopicCounters.load(vault_path)
     mastery_path = vault_path / "10_Mastery"
     mastery_path.mkdir(parents=True, exist_ok=True)
 
     # Read drill
-    content = drill_path.read_text(encoding="utf-8")
+    content = vault_io.read_text(drill_path)
     frontmatter, body = parse_frontmatter(content)
 
     drill_title = drill_path.stem.replace("DRILL__", "").replace("-", " ").title()
@@ -274,7 +570,11 @@ verified_at: {datetime.now().isoformat()}
 """
 
     mastery_file = mastery_path / f"MASTERY__{slugify(drill_title)}.md"
-    mastery_file.write_text(mastery_content, encoding="utf-8")
+    # Re-promoting a drill overwrites its note, which doesn't add a mastery
+    if not vault_io.exists(mastery_file):
+        counters.add_mastery(drill_topics(frontmatter))
+    vault_io.write_text(mastery_file, mastery_content)
+    counters.save()
 
     # Update topic index after promotion
     update_topic_indices(vault_path)
@@ -358,88 +658,14 @@ pass_rate: {pass_rate:.1f}%
 ---
 *Index updated: {datetime.now().isoformat()}*
 """
-        topic_file.write_text(content, encoding="utf-8")
+        vault_io.write_text(topic_file, content)
 
 
 def get_topics_stats(vault_path: Path) -> list[dict]:
-    """Get statistics for all topics."""
-    # We can reuse the logic from update_topic_indices but just return data
-    mastery_path = vault_path / "10_Mastery"
-    drills_path = vault_path / "01_Drills"
-    
-    topic_data = {}
-
-    def get_topics(fm):
-        t = fm.get("topics", [])
-        if isinstance(t, str):
-            return [t.strip()]
-        return t
-
-    if drills_path.exists():
-        for f in drills_path.glob("DRILL__*.md"):
-            fm, _ = parse_frontmatter(f.read_text(encoding="utf-8"))
-            for t in get_topics(fm):
-                if t not in topic_data:
-                    topic_data[t] = {"drills": 0, "passed": 0, "mastery": 0, "last_practiced": None}
-                topic_data[t]["drills"] += 1
-                if fm.get("status") == "passed":
-                    topic_data[t]["passed"] += 1
+    """Get statistics for all topics (from the incremental topic counters)."""
+    from .topic_counters import TopicCounters
 
-    if mastery_path.exists():
-        for f in mastery_path.glob("MASTERY__*.md"):
-            fm, _ = parse_frontmatter(f.read_text(encoding="utf-8"))
-            for t in get_topics(fm):
-                if t in topic_data:
-                    topic_data[t]["mastery"] += 1
-                else:
-                    topic_data[t] = {"drills": 0, "passed": 0, "mastery": 1, "last_practiced": None}
-
-    # Collect ratings and last practiced per drill ID
-    drill_to_metrics = {}
-    logs_path = vault_path / "02_Practice_Logs"
-    if logs_path.exists():
-        for log_file in logs_path.glob("*.md"):
-            fm, _ = parse_frontmatter(log_file.read_text(encoding="utf-8"))
-            d_id = fm.get("drill_id")
-            if d_id:
-                if d_id not in drill_to_metrics:
-                    drill_to_metrics[d_id] = {"ratings": [], "last": None}
-                
-                rating = fm.get("rating", 0)
-                if rating > 0:
-                    drill_to_metrics[d_id]["ratings"].append(rating)
-                
-                match = re.match(r"(\d{4}-\d{2}-\d{2})", log_file.name)
-                if match:
-                    log_date = datetime.fromisoformat(match.group(1)).date()
-                    if not drill_to_metrics[d_id]["last"] or log_date > drill_to_metrics[d_id]["last"]:
-                        drill_to_metrics[d_id]["last"] = log_date
-
-    # Now we need to map drills to their topics to aggregate ratings
-    for f in drills_path.glob("DRILL__*.md"):
-        fm, _ = parse_frontmatter(f.read_text(encoding="utf-8"))
-        d_id = fm.get("id")
-        if d_id in drill_to_metrics:
-            for t in get_topics(fm):
-                if t in topic_data:
-                    if "all_ratings" not in topic_data[t]:
-                        topic_data[t]["all_ratings"] = []
-                    topic_data[t]["all_ratings"].extend(drill_to_metrics[d_id]["ratings"])
-
-    results = []
-    for topic, stats in topic_data.items():
-        ratings = stats.get("all_ratings", [])
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0
-        
-        results.append({
-            "name": topic,
-            "mastery": stats["mastery"],
-            "passed": stats["passed"],
-            "total": stats["drills"],
-            "avg_rating": avg_rating
-        })
-    
-    return sorted(results, key=lambda x: x["mastery"], reverse=True)
+    return TopicCounters.load(vault_path).stats()
 
 
 def get_vault_stats(vault_path: Path) -> dict:
@@ -476,54 +702,38 @@ def get_vault_stats(vault_path: Path) -> dict:
 
 def get_streak(vault_path: Path) -> int:
     """Calculate current practice streak in days."""
-    logs_path = vault_path / "02_Practice_Logs"
-    if not logs_path.exists():
-        return 0
+    from .activity import ActivityIndex
 
-    # Get all unique dates from log filenames (YYYY-MM-DD__slug.md)
-    log_dates = set()
-    for log_file in logs_path.glob("*.md"):
-        # Match YYYY-MM-DD at the start
-        match = re.match(r"(\d{4}-\d{2}-\d{2})", log_file.name)
-        if match:
-            log_dates.add(datetime.fromisoformat(match.group(1)).date())
+    return ActivityIndex.load(vault_path).streak()
 
-    if not log_dates:
-        return 0
 
-    sorted_dates = sorted(list(log_dates), reverse=True)
-    today = datetime.now().date()
-    yesterday = today - timedelta(days=1)
-
-    # If haven't practiced today or yesterday, streak is 0
-    if sorted_dates[0] < yesterday:
-        return 0
-
-    streak = 0
-    current_date = sorted_dates[0]
-
-    # Handle case where user practiced today
-    if current_date == today:
-        streak = 1
-        expected_date = today - timedelta(days=1)
-        for date in sorted_dates[1:]:
-            if date == expected_date:
-                streak += 1
-                expected_date -= timedelta(days=1)
-            else:
-                break
-    # Handle case where user practiced yesterday but not today yet
-    elif current_date == yesterday:
-        streak = 1
-        expected_date = yesterday - timedelta(days=1)
-        for date in sorted_dates[1:]:
-            if date == expected_date:
-                streak += 1
-                expected_date -= timedelta(days=1)
-            else:
-                break
+def upcoming_entry(drill_file: Path, frontmatter: dict, today) -> dict:
+    """Queue entry for one drill, as listed by get_upcoming_drills."""
+    status = frontmatter.get("status", "untried")
+    next_review_str = frontmatter.get("next_review", "")
+
+    if next_review_str:
+        next_review = datetime.fromisoformat(str(next_review_str)).date()
+    else:
+        next_review = today
+
+    # Priority score (lower is higher priority)
+    priority = {"untried": 0, "failed": 1, "passed": 2}.get(status, 3)
+
+    return {
+        "path": drill_file,
+        "title": drill_file.stem.replace("DRILL__", "").replace("-", " ").title(),
+        "status": status,
+        "next_review": next_review,
+        "priority": priority,
+        "topics": frontmatter.get("topics", []),
+        "is_due": next_review <= today
+    }
+
 
-    return streak
+def upcoming_sort_key(entry: dict) -> tuple:
+    """Due first, then by priority, then by date, then by title."""
+    return (not entry["is_due"], entry["priority"], entry["next_review"], entry["title"])
 
 
 def get_upcoming_drills(vault_path: Path, count: int = 3) -> list[dict]:
@@ -538,38 +748,28 @@ def get_upcoming_drills(vault_path: Path, count: int = 3) -> list[dict]:
     for drill_file in drills_path.glob("DRILL__*.md"):
         content = drill_file.read_text(encoding="utf-8")
         frontmatter, _ = parse_frontmatter(content)
+        candidates.append(upcoming_entry(drill_file, frontmatter, today))
 
-        status = frontmatter.get("status", "untried")
-        next_review_str = frontmatter.get("next_review", "")
-
-        if next_review_str:
-            next_review = datetime.fromisoformat(str(next_review_str)).date()
-        else:
-            next_review = today
-
-        # Priority score (lower is higher priority)
-        priority = {"untried": 0, "failed": 1, "passed": 2}.get(status, 3)
-        
-        candidates.append({
-            "path": drill_file,
-            "title": drill_file.stem.replace("DRILL__", "").replace("-", " ").title(),
-            "status": status,
-            "next_review": next_review,
-            "priority": priority,
-            "topics": frontmatter.get("topics", []),
-            "is_due": next_review <= today
-        })
-
-    # Sort: due first, then by priority, then by date, then by title
-    candidates.sort(key=lambda x: (not x["is_due"], x["priority"], x["next_review"], x["title"]))
+    candidates.sort(key=upcoming_sort_key)
     
     return candidates[:count]
 
 
-def update_obsidian_dashboard(vault_path: Path) -> Path:
-    """Generate or update the _Dashboard.md note for Obsidian."""
-    dashboard_path = vault_path / "_Dashboard.md"
-    
+DASHBOARD_STATE_FILE = "dashboard_state.json"
+# Everything on the dashboard is read from these folders (plus today's date)
+DASHBOARD_INPUTS = ("00_Inbox", "01_Drills", "02_Practice_Logs", "10_Mastery")
+
+
+def _dashboard_inputs(vault_path: Path) -> str:
+    """Fingerprint of the dashboard's inputs, including notes edited in place."""
+    from .cache import fingerprint, folder_stamp
+
+    stamps = [folder_stamp(vault_path / folder) for folder in DASHBOARD_INPUTS]
+    return fingerprint(datetime.now().date().isoformat(), stamps)
+
+
+def render_dashboard(vault_path: Path) -> str:
+    """Dashboard note content, without the 'updated' footer."""
     stats = get_vault_stats(vault_path)
     streak = get_streak(vault_path)
     
@@ -581,7 +781,7 @@ def update_obsidian_dashboard(vault_path: Path) -> Path:
     elif mastery_count >= 6:
         level = "Apprentice ⚔️"
 
-    content = f"""# 🥋 Vibe-Dojo Dashboard
+    return f"""# 🥋 Vibe-Dojo Dashboard
 
 ## 📊 Quick Stats
 - **Rank:** {level}
@@ -618,12 +818,45 @@ SORT pass_rate DESC
 ```dataview
 LIST
 FROM "02_Practice_Logs"
+WHERE !endswith(file.name, "__practice-logs")
 SORT file.ctime DESC
 LIMIT 10
 ```
+"""
+
+
+def update_obsidian_dashboard(vault_path: Path, force: bool = False) -> Path:
+    """Generate or update the _Dashboard.md note for Obsidian.
 
+    Nothing is recomputed unless a vault folder the dashboard depends on
+    changed (or the day rolled over), and the note is only rewritten when
+    its rendered content differs from the last write, so repeated calls
+    don't touch the file and sync clients stay quiet.
+
+    Args:
+        vault_path: Vault path
+        force: Re-render and rewrite regardless
+
+    Returns:
+        Path to the dashboard note
+    """
+    import hashlib
+
+    from .cache import load_json, save_json
+
+    dashboard_path = vault_path / "_Dashboard.md"
+    state = load_json(vault_path, DASHBOARD_STATE_FILE, {}) or {}
+    inputs = _dashboard_inputs(vault_path)
+    if not force and state.get("inputs") == inputs and dashboard_path.exists():
+        return dashboard_path
+
+    content = render_dashboard(vault_path)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    if force or state.get("hash") != digest or not dashboard_path.exists():
+        footer = f"""
 ---
 *Dashboard updated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}*
 """
-    dashboard_path.write_text(content, encoding="utf-8")
+        vault_io.write_text(dashboard_path, content + footer)
+    save_json(vault_path, DASHBOARD_STATE_FILE, {"inputs": inputs, "hash": digest})
     return dashboard_path
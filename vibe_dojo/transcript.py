@@ -0,0 +1,135 @@
+"""Transcript compaction: merge caption fragments into timestamped paragraphs."""
+
+import html
+import re
+from typing import Optional
+
+TIMESTAMP_LINE_RE = re.compile(r"^\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s?(.*)$")
+
+# Bracketed sound cues and music symbols emitted by auto-captions
+NOISE_RE = re.compile(
+    r"\[(?:music|applause|laughter|laughs|inaudible|silence|noise|musik|applaus|lachen|__)\]|♪+|^>>\s*",
+    re.IGNORECASE,
+)
+# Hesitation fillers (English + German, since transcripts are fetched in de/en).
+# A bare "um" is left alone: in German it is a word ("um 10 Uhr", "um zu")
+FILLER_RE = re.compile(r"\b(?:u+mm+|u+h+|e+rm+|uhm+|ähm*|öhm*)\b,?\s*", re.IGNORECASE)
+WHITESPACE_RE = re.compile(r"\s+")
+
+DEFAULT_WINDOW_SECONDS = 45
+# Longest caption overlap (in words) removed between rolling fragments
+MAX_OVERLAP_WORDS = 12
+
+
+def is_timestamped(content: str) -> bool:
+    """True if most non-empty lines look like ``[MM:SS] text`` caption lines."""
+    lines = [line for line in content.splitlines()[:200] if line.strip()]
+    if not lines:
+        return False
+    matches = sum(1 for line in lines if TIMESTAMP_LINE_RE.match(line))
+    return matches / len(lines) >= 0.5
+
+
+def clean_fragment(text: str) -> str:
+    """Strip caption noise, fillers and entities from one caption fragment."""
+    text = html.unescape(text)
+    text = NOISE_RE.sub(" ", text)
+    text = FILLER_RE.sub("", text)
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _drop_overlap(paragraph_words: list[str], words: list[str]) -> list[str]:
+    """Remove words that repeat the tail of the paragraph (rolling captions)."""
+    limit = min(MAX_OVERLAP_WORDS, len(paragraph_words), len(words))
+    for k in range(limit, 0, -1):
+        if [w.lower() for w in paragraph_words[-k:]] == [w.lower() for w in words[:k]]:
+            return words[k:]
+    return words
+
+
+def compact_transcript(
+    content: str,
+    chapters: Optional[list[dict]] = None,
+    window_seconds: int = DEFAULT_WINDOW_SECONDS,
+) -> tuple[str, dict]:
+    """Merge caption fragments into paragraphs anchored to coarse timestamps.
+
+    A new paragraph starts every ``window_seconds`` and at every chapter
+    boundary. Content that isn't a timestamped transcript is returned as is.
+
+    Args:
+        content: Raw transcript text (one ``[MM:SS] text`` line per fragment)
+        chapters: Optional list of ``{"timestamp", "title"}`` dicts
+        window_seconds: Target paragraph length in seconds
+
+    Returns:
+        Tuple of (compact_text, stats) where stats holds fragment/paragraph
+        counts and estimated token counts before and after
+    """
+    from .distiller import estimate_tokens
+    from .ingestor import format_timestamp, parse_timestamp
+
+    stats = {
+        "fragments": 0,
+        "paragraphs": 0,
+        "raw_tokens": estimate_tokens(content),
+        "compact_tokens": estimate_tokens(content),
+    }
+    if not is_timestamped(content):
+        return content, stats
+
+    boundaries = []
+    for chapter in chapters or []:
+        try:
+            boundaries.append(parse_timestamp(chapter["timestamp"]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    boundaries.sort()
+
+    # A None start is the untimed text before the first timestamp
+    paragraphs: list[tuple[Optional[int], list[str]]] = []
+    current_start: Optional[int] = None
+    current_words: list[str] = []
+    next_boundary = 0
+
+    def flush() -> None:
+        if current_words:
+            paragraphs.append((current_start, current_words))
+
+    for line in content.splitlines():
+        match = TIMESTAMP_LINE_RE.match(line)
+        if not match:
+            # Stray continuation line: attach to the open (or leading) paragraph
+            words = clean_fragment(line).split()
+            current_words.extend(words)
+            continue
+
+        stats["fragments"] += 1
+        seconds = parse_timestamp(match.group(1))
+        words = clean_fragment(match.group(2)).split()
+
+        crossed_chapter = False
+        while next_boundary < len(boundaries) and boundaries[next_boundary] <= seconds:
+            crossed_chapter = current_start is not None
+            next_boundary += 1
+
+        if current_start is None or crossed_chapter or seconds - current_start >= window_seconds:
+            flush()
+            current_start, current_words = seconds, []
+            # Overlap with the previous paragraph is still a repeat
+            if paragraphs:
+                words = _drop_overlap(paragraphs[-1][1], words)
+        else:
+            words = _drop_overlap(current_words, words)
+
+        current_words.extend(words)
+
+    flush()
+
+    compact = "\n\n".join(
+        f"[{format_timestamp(start)}] {' '.join(words)}" if start is not None else " ".join(words)
+        for start, words in paragraphs
+    )
+    stats["paragraphs"] = len(paragraphs)
+    stats["compact_tokens"] = estimate_tokens(compact)
+    return compact, stats
@@ -0,0 +1,242 @@
+"""Crash-safe vault writes: atomic replace, batched fsync and a write-behind queue."""
+
+import contextvars
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+DEFAULT_MAX_PENDING = 64
+
+_current_queue: contextvars.ContextVar[Optional["WriteBehindQueue"]] = contextvars.ContextVar(
+    "vibe_dojo_write_queue", default=None
+)
+
+
+def fsync_dir(path: Path) -> None:
+    """Persist a directory entry change (rename/create). No-op where unsupported."""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_temp(path: Path, text: str, encoding: str, fsync: bool) -> Path:
+    """Write ``text`` to a temp file next to ``path`` and return the temp path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(text)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return Path(tmp_name)
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8", durable: bool = True) -> Path:
+    """Write a file so readers see either the old or the new content, never half.
+
+    The text goes to a temp file in the same folder which is then renamed
+    over ``path``. With ``durable`` the file and folder are fsynced, so the
+    write survives a crash once this returns.
+    """
+    path = Path(path)
+    tmp_path = _write_temp(path, text, encoding, fsync=durable)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if durable:
+        fsync_dir(path.parent)
+    return path
+
+
+class WriteBehindQueue:
+    """Collects note writes and commits them together behind one durability barrier.
+
+    Queued files are written to fsynced temp files, renamed into place, and
+    each touched folder is fsynced once. Deletes are queued too and only
+    happen after the writes, so a note moved inside the block can't be lost
+    to a crash before the commit.
+    """
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING, durable: bool = True):
+        self.max_pending = max_pending
+        self.durable = durable
+        self.pending: dict[Path, tuple[str, str]] = {}
+        self.removed: set[Path] = set()
+        self.on_commit: list[Callable[[], None]] = []
+        self.committed = 0
+        self._lock = threading.Lock()
+
+    def write_text(self, path: Path, text: str, encoding: str = "utf-8") -> Path:
+        path = Path(path)
+        with self._lock:
+            self.pending[path] = (text, encoding)
+            self.removed.discard(path)
+            full = len(self.pending) >= self.max_pending
+        if full:
+            self.flush()
+        return path
+
+    def remove(self, path: Path) -> None:
+        """Delete ``path`` once the writes queued so far are committed."""
+        path = Path(path)
+        with self._lock:
+            self.pending.pop(path, None)
+            self.removed.add(path)
+
+    def __contains__(self, path) -> bool:
+        return Path(path) in self.pending
+
+    def flush(self) -> int:
+        """Commit everything queued; returns the number of files written."""
+        with self._lock:
+            pending, self.pending = self.pending, {}
+            removed, self.removed = self.removed, set()
+        if not pending and not removed:
+            return 0
+
+        staged = []
+        try:
+            for path, (text, encoding) in pending.items():
+                staged.append((_write_temp(path, text, encoding, fsync=self.durable), path))
+            for tmp_path, path in staged:
+                os.replace(tmp_path, path)
+        except BaseException:
+            for tmp_path, _ in staged:
+                tmp_path.unlink(missing_ok=True)
+            with self._lock:
+                self.removed |= removed
+            raise
+
+        folders = {path.parent for path in pending}
+        if self.durable:
+            # The new files must be durable before anything they replace is deleted
+            for folder in folders:
+                fsync_dir(folder)
+        for path in removed:
+            path.unlink(missing_ok=True)
+        if self.durable:
+            for folder in {path.parent for path in removed}:
+                fsync_dir(folder)
+        self.committed += len(pending)
+        return len(pending)
+
+
+@contextmanager
+def write_behind(
+    max_pending: int = DEFAULT_MAX_PENDING, durable: bool = True
+) -> Iterator[WriteBehindQueue]:
+    """Route vault writes in this block through one queue, committed on exit.
+
+    Nested blocks reuse the outer queue. If the block raises, the writes
+    queued so far are still committed.
+    """
+    queue = _current_queue.get()
+    if queue is not None:
+        yield queue
+        return
+    queue = WriteBehindQueue(max_pending=max_pending, durable=durable)
+    token = _current_queue.set(queue)
+    try:
+        yield queue
+    finally:
+        _current_queue.reset(token)
+        queue.flush()
+        for callback in queue.on_commit:
+            callback()
+
+
+def on_commit(callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the current write-behind block is committed (now if there is none)."""
+    queue = _current_queue.get()
+    if queue is None:
+        callback()
+    else:
+        queue.on_commit.append(callback)
+
+
+def write_text(path: Path, text: str, encoding: str = "utf-8") -> Path:
+    """Write a vault file atomically, or queue it inside a ``write_behind`` block."""
+    queue = _current_queue.get()
+    if queue is not None:
+        return queue.write_text(path, text, encoding)
+    return atomic_write_text(path, text, encoding)
+
+
+def move(src: Path, dst: Path) -> Path:
+    """Rename a vault file, carrying along a queued write for ``src``."""
+    src, dst = Path(src), Path(dst)
+    queue = _current_queue.get()
+    if queue is not None:
+        with queue._lock:
+            queued = queue.pending.get(src)
+        if queued is not None:
+            queue.write_text(dst, *queued)
+            queue.remove(src)
+            return dst
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(src, dst)
+    if queue is None or queue.durable:
+        for folder in {src.parent, dst.parent}:
+            fsync_dir(folder)
+    return dst
+
+
+def remove(path: Path) -> None:
+    """Delete a vault file; inside a ``write_behind`` block, once the queued writes commit."""
+    path = Path(path)
+    queue = _current_queue.get()
+    if queue is not None:
+        queue.remove(path)
+        return
+    path.unlink(missing_ok=True)
+    fsync_dir(path.parent)
+
+
+def read_text(path: Path, encoding: str = "utf-8") -> str:
+    """Read a vault file, seeing a queued (not yet committed) version first."""
+    queue = _current_queue.get()
+    if queue is not None:
+        queued = queue.pending.get(Path(path))
+        if queued is not None:
+            return queued[0]
+        if Path(path) in queue.removed:
+            raise FileNotFoundError(path)
+    return Path(path).read_text(encoding=encoding)
+
+
+def queued(folder: Path) -> list[Path]:
+    """Files in ``folder`` waiting in the current write-behind queue."""
+    queue = _current_queue.get()
+    if queue is None:
+        return []
+    with queue._lock:
+        return [path for path in queue.pending if path.parent == Path(folder)]
+
+
+def exists(path: Path) -> bool:
+    """Like ``Path.exists`` but also sees writes and deletes still waiting in the queue."""
+    queue = _current_queue.get()
+    if queue is not None:
+        if path in queue:
+            return True
+        if Path(path) in queue.removed:
+            return False
+    return Path(path).exists()
@@ -1,13 +1,23 @@
 """Markdown note writer."""
 
+import os
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterable, Optional
 
 from ulid import ULID
 
+from . import vault_io
 
-def create_drill_note(
-    vault_path: Path,
+DRILL_FIELDS = (
+    "title", "pattern", "drill_goal", "drill_steps", "validation", "snippet_type",
+    "snippet_content", "topics", "prereqs", "timebox_min", "source_id",
+)
+# Archived drills keep their file name, so their slugs stay reserved too
+DRILL_DIRS = ("01_Drills", "90_Archive")
+
+
+def render_drill_note(
     title: str,
     pattern: list[str] = None,
     drill_goal: str = "",
@@ -19,29 +29,10 @@ def create_drill_note(
     prereqs: list[str] = None,
     timebox_min: int = 10,
     source_id: str = "",
-) -> Path:
-    """Create a drill note in 01_Drills/.
-
-    Args:
-        vault_path: Path to vault
-        title: Drill title
-        pattern: List of pattern bullets
-        drill_goal: Goal description
-        drill_steps: List of steps
-        validation: List of validation checks
-        snippet_type: Type of snippet (code/prompt/commands)
-        snippet_content: Snippet content
-        topics: List of topics
-        prereqs: List of prerequisites
-        timebox_min: Timebox in minutes
-        source_id: Source note ID
-
-    Returns:
-        Path to created drill note
-    """
-    from .ingestor import slugify
-
-    drill_id = str(ULID())
+    drill_id: str = "",
+) -> str:
+    """Render the Markdown text of a new drill note (see create_drill_note)."""
+    drill_id = drill_id or str(ULID())
     created_at = datetime.now().isoformat()
     next_review = datetime.now().date().isoformat()  # Available immediately
 
@@ -52,9 +43,7 @@ def create_drill_note(
     topics = topics or []
     prereqs = prereqs or []
 
-    slug = slugify(title)
-
-    frontmatter = f"""---
+    return f"""---
 id: {drill_id}
 type: drill
 status: untried
@@ -95,10 +84,154 @@ prereqs: {prereqs}
 - Try variation 2
 """
 
+
+def existing_drill_slugs(vault_path: Path) -> set[str]:
+    """Slugs already used by drill notes, active or archived."""
+    slugs = set()
+    for folder in DRILL_DIRS:
+        drill_dir = vault_path / folder
+        names = os.listdir(drill_dir) if drill_dir.exists() else []
+        names += [path.name for path in vault_io.queued(drill_dir)]
+        for name in names:
+            if name.startswith("DRILL__") and name.endswith(".md"):
+                slugs.add(name[len("DRILL__"):-len(".md")])
+    return slugs
+
+
+def unique_slug(slug: str, is_taken: Callable[[str], bool]) -> str:
+    """First free slug of ``slug``, ``slug-2``, ``slug-3``, ..."""
+    candidate, n = slug, 1
+    while is_taken(candidate):
+        n += 1
+        candidate = f"{slug}-{n}"
+    return candidate
+
+
+def create_drill_note(
+    vault_path: Path,
+    title: str,
+    pattern: list[str] = None,
+    drill_goal: str = "",
+    drill_steps: list[str] = None,
+    validation: list[str] = None,
+    snippet_type: str = "code",
+    snippet_content: str = "",
+    topics: list[str] = None,
+    prereqs: list[str] = None,
+    timebox_min: int = 10,
+    source_id: str = "",
+) -> Path:
+    """Create a drill note in 01_Drills/.
+
+    Args:
+        vault_path: Path to vault
+        title: Drill title
+        pattern: List of pattern bullets
+        drill_goal: Goal description
+        drill_steps: List of steps
+        validation: List of validation checks
+        snippet_type: Type of snippet (code/prompt/commands)
+        snippet_content: Snippet content
+        topics: List of topics
+        prereqs: List of prerequisites
+        timebox_min: Timebox in minutes
+        source_id: Source note ID
+
+    Returns:
+        Path to created drill note
+    """
+    from .ingestor import slugify
+    from .topic_counters import TopicCounters, drill_topics
+
+    counters = TopicCounters.load(vault_path)
     drill_dir = vault_path / "01_Drills"
     drill_dir.mkdir(parents=True, exist_ok=True)
-    
+
+    # Never overwrite an existing drill with the same title
+    def taken(candidate: str) -> bool:
+        return any(
+            vault_io.exists(vault_path / folder / f"DRILL__{candidate}.md") for folder in DRILL_DIRS
+        )
+
+    slug = unique_slug(slugify(title), taken)
     drill_file = drill_dir / f"DRILL__{slug}.md"
-    drill_file.write_text(frontmatter, encoding="utf-8")
+    drill_id = str(ULID())
+    vault_io.write_text(
+        drill_file,
+        render_drill_note(
+            title,
+            pattern=pattern,
+            drill_goal=drill_goal,
+            drill_steps=drill_steps,
+            validation=validation,
+            snippet_type=snippet_type,
+            snippet_content=snippet_content,
+            topics=topics,
+            prereqs=prereqs,
+            timebox_min=timebox_min,
+            source_id=source_id,
+            drill_id=drill_id,
+        ),
+    )
+    counters.set_drill(drill_id, drill_topics({"topics": topics}), "untried")
+    counters.save()
 
     return drill_file
+
+
+def create_drill_notes(
+    vault_path: Path,
+    drills: Iterable[dict],
+    source_id: str = "",
+    on_drill: Optional[Callable[[Path], None]] = None,
+) -> list[Path]:
+    """Create many drill notes in one pass.
+
+    The existing slug set is loaded once and title collisions (with the vault
+    or within the batch) are resolved in input order as ``slug-2``,
+    ``slug-3``, ... All notes are committed together behind one write-behind
+    barrier. ``drills`` may be a stream; each note is queued as it arrives,
+    and with ``on_drill`` it is committed right away so the callback only
+    ever reports notes that are on disk.
+
+    Args:
+        vault_path: Path to vault
+        drills: Drill dicts with create_drill_note's keyword names; unknown
+            keys (e.g. confidence_score) are ignored and drills without a
+            title are skipped
+        source_id: Source note ID set on every drill (if given)
+        on_drill: Optional callback invoked with each drill path once it is written
+
+    Returns:
+        Paths of the created drill notes, in input order
+    """
+    from .ingestor import slugify
+    from .topic_counters import TopicCounters, drill_topics
+
+    counters = TopicCounters.load(vault_path)
+    drill_dir = vault_path / "01_Drills"
+    drill_dir.mkdir(parents=True, exist_ok=True)
+    taken = existing_drill_slugs(vault_path)
+
+    created = []
+    with vault_io.write_behind() as queue:
+        for drill in drills:
+            if not drill.get("title"):
+                continue
+            fields = {key: drill[key] for key in DRILL_FIELDS if drill.get(key) is not None}
+            if source_id:
+                fields["source_id"] = source_id
+
+            slug = unique_slug(slugify(fields["title"]), taken.__contains__)
+            taken.add(slug)
+            drill_file = drill_dir / f"DRILL__{slug}.md"
+            drill_id = str(ULID())
+            vault_io.write_text(drill_file, render_drill_note(**fields, drill_id=drill_id))
+            counters.set_drill(drill_id, drill_topics(fields), "untried")
+            created.append(drill_file)
+            if on_drill:
+                queue.flush()
+                on_drill(drill_file)
+        counters.save()
+
+    return created